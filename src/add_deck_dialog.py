@@ -28,7 +28,7 @@ from .data_processor import RemoteDeckError
 from .data_processor import getRemoteDeck
 from .templates_and_definitions import DEFAULT_PARENT_DECK_NAME
 from .styled_messages import StyledMessageBox
-from .utils import get_or_create_deck, validate_url, get_spreadsheet_id_from_url, add_debug_message
+from .utils import get_or_create_deck, fetch_tsv_response, get_spreadsheet_id_from_url, add_debug_message
 
 
 def is_dark_mode():
@@ -597,14 +597,17 @@ class AddDeckDialog(QDialog):
         self._show_progress(True)
 
         try:
-            # Validate URL format and get TSV URL
-            self.tsv_url = validate_url(url)
+            # Validate URL and download it once
+            tsv_response = fetch_tsv_response(url)
+            self.tsv_url = tsv_response.url
 
-            # Try to load deck
-            self.remote_deck = getRemoteDeck(self.tsv_url)
+            # Try to load deck from the same response
+            self.remote_deck = getRemoteDeck(self.tsv_url, tsv_response=tsv_response)
 
             # Extract suggested name
-            self.suggested_name = DeckNameManager.extract_remote_name_from_url(url)
+            self.suggested_name = DeckNameManager.extract_remote_name_from_url(
+                url, tsv_response=tsv_response
+            )
 
             # Show preview
             self._show_deck_preview()
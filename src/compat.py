@@ -21,6 +21,7 @@ from aqt.qt import (
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QEventLoop,
     QFileDialog,
     QFont,
     QFormLayout,
@@ -36,6 +37,7 @@ from aqt.qt import (
     QListWidgetItem,
     QMenu,
     QMessageBox,
+    QObject,
     QPalette,
     QProgressBar,
     QProgressDialog,
@@ -54,6 +56,7 @@ from aqt.qt import (
     QTimer,
     QVBoxLayout,
     QWidget,
+    pyqtSignal,
     qconnect,
 )
 from aqt.utils import showCritical, showInfo, showWarning, tooltip
@@ -14,9 +14,12 @@ Features:
 
 import json
 import os
+import tempfile
+import threading
 import time
 import traceback
 import copy
+from contextlib import contextmanager
 
 try:
     from .compat import mw
@@ -138,41 +141,117 @@ def get_config():
         return DEFAULT_CONFIG.copy()
 
 
+# =============================================================================
+# META.JSON STORE
+# =============================================================================
+
+# meta.json is parsed once per process and kept in memory. The cached copy is
+# dropped when the file's mtime/size change (e.g. a backup was restored), and
+# inside a write batch save_meta() only marks it dirty so that the whole batch
+# is written with a single atomic flush.
+_meta_lock = threading.RLock()
+_meta_cache = None
+_meta_cache_stat = None
+_meta_dirty = False
+_meta_batch_depth = 0
+
+# Callbacks run with the metadata whenever it is (re)loaded or saved
+_meta_listeners = []
+
+
+def add_meta_listener(callback):
+    """
+    Registers a callback notified when the metadata is loaded or saved.
+
+    Args:
+        callback (callable): Called with the metadata dict
+    """
+    if callback not in _meta_listeners:
+        _meta_listeners.append(callback)
+
+
+def _notify_meta_listeners(meta):
+    for callback in list(_meta_listeners):
+        try:
+            callback(meta)
+        except Exception:
+            pass
+
+
+def _get_meta_path():
+    addon_path = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(addon_path, "meta.json")
+
+
+def _get_file_stat(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def _load_meta_from_disk():
+    """Reads meta.json (or config.json / defaults when it does not exist)."""
+    meta_path = _get_meta_path()
+    config_path = os.path.join(os.path.dirname(meta_path), "config.json")
+
+    # 1. Try to load meta.json (User settings)
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    # 2. If meta.json doesn't exist, try config.json (Defaults)
+    elif os.path.exists(config_path):
+        with open(config_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    # 3. Fallback to hardcoded defaults
+    else:
+        meta = copy.deepcopy(DEFAULT_META)
+
+    # Ensure proper structure
+    return _ensure_meta_structure(meta)
+
+
+def _write_meta_to_disk(meta):
+    """Writes meta.json atomically (temporary file + rename)."""
+    meta_path = _get_meta_path()
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(meta_path), prefix=".meta.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def get_meta():
     """
     Loads user metadata from meta.json (source of truth).
     If meta.json doesn't exist, allows initialization from config.json.
 
+    The parsed metadata is cached in memory and reloaded only when meta.json
+    changes on disk. Each call returns a private copy, so edits only reach
+    the store through save_meta().
+
     Returns:
         dict: User metadata including preferences and remote decks
     """
-    try:
-        import json
-        import os
-
-        # Paths
-        addon_path = os.path.dirname(os.path.dirname(__file__))
-        meta_path = os.path.join(addon_path, "meta.json")
-        config_path = os.path.join(addon_path, "config.json")
-
-        # 1. Try to load meta.json (User settings)
-        if os.path.exists(meta_path):
-            with open(meta_path, encoding="utf-8") as f:
-                meta = json.load(f)
-        
-        # 2. If meta.json doesn't exist, try config.json (Defaults)
-        elif os.path.exists(config_path):
-            with open(config_path, encoding="utf-8") as f:
-                meta = json.load(f)
-                
-        # 3. Fallback to hardcoded defaults
-        else:
-            meta = DEFAULT_META.copy()
+    global _meta_cache, _meta_cache_stat
 
-        # Ensure proper structure
-        meta = _ensure_meta_structure(meta)
-
-        return meta
+    try:
+        with _meta_lock:
+            current_stat = _get_file_stat(_get_meta_path())
+            if _meta_cache is None or (not _meta_dirty and current_stat != _meta_cache_stat):
+                _meta_cache = _load_meta_from_disk()
+                _meta_cache_stat = current_stat
+                _notify_meta_listeners(_meta_cache)
+            return copy.deepcopy(_meta_cache)
     except Exception as e:
         if mw:
             StyledMessageBox.warning(
@@ -181,29 +260,89 @@ def get_meta():
                 f"Error loading meta.json: {str(e)}",
                 detailed_text="Using default configuration."
             )
-        return DEFAULT_META.copy()
+        return copy.deepcopy(DEFAULT_META)
 
 
 def save_meta(meta):
     """
     Saves user metadata to meta.json.
 
+    Inside a write batch (see meta_write_batch) the metadata only replaces the
+    in-memory copy and is written at the next flush.
+
     Args:
         meta (dict): Metadata to save
     """
+    global _meta_cache, _meta_dirty
+
+    with _meta_lock:
+        # Stored as a copy, so later edits of the caller's dict are not saved
+        _meta_cache = copy.deepcopy(meta)
+        _meta_dirty = True
+        _notify_meta_listeners(_meta_cache)
+        if _meta_batch_depth == 0:
+            flush_meta()
+
+
+def flush_meta():
+    """
+    Writes pending metadata changes to meta.json.
+
+    Returns:
+        bool: True if meta.json is up to date with the in-memory copy
+    """
+    global _meta_cache_stat, _meta_dirty
+
+    with _meta_lock:
+        if not _meta_dirty:
+            return True
+        try:
+            _write_meta_to_disk(_meta_cache)
+            _meta_cache_stat = _get_file_stat(_get_meta_path())
+            _meta_dirty = False
+            return True
+        except Exception as e:
+            if mw:
+                StyledMessageBox.warning(mw, "Meta Save Error", f"Error saving meta.json: {str(e)}")
+            return False
+
+
+def begin_meta_write_batch():
+    """Starts deferring meta.json writes until end_meta_write_batch()."""
+    global _meta_batch_depth
+
+    with _meta_lock:
+        _meta_batch_depth += 1
+
+
+def end_meta_write_batch():
+    """Ends a write batch, flushing pending changes when the outermost one ends."""
+    global _meta_batch_depth
+
+    with _meta_lock:
+        _meta_batch_depth = max(0, _meta_batch_depth - 1)
+        if _meta_batch_depth == 0:
+            flush_meta()
+
+
+@contextmanager
+def meta_write_batch():
+    """Context manager form of begin/end_meta_write_batch()."""
+    begin_meta_write_batch()
     try:
-        import json
-        import os
+        yield
+    finally:
+        end_meta_write_batch()
 
-        # Save directly to meta.json file
-        addon_path = os.path.dirname(os.path.dirname(__file__))
-        meta_path = os.path.join(addon_path, "meta.json")
 
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=4, ensure_ascii=False)
-    except Exception as e:
-        if mw:
-            StyledMessageBox.warning(mw, "Meta Save Error", f"Error saving meta.json: {str(e)}")
+def invalidate_meta_cache():
+    """Drops the in-memory metadata so the next get_meta() reads meta.json."""
+    global _meta_cache, _meta_cache_stat, _meta_dirty
+
+    with _meta_lock:
+        _meta_cache = None
+        _meta_cache_stat = None
+        _meta_dirty = False
 
 
 def get_remote_decks():
@@ -243,6 +382,7 @@ def save_remote_decks(remote_decks):
 
     meta = get_meta()
     meta["decks"] = remote_decks
+    _prune_sync_fingerprints(meta)
     save_meta(meta)
 
     add_debug_message("✓ Deck info successfully saved to meta.json", "Config Manager")
@@ -552,6 +692,7 @@ def disconnect_deck(url):
     if spreadsheet_id in remote_decks:
         del remote_decks[spreadsheet_id]
         meta["decks"] = remote_decks  # type: ignore
+        _prune_sync_fingerprints(meta)
         save_meta(meta)
 
 
@@ -1058,6 +1199,190 @@ def set_sync_missing_students_notes(enabled):
     )
 
 
+# =============================================================================
+# DECK SYNC FINGERPRINTS
+# =============================================================================
+
+def get_deck_sync_fingerprint(deck_url):
+    """
+    Gets the fingerprint stored after the last complete sync of a deck.
+
+    Args:
+        deck_url (str): Remote deck URL
+
+    Returns:
+        dict: {"fingerprint": str, "note_count": int, "unchanged": int,
+            "skipped": int} or None if there is no stored fingerprint
+    """
+    try:
+        deck_id = get_deck_id(deck_url)
+    except ValueError:
+        return None
+
+    meta = get_meta()
+    return meta.get("sync_fingerprints", {}).get(deck_id)
+
+
+def save_deck_sync_fingerprint(deck_url, fingerprint_data):
+    """
+    Stores (or clears) the sync fingerprint of a deck.
+
+    Fingerprints live in a top-level key instead of the deck entry, so that
+    saving an in-memory copy of the decks does not overwrite them.
+
+    Args:
+        deck_url (str): Remote deck URL
+        fingerprint_data (dict): Data returned later by get_deck_sync_fingerprint(),
+            or None to remove the stored fingerprint
+    """
+    try:
+        deck_id = get_deck_id(deck_url)
+    except ValueError:
+        return
+
+    meta = get_meta()
+    fingerprints = meta.setdefault("sync_fingerprints", {})
+
+    if fingerprint_data is None:
+        if fingerprints.pop(deck_id, None) is None:
+            return
+    else:
+        fingerprints[deck_id] = fingerprint_data
+
+    save_meta(meta)
+
+
+def _prune_sync_fingerprints(meta):
+    """
+    Drops the sync fingerprints of decks that are no longer in meta["decks"].
+
+    Args:
+        meta (dict): meta.json contents, modified in place
+    """
+    fingerprints = meta.get("sync_fingerprints")
+    if not fingerprints:
+        return
+    decks = meta.get("decks", {})
+    meta["sync_fingerprints"] = {
+        deck_id: data for deck_id, data in fingerprints.items() if deck_id in decks
+    }
+
+
+# =============================================================================
+# SPREADSHEET TITLE CACHE
+# =============================================================================
+
+# Cached titles are trusted for this long when the TSV response gives no way
+# to tell whether the spreadsheet was renamed
+TITLE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Titles are resolved from the parallel download workers
+_title_cache_lock = threading.Lock()
+
+
+def get_cached_spreadsheet_title(deck_url, content_disposition=None):
+    """
+    Gets the cached title of a spreadsheet, if it is still valid.
+
+    Google embeds the spreadsheet title in the Content-Disposition header of
+    the TSV export. When the header of the current download is known, the
+    cached title is valid as long as the header did not change; otherwise the
+    entry expires after TITLE_CACHE_TTL_SECONDS.
+
+    Args:
+        deck_url (str): Remote deck URL
+        content_disposition (str, optional): Content-Disposition header of the
+            TSV response downloaded in this sync
+
+    Returns:
+        str: Cached title or None if there is no valid entry
+    """
+    try:
+        deck_id = get_deck_id(deck_url)
+    except ValueError:
+        return None
+
+    entry = get_meta().get("title_cache", {}).get(deck_id)
+    if not entry or not entry.get("title"):
+        return None
+
+    cached_disposition = entry.get("content_disposition")
+    if content_disposition and cached_disposition:
+        return entry["title"] if content_disposition == cached_disposition else None
+
+    if time.time() - entry.get("cached_at", 0) > TITLE_CACHE_TTL_SECONDS:
+        return None
+
+    return entry["title"]
+
+
+def save_cached_spreadsheet_title(deck_url, title, content_disposition=None):
+    """
+    Stores the title of a spreadsheet in the title cache.
+
+    Args:
+        deck_url (str): Remote deck URL
+        title (str): Title extracted from the spreadsheet
+        content_disposition (str, optional): Content-Disposition header of the
+            TSV response the title belongs to
+    """
+    try:
+        deck_id = get_deck_id(deck_url)
+    except ValueError:
+        return
+
+    with _title_cache_lock:
+        meta = get_meta()
+        meta.setdefault("title_cache", {})[deck_id] = {
+            "title": title,
+            "content_disposition": content_disposition or None,
+            "cached_at": time.time(),
+        }
+        save_meta(meta)
+
+
+# =============================================================================
+# NOTE TYPE TEMPLATE STAMPS
+# =============================================================================
+
+
+def get_template_stamps(collection_key):
+    """
+    Gets the template stamp of each Sheets2Anki note type of a collection.
+
+    Args:
+        collection_key (str): Collection identifier (see
+            templates_and_definitions.get_collection_stamp_key)
+
+    Returns:
+        dict: {note_type_id (str): stamp (str)}
+    """
+    stamps = get_meta().get("template_stamps", {}).get(collection_key)
+    return dict(stamps) if isinstance(stamps, dict) else {}
+
+
+def save_template_stamps(stamps, collection_key):
+    """
+    Replaces the stored note type template stamps of a collection.
+
+    Stamps of other collections (Anki profiles) are kept.
+
+    Args:
+        stamps (dict): {note_type_id (str): stamp (str)}
+        collection_key (str): Collection identifier
+    """
+    meta = get_meta()
+    # Entries that are not per-collection dicts come from the old flat format
+    all_stamps = {
+        key: value
+        for key, value in meta.get("template_stamps", {}).items()
+        if isinstance(value, dict)
+    }
+    all_stamps[collection_key] = dict(stamps)
+    meta["template_stamps"] = all_stamps
+    save_meta(meta)
+
+
 # =============================================================================
 # STUDENT SYNCHRONIZATION HISTORY MANAGEMENT (NEW)
 # =============================================================================
@@ -1221,21 +1546,43 @@ def cleanup_orphaned_sync_history():
     return len(orphaned_students)
 
 
-def discover_all_students_from_remote_decks():
+# Maximum number of decks downloaded at the same time during student discovery
+DISCOVERY_MAX_WORKERS = 6
+
+
+def discover_all_students_from_remote_decks(
+    remote_decks=None, on_deck_discovered=None, max_workers=DISCOVERY_MAX_WORKERS
+):
     """
     Discovers all unique students from all configured remote decks.
 
+    Decks are downloaded concurrently on a bounded thread pool. Each download
+    goes through the shared TSV fetch cache, and only the STUDENTS column is
+    parsed.
+
+    Args:
+        remote_decks (dict, optional): Remote decks to scan; read from meta.json
+            when not given
+        on_deck_discovered (callable, optional): Called as each deck finishes,
+            on the calling thread, with (deck_name, students, error, done, total)
+        max_workers (int): Maximum number of decks downloaded at the same time
+
     Returns:
         list: List of student names found (normalized)
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import as_completed
+
     from .student_manager import discover_students_from_tsv_url
 
     all_students = set()
-    remote_decks = get_remote_decks()
+    if remote_decks is None:
+        remote_decks = get_remote_decks()
 
     add_debug_msg("🔍 DEBUG: Starting student discovery...")
     add_debug_msg(f"📋 DEBUG: Found {len(remote_decks)} remote decks for analysis")
 
+    jobs = []
     for i, (hash_key, deck_info) in enumerate(remote_decks.items(), 1):
         deck_name = deck_info.get("remote_deck_name", f"Deck {i}")
         url = deck_info.get("remote_deck_url")
@@ -1244,24 +1591,42 @@ def discover_all_students_from_remote_decks():
             add_debug_msg(f"   ⚠️ Deck {deck_name} has no URL configured, skipping...")
             continue
 
-        add_debug_msg(f"🔍 DEBUG: Analyzing deck {i}/{len(remote_decks)}: {deck_name}")
-        add_debug_msg(f"🌐 DEBUG: URL: {url}")
+        jobs.append((deck_name, url))
 
-        try:
-            students = discover_students_from_tsv_url(url)
-            add_debug_msg(f"   ✓ Found {len(students)} students: {sorted(students)}")
+    if not jobs:
+        add_debug_msg("✅ DEBUG: Discovery completed. Total unique students: 0")
+        return []
 
-            # Add discovered students (case-sensitive)
-            for student in students:
-                if student and student.strip():
-                    all_students.add(student.strip())
+    total = len(jobs)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        futures = {
+            executor.submit(discover_students_from_tsv_url, url): (deck_name, url)
+            for deck_name, url in jobs
+        }
 
-            add_debug_msg(f"   ✓ Added {len(students)} valid students")
+        for done, future in enumerate(as_completed(futures), 1):
+            deck_name, url = futures[future]
+            students = set()
+            error = None
 
-        except Exception as e:
-            # In case of error, continue with next deck
-            add_debug_msg(f"   ❌ Error discovering students from deck {deck_name}: {e}")
-            continue
+            try:
+                students = future.result()
+                add_debug_msg(
+                    f"   ✓ {deck_name} ({done}/{total}): {len(students)} students: {sorted(students)}"
+                )
+
+                # Add discovered students (case-sensitive)
+                for student in students:
+                    if student and student.strip():
+                        all_students.add(student.strip())
+
+            except Exception as e:
+                # In case of error, continue with next deck
+                error = e
+                add_debug_msg(f"   ❌ Error discovering students from deck {deck_name}: {e}")
+
+            if on_deck_discovered is not None:
+                on_deck_discovered(deck_name, students, error, done, total)
 
     final_students = sorted(all_students)
     add_debug_msg(
@@ -1272,22 +1637,23 @@ def discover_all_students_from_remote_decks():
     return final_students
 
 
-def update_available_students_from_discovery():
+def merge_discovered_students(discovered_students):
     """
-    Updates available students list by discovering from all remote decks.
+    Adds discovered students to the available students list.
+
+    Args:
+        discovered_students (Iterable[str]): Students found in the remote decks
 
     Returns:
-        tuple: (students_found, new_students_count)
+        tuple: (final_available, new_students_count)
     """
-    add_debug_msg("🔄 DEBUG: Starting discovery update for available students...")
-
     config = get_global_student_config()
     current_available = set(config.get("available_students", []))
     add_debug_msg(
         f"📋 DEBUG: Current available students: {len(current_available)} - {sorted(current_available)}"
     )
 
-    discovered_students = set(discover_all_students_from_remote_decks())
+    discovered_students = set(discovered_students)
     add_debug_msg(
         f"🔍 DEBUG: Discovered students: {len(discovered_students)} - {sorted(discovered_students)}"
     )
@@ -1314,6 +1680,18 @@ def update_available_students_from_discovery():
     return final_available, new_count
 
 
+def update_available_students_from_discovery():
+    """
+    Updates available students list by discovering from all remote decks.
+
+    Returns:
+        tuple: (students_found, new_students_count)
+    """
+    add_debug_msg("🔄 DEBUG: Starting discovery update for available students...")
+
+    return merge_discovered_students(discover_all_students_from_remote_decks())
+
+
 # =============================================================================
 # NOTE TYPE IDS MANAGEMENT
 # =============================================================================
@@ -2189,11 +2567,14 @@ def sync_note_type_names_robustly(url, correct_remote_name, enabled_students):
                 # 3. RENAME IN ANKI: Update physical note type name
                 from anki.models import NotetypeId
 
+                from .templates_and_definitions import mark_note_types_changed
+
                 note_type_obj = mw.col.models.get(NotetypeId(note_type_id_int))
                 if note_type_obj:
                     old_anki_name = note_type_obj.get("name", "")
                     note_type_obj["name"] = expected_name
                     mw.col.models.save(note_type_obj)
+                    mark_note_types_changed()
 
                     add_debug_msg(
                         f"[NOTE_TYPE_SYNC] ✅ Renamed in Anki: '{old_anki_name}' -> '{expected_name}'"
@@ -16,29 +16,33 @@ Consolidated from:
 # IMPORTS
 # =============================================================================
 
+import codecs
 import csv
+import hashlib
+import json
 import re
 import socket
+import threading
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import NamedTuple
+from typing import Tuple
 
 from . import templates_and_definitions as cols  # Centralized column definitions
-from .templates_and_definitions import DEFAULT_CONCEPT
-from .templates_and_definitions import DEFAULT_SUBTOPIC
-from .templates_and_definitions import DEFAULT_TOPIC
-from .templates_and_definitions import DEFAULT_IMPORTANCE
 from .templates_and_definitions import DEFAULT_STUDENT
 from .templates_and_definitions import TAG_ADDITIONAL
 from .templates_and_definitions import TAG_YEARS
 from .templates_and_definitions import TAG_EXAM_BOARDS
 from .templates_and_definitions import TAG_CAREERS
-from .templates_and_definitions import TAG_CONCEPTS
-from .templates_and_definitions import TAG_IMPORTANCE
 from .templates_and_definitions import TAG_ROOT
-from .templates_and_definitions import TAG_TOPICS
 from .templates_and_definitions import ensure_custom_models
+from .templates_and_definitions import get_note_types_generation
 from .utils import CollectionSaveError
 from .utils import ensure_subdeck_exists
+from .utils import clean_tag_text
+from .utils import get_hierarchy_names
 from .utils import get_subdeck_name
 from .utils import add_debug_message
 
@@ -57,6 +61,17 @@ except ImportError:
     except ImportError:
         mw = None
 
+# Parsed TSV of the most recently used URLs: {url: (content_hash, parsed_data)}.
+# Lets getRemoteDeck skip decoding and parsing when the sheet did not change,
+# at the cost of keeping up to PARSED_TSV_CACHE_MAX_ENTRIES full row sets in
+# memory; older entries are evicted, since the raw body stays on disk.
+PARSED_TSV_CACHE_MAX_ENTRIES = 4
+_parsed_tsv_cache = OrderedDict()
+_parsed_tsv_cache_lock = threading.Lock()
+
+# Size of the byte chunks fed to the incremental TSV decoder
+TSV_STREAM_CHUNK_SIZE = 64 * 1024
+
 # =============================================================================
 # CUSTOM EXCEPTIONS
 # =============================================================================
@@ -73,6 +88,133 @@ class RemoteDeckError(Exception):
 # =============================================================================
 
 
+# SYNC column values that mark a row for synchronization
+SYNC_TRUE_VALUES = frozenset(("true", "1", "yes", "sim"))
+
+
+class RowInfo(NamedTuple):
+    """Per-row values derived once at parse time and shared by all sync stages."""
+
+    note_id: str  # Stripped ID ("" for invalid rows)
+    is_sync: bool  # SYNC column marks the row for synchronization
+    students: Tuple[str, ...]  # Students listed in the row (empty: [MISSING STUDENTS])
+    has_reverse: bool  # REVERSE column is filled
+    is_cloze: bool  # QUESTION or ANSWER contains a cloze deletion
+
+
+def classify_row(note_data):
+    """
+    Derives the RowInfo of a row.
+
+    Args:
+        note_data (Mapping): Row data (RemoteRow or dict)
+
+    Returns:
+        RowInfo: Classification of the row
+    """
+    students_str = note_data.get(cols.students, "").strip()
+    return RowInfo(
+        note_id=note_data.get(cols.identifier, "").strip(),
+        is_sync=str(note_data.get(cols.is_sync, "")).strip().lower() in SYNC_TRUE_VALUES,
+        students=tuple(s.strip() for s in students_str.split(",") if s.strip()),
+        has_reverse=bool(note_data.get(cols.reverse, "").strip()),
+        is_cloze=has_cloze_deletion(note_data.get(cols.question, ""))
+        or has_cloze_deletion(note_data.get(cols.answer, "")),
+    )
+
+
+def get_row_info(note_data):
+    """
+    Returns the RowInfo of a row, computing it only once for RemoteRow objects.
+
+    Args:
+        note_data (Mapping): Row data (RemoteRow or dict)
+
+    Returns:
+        RowInfo: Classification of the row
+    """
+    info = getattr(note_data, "info", None)
+    if info is None:
+        info = classify_row(note_data)
+        if isinstance(note_data, RemoteRow):
+            note_data.info = info
+    return info
+
+
+class RemoteRow(Mapping):
+    """
+    Read-only mapping view of one spreadsheet row.
+
+    Cell values are kept in a tuple and looked up through a column index
+    shared by all rows of the sheet, instead of repeating every header key
+    in a per-row dict. The only writable key is "tags", set by
+    process_note_fields(); the row's RowInfo is cached in the info slot.
+    """
+
+    __slots__ = ("_columns", "_values", "tags", "info")
+
+    def __init__(self, columns, values):
+        """
+        Args:
+            columns (dict): Shared mapping {header: index into values}
+            values (tuple): Cell values, one per column
+        """
+        self._columns = columns
+        self._values = values
+        self.tags = None
+        self.info = None  # RowInfo, filled by get_row_info()
+
+    @classmethod
+    def from_cells(cls, columns, column_count, cells):
+        """
+        Builds a row from raw cells, stripping values and padding missing cells.
+
+        Args:
+            columns (dict): Shared mapping {header: index}
+            column_count (int): Number of headers
+            cells (list): Raw cell values as read from the TSV
+        """
+        values = tuple(cell.strip() for cell in cells[:column_count])
+        if len(values) < column_count:
+            values += ("",) * (column_count - len(values))
+        return cls(columns, values)
+
+    def __getitem__(self, key):
+        if key == "tags" and self.tags is not None:
+            return self.tags
+        return self._values[self._columns[key]]
+
+    def __setitem__(self, key, value):
+        if key != "tags":
+            raise TypeError(f"RemoteRow is read-only (cannot set '{key}')")
+        self.tags = value
+
+    def __iter__(self):
+        yield from self._columns
+        if self.tags is not None and "tags" not in self._columns:
+            yield "tags"
+
+    def __len__(self):
+        extra = 1 if self.tags is not None and "tags" not in self._columns else 0
+        return len(self._columns) + extra
+
+    def __repr__(self):
+        return f"RemoteRow({dict(self)!r})"
+
+
+def build_column_index(headers):
+    """
+    Builds the column index shared by the RemoteRow objects of a sheet.
+
+    Args:
+        headers (list): Header row
+
+    Returns:
+        dict: {header: index}; for duplicate headers the last column wins
+    """
+    return {header: index for index, header in enumerate(headers)}
+
+
 class RemoteDeck:
     """
     Class representing a deck loaded from a remote source.
@@ -93,7 +235,7 @@ class RemoteDeck:
         """
         self.name = name
         self.url = url
-        self.notes = []  # List of dictionaries representing notes
+        self.notes = []  # List of RemoteRow mappings representing notes
         self.headers = []  # List of spreadsheet headers
 
         # Refactored metrics per specification
@@ -110,6 +252,11 @@ class RemoteDeck:
 
         self.enabled_students = set()  # Set of enabled students
 
+        self.sync_status_by_id = {}  # Note ID -> SYNC enabled (first row wins)
+
+        self.content_hash = None  # SHA-256 of the downloaded TSV (if known)
+        self.unchanged = False  # True if the TSV matches the previous download
+
     def add_note(self, note_data):
         """
         Adds a note to the deck and updates metrics.
@@ -123,9 +270,9 @@ class RemoteDeck:
         # Check for completely empty rows (ghost rows from Google Sheets)
         # If all fields are empty (or only contain default Sync values like "FALSE"), we ignore this row
         # This prevents "Invalid Rows" noise from checkbox columns extended down
-        has_id = bool(note_data.get(cols.identifier, "").strip())
+        info = get_row_info(note_data)
         
-        if not has_id:
+        if not info.note_id:
             # Check if there is any content in columns OTHER than SYNC
             # We ignore SYNC because checkboxes often default to FALSE in empty rows
             other_content = False
@@ -146,7 +293,7 @@ class RemoteDeck:
         self.total_table_lines += 1
 
             # 2 and 3. Valid vs invalid lines (based on ID)
-        note_id = note_data.get(cols.identifier, "").strip()
+        note_id = info.note_id
         if note_id:
             self.valid_note_lines += 1
         else:
@@ -159,15 +306,15 @@ class RemoteDeck:
             return
 
         # 4. Lines marked for sync (only for valid lines)
-        sync_value = str(note_data.get(cols.is_sync, "")).strip().lower()
-        if sync_value in ["true", "1", "yes", "sim"]:
+        if info.is_sync:
             self.sync_marked_lines += 1
 
+        self.sync_status_by_id.setdefault(note_id, info.is_sync)
+
         # Student analysis for metrics 5-9 (only for valid lines)
-        alunos_str = note_data.get(cols.students, "").strip()
-        has_reverse = bool(note_data.get(cols.reverse, "").strip())
+        has_reverse = info.has_reverse
 
-        if not alunos_str:
+        if not info.students:
             # 7. Note for [MISSING STUDENTS]
             notes_to_add = 2 if has_reverse else 1
             self.potential_missing_students_notes += notes_to_add
@@ -178,8 +325,7 @@ class RemoteDeck:
                 self.notes_per_student[DEFAULT_STUDENT] = 0
             self.notes_per_student[DEFAULT_STUDENT] += notes_to_add
         else:
-            # Extract students from string
-            students_in_note = [s.strip() for s in alunos_str.split(",") if s.strip()]
+            students_in_note = info.students
             multiplier = 2 if has_reverse else 1
 
             # 8. Add unique students
@@ -317,7 +463,7 @@ class RemoteDeck:
 # =============================================================================
 
 
-def getRemoteDeck(url, enabled_students=None, debug_messages=None):
+def getRemoteDeck(url, enabled_students=None, debug_messages=None, tsv_response=None):
     """
     Main function to obtain and process a remote deck.
 
@@ -328,6 +474,8 @@ def getRemoteDeck(url, enabled_students=None, debug_messages=None):
         url (str): Spreadsheet URL in TSV format
         enabled_students (list, optional): List of enabled students
         debug_messages (list, optional): List to accumulate debug messages
+        tsv_response (TsvResponse, optional): Response already fetched with
+            utils.fetch_tsv_response; when given, the URL is not downloaded again
 
     Returns:
         RemoteDeck: Processed remote deck object
@@ -348,18 +496,53 @@ def getRemoteDeck(url, enabled_students=None, debug_messages=None):
     try:
         add_debug_msg(f"Starting remote deck download: {url}")
 
-        # 1. Download TSV data
-        tsv_data = download_tsv_data(url)
-        add_debug_msg(f"Download complete: {len(tsv_data)} bytes")
+        content_hash = tsv_response.content_hash if tsv_response is not None else None
+        parsed_data = None
+        if tsv_response is not None and tsv_response.unchanged:
+            parsed_data = _get_cached_parse(url, content_hash)
 
-        # 2. Parse TSV data
-        parsed_data = parse_tsv_data(tsv_data, debug_messages)
-        add_debug_msg(f"Parse complete: {len(parsed_data['rows'])} lines")
+        if parsed_data is not None:
+            # Sheet unchanged since the last download: reuse the parsed rows
+            add_debug_msg(
+                f"Sheet unchanged, reusing parsed data: {len(parsed_data['rows'])} lines"
+            )
+            remote_deck = build_remote_deck_from_tsv(
+                parsed_data, url, enabled_students, debug_messages
+            )
+        else:
+            # 1. Stream TSV data (reusing the validation response when available)
+            if tsv_response is not None:
+                chunks = tsv_response.iter_chunks(TSV_STREAM_CHUNK_SIZE)
+            else:
+                chunks = stream_tsv_data(url)
+
+            # 2. Parse rows as they are decoded
+            parsed_data = parse_tsv_stream(chunks, debug_messages)
+
+            cached_rows = None
+            if content_hash:
+                # Keeps the full cell list of every row for the next sync. This
+                # holds the whole parsed sheet in memory (bounded to
+                # PARSED_TSV_CACHE_MAX_ENTRIES sheets); only the cell strings
+                # that RemoteRow stores unchanged are shared with the deck
+                cached_rows = []
+                parsed_data["rows"] = _collect_rows(parsed_data["rows"], cached_rows)
+
+            # 3. Build remote deck row by row
+            remote_deck = build_remote_deck_from_tsv(
+                parsed_data, url, enabled_students, debug_messages
+            )
+            add_debug_msg(f"Parse complete: {remote_deck.total_table_lines} lines")
 
-        # 3. Build remote deck
-        remote_deck = build_remote_deck_from_tsv(
-            parsed_data, url, enabled_students, debug_messages
-        )
+            if cached_rows is not None:
+                _store_cached_parse(
+                    url,
+                    content_hash,
+                    {"headers": parsed_data["headers"], "rows": cached_rows},
+                )
+
+        remote_deck.content_hash = content_hash
+        remote_deck.unchanged = bool(tsv_response is not None and tsv_response.unchanged)
 
         stats = remote_deck.get_statistics()
         add_debug_msg(
@@ -389,6 +572,26 @@ def download_tsv_data(url, timeout=30):
     Returns:
         str: TSV data as string
 
+    Raises:
+        RemoteDeckError: If there's an error in download
+    """
+    return b"".join(stream_tsv_data(url, timeout)).decode("utf-8")
+
+
+def stream_tsv_data(url, timeout=30, chunk_size=TSV_STREAM_CHUNK_SIZE):
+    """
+    Downloads TSV data from a URL, yielding the body in chunks as it arrives.
+
+    Supports both edition and TSV format URLs, automatically converting when necessary.
+
+    Args:
+        url (str): URL for download (can be edition or TSV format)
+        timeout (int): Timeout in seconds
+        chunk_size (int): Maximum chunk size in bytes
+
+    Yields:
+        bytes: Consecutive chunks of the response body
+
     Raises:
         RemoteDeckError: If there's an error in download
     """
@@ -414,10 +617,14 @@ def download_tsv_data(url, timeout=30):
                     f"HTTP {response.getcode()}: Failed to access URL"
                 )
 
-            # Read and decode data
-            data = response.read().decode("utf-8")
-            return data
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
 
+    except RemoteDeckError:
+        raise
     except socket.timeout:
         raise RemoteDeckError(f"Timeout of {timeout}s while accessing the URL")
     except urllib.error.HTTPError as e:
@@ -440,16 +647,111 @@ def download_tsv_data(url, timeout=30):
         raise RemoteDeckError(f"Unexpected download error: {str(e)}")
 
 
-def parse_tsv_data(tsv_data, debug_messages=None):
+def iter_tsv_lines(chunks):
     """
-    Parses TSV data and returns processed structure.
+    Decodes UTF-8 byte chunks incrementally and yields complete lines.
+
+    Lines keep their line ending and are split on "\n" only, so csv.reader
+    can reassemble quoted cells that span several lines. Multi-byte
+    characters split across chunks are handled by the incremental decoder.
 
     Args:
-        tsv_data (str): TSV data as string
+        chunks: Iterable of bytes-like chunks
+
+    Yields:
+        str: Decoded lines
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        start = 0
+        while True:
+            end = buffer.find("\n", start)
+            if end == -1:
+                break
+            yield buffer[start:end + 1]
+            start = end + 1
+        buffer = buffer[start:]
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def _skip_trailing_blank_rows(rows):
+    """Drops blank rows at the end of the data (they used to be stripped)."""
+    blank_rows = []
+    for row in rows:
+        if not row:
+            blank_rows.append(row)
+            continue
+        if blank_rows:
+            yield from blank_rows
+            blank_rows = []
+        yield row
+
+
+def _get_cached_parse(url, content_hash):
+    """
+    Returns the cached parse of a URL if it matches the given content hash.
+
+    Args:
+        url (str): Spreadsheet URL
+        content_hash (str): Hash of the current TSV body
+
+    Returns:
+        dict: Parsed data ({"headers", "rows"}), or None on a miss
+    """
+    with _parsed_tsv_cache_lock:
+        cached = _parsed_tsv_cache.get(url)
+        if cached is None:
+            return None
+        if cached[0] != content_hash:
+            del _parsed_tsv_cache[url]
+            return None
+        _parsed_tsv_cache.move_to_end(url)
+        return cached[1]
+
+
+def _store_cached_parse(url, content_hash, parsed_data):
+    """
+    Caches the parse of a URL, evicting the least recently used entries.
+
+    Args:
+        url (str): Spreadsheet URL
+        content_hash (str): Hash of the parsed TSV body
+        parsed_data (dict): Parsed data ({"headers", "rows"})
+    """
+    with _parsed_tsv_cache_lock:
+        _parsed_tsv_cache[url] = (content_hash, parsed_data)
+        _parsed_tsv_cache.move_to_end(url)
+        while len(_parsed_tsv_cache) > PARSED_TSV_CACHE_MAX_ENTRIES:
+            _parsed_tsv_cache.popitem(last=False)
+
+
+def _collect_rows(rows, collected):
+    """Yields rows while appending them to collected."""
+    for row in rows:
+        collected.append(row)
+        yield row
+
+
+def parse_tsv_stream(chunks, debug_messages=None):
+    """
+    Parses TSV data incrementally from byte chunks.
+
+    Only the header row is read up front; data rows are produced lazily, so
+    the deck can be built while the data is decoded, without holding the
+    whole text in memory.
+
+    Args:
+        chunks: Iterable of UTF-8 encoded bytes-like chunks
         debug_messages (list, optional): Debug list
 
     Returns:
-        dict: Processed data with headers and rows
+        dict: {"headers": list, "rows": iterator of row lists}
 
     Raises:
         RemoteDeckError: If there's an error in parsing
@@ -464,23 +766,14 @@ def parse_tsv_data(tsv_data, debug_messages=None):
             debug_messages.append(formatted_msg)
 
     try:
-        # Use csv.reader for TSV parsing
-        lines = tsv_data.strip().split("\n")
-        if not lines:
-            raise RemoteDeckError("Empty TSV data")
-
-        reader = csv.reader(lines, delimiter="\t")
-        rows = list(reader)
+        reader = csv.reader(iter_tsv_lines(chunks), delimiter="\t")
 
-        if not rows:
+        # First non-blank row is headers
+        headers = next((row for row in reader if row), None)
+        if headers is None:
             raise RemoteDeckError("No rows found in TSV data")
 
-        # First row is headers
-        headers = rows[0]
-        data_rows = rows[1:]
-
         add_debug_msg(f"Headers found: {len(headers)}")
-        add_debug_msg(f"Data rows: {len(data_rows)}")
 
         # Validate mandatory headers (only ID and MATCH are really mandatory)
         required_headers = [cols.identifier, cols.answer]
@@ -489,14 +782,38 @@ def parse_tsv_data(tsv_data, debug_messages=None):
         if missing_headers:
             raise RemoteDeckError(f"Mandatory headers missing: {missing_headers}")
 
-        return {"headers": headers, "rows": data_rows}
+        return {"headers": headers, "rows": _skip_trailing_blank_rows(reader)}
 
+    except RemoteDeckError:
+        raise
     except csv.Error as e:
         raise RemoteDeckError(f"Error processing TSV data: {e}")
     except Exception as e:
         raise RemoteDeckError(f"Unexpected parsing error: {e}")
 
 
+def parse_tsv_data(tsv_data, debug_messages=None):
+    """
+    Parses TSV data and returns processed structure.
+
+    Args:
+        tsv_data (str): TSV data as string
+        debug_messages (list, optional): Debug list
+
+    Returns:
+        dict: Processed data with headers and rows
+
+    Raises:
+        RemoteDeckError: If there's an error in parsing
+    """
+    parsed_data = parse_tsv_stream([tsv_data.encode("utf-8")], debug_messages)
+    try:
+        parsed_data["rows"] = list(parsed_data["rows"])
+    except csv.Error as e:
+        raise RemoteDeckError(f"Error processing TSV data: {e}")
+    return parsed_data
+
+
 def build_remote_deck_from_tsv(
     parsed_data, url, enabled_students=None, debug_messages=None
 ):
@@ -528,47 +845,39 @@ def build_remote_deck_from_tsv(
     remote_deck = RemoteDeck(url=url)
     remote_deck.headers = headers
 
+    # Column index shared by all rows
+    columns = build_column_index(headers)
+    column_count = len(headers)
+
     # Process each row
     for row_index, row in enumerate(rows):
         try:
-            # Create note dictionary
-            note_data = {}
-
-            # Fill fields based on headers
-            for col_index, header in enumerate(headers):
-                if col_index < len(row):
-                    note_data[header] = row[col_index].strip()
-                else:
-                    note_data[header] = ""
+            # Create compact note row (fields looked up by header)
+            note_data = RemoteRow.from_cells(columns, column_count, row)
 
             # ALWAYS add to deck for correct metrics accounting
             # Empty ID validation will be done inside add_note() method
             remote_deck.add_note(note_data)
+            info = get_row_info(note_data)
 
             # Validate if it's a processable note (only ID is mandatory)
-            if not note_data.get(cols.identifier):
+            if not info.note_id:
                 add_debug_msg(
                     f"Row {row_index + 2}: invalid note (empty ID)"
                 )
                 continue
 
             # Check if it should sync
-            sync_value = str(note_data.get(cols.is_sync, "")).strip().lower()
-            if sync_value not in ["true", "1", "yes", "sim"]:
+            if not info.is_sync:
                 add_debug_msg(f"Row {row_index + 2}: note not marked for sync")
                 continue
 
             # Check student filter
-            if enabled_students:
-                note_students = note_data.get(cols.students, "").strip()
-                if note_students:
-                    # Check if any enabled student is in the note
-                    students_list = [s.strip() for s in note_students.split(",")]
-                    if not any(
-                        student in enabled_students for student in students_list
-                    ):
-                        add_debug_msg(f"Row {row_index + 2}: note filtered by student")
-                        continue
+            if enabled_students and info.students:
+                # Check if any enabled student is in the note
+                if not any(student in enabled_students for student in info.students):
+                    add_debug_msg(f"Row {row_index + 2}: note filtered by student")
+                    continue
 
             # Additional processing of fields for valid notes
             process_note_fields(note_data)
@@ -641,54 +950,18 @@ def create_tags_from_fields(note_data):
     # Root tag
     tags.append(TAG_ROOT)
 
-    def clean_tag_text(text):
-        """Cleans text for use as Anki tag - always returns lowercase"""
-        if not text or not isinstance(text, str):
-            return ""
-        # Remove extra spaces, replace spaces with underscores and problematic characters
-        cleaned = text.strip().replace(" ", "_").replace(":", "_").replace(";", "_")
-        # Remove special characters that may cause issues in Anki, but allow brackets
-        cleaned = re.sub(r"[^\w\-_\[\]]", "", cleaned)
-        # Always return lowercase for consistency (Anki tags are case-insensitive)
-        return cleaned.lower()
-
     # 1. STUDENT tags - REMOVED to simplify logic
     # (Student tags were eliminated as requested)
 
+    # Hierarchy tags are memoized by the raw IMPORTANCE/TOPIC/SUBTOPIC/CONCEPT values
+    hierarchy = get_hierarchy_names(note_data)
+
     # 2. TOPIC::SUBTOPIC::CONCEPT hierarchical tags (single values, NOT lists)
-    topico = note_data.get(cols.hierarchy_2, "").strip()
-    subtopico = note_data.get(cols.hierarchy_3, "").strip()
-    conceito = note_data.get(cols.hierarchy_4, "").strip()
-
-    # Use default values if empty
-    if not topico:
-        topico = DEFAULT_TOPIC
-    if not subtopico:
-        subtopico = DEFAULT_SUBTOPIC
-    if not conceito:
-        conceito = DEFAULT_CONCEPT
-
-    # Clean for tag use (single values, not lists)
-    topico_clean = clean_tag_text(topico)
-    subtopico_clean = clean_tag_text(subtopico)
-    conceito_clean = clean_tag_text(conceito)
-    
-    # If cleaning results in empty string (e.g., field had only invalid characters),
-    # use the default placeholder to ensure tags are always generated
-    if not topico_clean:
-        topico_clean = clean_tag_text(DEFAULT_TOPIC)
-    if not subtopico_clean:
-        subtopico_clean = clean_tag_text(DEFAULT_SUBTOPIC)
-    if not conceito_clean:
-        conceito_clean = clean_tag_text(DEFAULT_CONCEPT)
-
-    # Generate hierarchical tag - format: Sheets2Anki::Topics::topic::subtopic::concept
-    tags.append(
-        f"{TAG_ROOT}::{TAG_TOPICS}::{topico_clean}::{subtopico_clean}::{conceito_clean}"
-    )
+    # Format: sheets2anki::topics::topic::subtopic::concept
+    tags.append(hierarchy.topics_tag)
 
     # 3. Direct CONCEPT tag (for easy search)
-    tags.append(f"{TAG_ROOT}::{TAG_CONCEPTS}::{conceito_clean}")
+    tags.append(hierarchy.concept_tag)
 
     # 4. EXAMINATION BOARD tags (supports comma-separated list)
     bancas = note_data.get(cols.tags_1, "").strip()
@@ -714,19 +987,7 @@ def create_tags_from_fields(note_data):
                 tags.append(f"{TAG_ROOT}::{TAG_CAREERS}::{carr_clean}")
 
     # 7. IMPORTANCE tags (single value, NOT list)
-    importancia = note_data.get(cols.hierarchy_1, "").strip()
-    
-    if not importancia:
-        importancia = DEFAULT_IMPORTANCE
-        
-    importancia_clean = clean_tag_text(importancia)
-    
-    # If cleaning results in empty string (e.g., field had only invalid characters),
-    # use the default placeholder to ensure importance tag is always generated
-    if not importancia_clean:
-        importancia_clean = clean_tag_text(DEFAULT_IMPORTANCE)
-        
-    tags.append(f"{TAG_ROOT}::{TAG_IMPORTANCE}::{importancia_clean}")
+    tags.append(hierarchy.importance_tag)
 
     # 8. ADDITIONAL tags (supports comma and semicolon separated list)
     tags_adicionais = note_data.get(cols.tags_4, "").strip()
@@ -796,8 +1057,113 @@ def clean_cloze_formatting(text):
 # =============================================================================
 
 
+def compute_deck_sync_fingerprint(
+    remoteDeck, enabled_students, sync_missing_students, deck_url
+):
+    """
+    Calculates the fingerprint of everything that determines a deck's notes.
+
+    Covers the TSV content hash, the students selected for the deck, the
+    globally enabled students, the [MISSING STUDENTS] setting, the remote deck
+    name (used for subdecks and note types) and the template version.
+
+    Args:
+        remoteDeck (RemoteDeck): Remote deck built from a fetched TSV
+        enabled_students (set): Globally enabled students
+        sync_missing_students (bool): Whether [MISSING STUDENTS] notes are synced
+        deck_url (str): Remote deck URL
+
+    Returns:
+        str: SHA-256 hex digest, or None if the TSV content hash is unknown
+    """
+    if not getattr(remoteDeck, "content_hash", None):
+        return None
+
+    from .config_manager import get_deck_remote_name
+
+    payload = {
+        "content_hash": remoteDeck.content_hash,
+        "deck_students": sorted(remoteDeck.enabled_students),
+        "enabled_students": sorted(enabled_students),
+        "sync_missing_students": bool(sync_missing_students),
+        "remote_deck_name": get_deck_remote_name(deck_url),
+        "template_version": cols.TEMPLATE_VERSION,
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def count_deck_notes(col, deck_id):
+    """
+    Counts the notes in a deck and its subdecks with a single search.
+
+    Args:
+        col: Anki collection
+        deck_id (int): Deck ID
+
+    Returns:
+        int: Number of notes, or None if the deck does not exist
+    """
+    deck = col.decks.get(deck_id)
+    if not deck:
+        return None
+
+    deck_name = deck["name"]
+    if not deck_name.strip():
+        return len(col.find_notes(f"deck:{deck_id}"))
+
+    escaped_deck_name = deck_name.replace('"', '\\"')
+    return len(
+        col.find_notes(f'deck:"{escaped_deck_name}" OR deck:"{escaped_deck_name}::*"')
+    )
+
+
+def classify_orphaned_notes(student_note_ids, remoteDeck):
+    """
+    Classifies existing notes that are no longer expected by the sync.
+
+    Uses the note ID index built while parsing, so each note costs a single
+    dictionary lookup instead of a scan over the remote rows.
+
+    Args:
+        student_note_ids: student_note_ids present in Anki but not expected
+        remoteDeck (RemoteDeck): Remote deck of the current sync
+
+    Returns:
+        tuple: (obsolete, from_disabled_students, with_sync_disabled) sets of
+            student_note_ids
+    """
+    notes_really_obsolete = set()
+    notes_from_disabled_students = set()
+    notes_with_sync_disabled = set()  # Notes with SYNC=false should be preserved
+    sync_status_by_id = remoteDeck.sync_status_by_id
+
+    for student_note_id in student_note_ids:
+        if "_" not in student_note_id:
+            notes_really_obsolete.add(student_note_id)
+            continue
+
+        student_name, note_id = extract_student_from_student_note_id(student_note_id)
+        is_sync_marked = sync_status_by_id.get(note_id)
+
+        if is_sync_marked is None:
+            # Note truly no longer exists in spreadsheet
+            notes_really_obsolete.add(student_note_id)
+            add_debug_msg(f"📝 Obsolete note (removed from spreadsheet): {student_note_id}")
+        elif not is_sync_marked:
+            # Note exists but SYNC=false - ALWAYS preserve (user intentionally disabled sync)
+            notes_with_sync_disabled.add(student_note_id)
+            add_debug_msg(f"⏸️ Note with SYNC disabled (preserving): {student_note_id}")
+        else:
+            # Note exists in spreadsheet with SYNC=true, but student was disabled
+            notes_from_disabled_students.add(student_note_id)
+            add_debug_msg(f"👤 Note from disabled student: {student_note_id} (student: {student_name})")
+
+    return notes_really_obsolete, notes_from_disabled_students, notes_with_sync_disabled
+
+
 def create_or_update_notes(
-    col, remoteDeck, deck_id, deck_url=None, debug_messages=None
+    col, remoteDeck, deck_id, deck_url=None, debug_messages=None, student_context=None
 ):
     """
     Creates or updates notes in the deck based on remote data.
@@ -813,6 +1179,8 @@ def create_or_update_notes(
         remoteDeck (RemoteDeck): Remote deck object containing sync data
         deck_id (int): Anki deck ID to sync
         deck_url (str, optional): Deck URL to manage students
+        student_context (StudentSyncContext, optional): Student configuration
+            snapshot of the current sync; read from meta.json when not given
 
     Returns:
         dict: Sync statistics containing counts for created, updated,
@@ -852,14 +1220,16 @@ def create_or_update_notes(
     stats.remote_notes_per_student = deck_stats["notes_per_student"].copy()
 
     try:
-        # 1. Obtain enabled students from configuration system
-        from .config_manager import get_enabled_students
-        from .config_manager import is_sync_missing_students_notes
+        # 1. Obtain enabled students from the sync's configuration snapshot
+        if student_context is None:
+            from .student_manager import StudentSyncContext
+
+            student_context = StudentSyncContext.from_meta()
 
-        enabled_students = set(get_enabled_students() or [])
+        enabled_students = set(student_context.enabled_students)
 
         # 2. Check if [MISSING STUDENTS] feature should be included
-        sync_missing_students = is_sync_missing_students_notes()
+        sync_missing_students = student_context.sync_missing_students
 
         add_debug_msg(f"Enabled students in system: {sorted(enabled_students)}")
         add_debug_msg(
@@ -880,6 +1250,31 @@ def create_or_update_notes(
             )
             return stats
 
+        # Unchanged-sheet fast path: same TSV, students, settings and templates
+        # as the last complete sync, and no notes added or removed locally
+        from .config_manager import get_deck_sync_fingerprint
+        from .config_manager import save_deck_sync_fingerprint
+
+        fingerprint = None
+        if deck_url:
+            fingerprint = compute_deck_sync_fingerprint(
+                remoteDeck, enabled_students, sync_missing_students, deck_url
+            )
+            stored = get_deck_sync_fingerprint(deck_url)
+            if (
+                fingerprint
+                and stored
+                and stored.get("fingerprint") == fingerprint
+                and stored.get("note_count") == count_deck_notes(col, deck_id)
+            ):
+                stats.deck_unchanged = True
+                stats.unchanged = stored.get("unchanged", 0)
+                stats.skipped = stored.get("skipped", 0)
+                add_debug_msg(
+                    f"⏭️ Deck unchanged since last sync (fingerprint {fingerprint[:12]}), skipping reconciliation"
+                )
+                return stats
+
         # 4. Create set of all expected student_note_ids for synchronization
         expected_student_note_ids = set()
 
@@ -888,27 +1283,26 @@ def create_or_update_notes(
                  add_debug_msg(f"🔍 First note data keys: {list(note_data.keys())}")
                  add_debug_msg(f"🔍 REVERSE column content: '{note_data.get(cols.reverse, '')}'")
             
-            note_id = note_data.get(cols.identifier, "").strip()
+            info = get_row_info(note_data)
+            note_id = info.note_id
 
             # Skip invalid lines (empty ID)
             if not note_id:
                 continue
 
             # Check if this note should sync
-            sync_value = str(note_data.get(cols.is_sync, "")).strip().lower()
-            if sync_value not in ["true", "1", "yes", "sim"]:
+            if not info.is_sync:
                 continue
 
             # Obtain students list for this note
-            alunos_str = note_data.get(cols.students, "").strip()
-            if not alunos_str:
+            if not info.students:
                 # Note without specific students - check [MISSING S.]
                 if sync_missing_students:
                     student_note_id = f"{DEFAULT_STUDENT}_{note_id}"
                     expected_student_note_ids.add(student_note_id)
                     
                     # Check for Reverse Note for [MISSING STUDENTS]
-                    if note_data.get(cols.reverse, "").strip():
+                    if info.has_reverse:
                         reverse_student_note_id = f"{DEFAULT_STUDENT}_{note_id}_REV"
                         expected_student_note_ids.add(reverse_student_note_id)
                         
@@ -921,18 +1315,15 @@ def create_or_update_notes(
                     )
                 continue
 
-            # Extract individual students (comma separated)
-            students_in_note = [s.strip() for s in alunos_str.split(",") if s.strip()]
-
             # For each enabled student in this note
-            for student in students_in_note:
+            for student in info.students:
                 if student in enabled_students:
                     # Create unique ID student_id
                     student_note_id = f"{student}_{note_id}"
                     expected_student_note_ids.add(student_note_id)
 
                     # Check for Reverse Note
-                    if note_data.get(cols.reverse, "").strip():
+                    if info.has_reverse:
                         reverse_student_note_id = f"{student}_{note_id}_REV"
                         expected_student_note_ids.add(reverse_student_note_id)
 
@@ -974,38 +1365,39 @@ def create_or_update_notes(
         add_debug_msg(
             f"Creating note types for students: {sorted(students_to_create_note_types)}"
         )
+        note_types = NoteTypeResolver(col, deck_url, debug_messages)
         for student in students_to_create_note_types:
-            ensure_custom_models(
-                col, deck_url, student=student, debug_messages=debug_messages
-            )
-            # Ensure reverse model exists too if using reverse notes
-            # We can just call ensure_custom_models and it will handle checking if needed,
-            # but since ensure_custom_models now returns a dict with 'reverse', it's fine.
-            # However, ensure_custom_models creates based on logic that might need specific calls?
-            # Actually ensure_custom_models implementation I updated checks existing notes? No.
-            # I updated ensure_custom_models to ALWAYS check for reverse model. So calling it once is enough.
+            # Resolves the standard, cloze and reverse note types at once
+            note_types.ensure_student(student)
 
         # 4. Get existing notes by student_note_id
         existing_notes = get_existing_notes_by_student_id(col, deck_id)
         add_debug_msg(f"Found {len(existing_notes)} existing notes in deck")
 
         # 5. Process each remote note for each student
+        subdeck_cache = SubdeckCache(col, deck_url)
+        creation_batch = NoteCreationBatch(
+            col,
+            deck_id,
+            deck_url,
+            debug_messages,
+            subdeck_cache=subdeck_cache,
+            note_types=note_types,
+        )
+        update_batch = NoteUpdateBatch(col)
         for note_data in remoteDeck.notes:
-            note_id = note_data.get(cols.identifier, "").strip()
+            info = get_row_info(note_data)
+            note_id = info.note_id
             if not note_id:
                 # Empty ID line is not an error, it's a normal situation already accounted for in metrics
                 continue
 
             # Check if it should sync
-            sync_value = str(note_data.get(cols.is_sync, "")).strip().lower()
-            if sync_value not in ["true", "1", "yes", "sim"]:
+            if not info.is_sync:
                 stats.skipped += 1
                 continue
 
-            # Obtain note students list
-            alunos_str = note_data.get(cols.students, "").strip()
-
-            if not alunos_str:
+            if not info.students:
                 # Note without specific students - check if it should process as [MISSING S.]
                 if sync_missing_students:
                     # Process as [MISSING STUDENTS]
@@ -1021,11 +1413,14 @@ def create_or_update_notes(
                             success, was_updated, changes = (
                                 update_existing_note_for_student(
                                     col,
-                                    existing_notes[student_note_id],
+                                    existing_notes.snapshot(student_note_id),
                                     note_data,
                                     student,
                                     deck_url,
                                     debug_messages,
+                                    update_batch=update_batch,
+                                    subdeck_cache=subdeck_cache,
+                                    note_types=note_types,
                                 )
                             )
                             if success:
@@ -1053,31 +1448,21 @@ def create_or_update_notes(
                                     f"❌ Error updating [MISSING STUDENTS] note: {student_note_id}"
                                 )
                         else:
-                            # Create new note
-                            if create_new_note_for_student(
-                                col,
-                                note_data,
-                                student,
-                                deck_id,
-                                deck_url,
-                                debug_messages,
-                            ):
-                                stats.created += 1
-                                # Capture creation details
-                                creation_detail = {
-                                    "student_note_id": f"{student}_{note_data.get(cols.identifier, '').strip()}",
-                                    "student": student,
-                                    "note_id": note_data.get(cols.identifier, "").strip(),
-                                    "pergunta": note_data.get(cols.question, "")[:100]
-                                    + (
-                                        "..."
-                                        if len(note_data.get(cols.question, "")) > 100
-                                        else ""
-                                    ),
-                                }
-                                stats.creation_details.append(creation_detail)
+                            # Queue new note (created in bulk after the loop)
+                            creation_detail = {
+                                "student_note_id": f"{student}_{note_data.get(cols.identifier, '').strip()}",
+                                "student": student,
+                                "note_id": note_data.get(cols.identifier, "").strip(),
+                                "pergunta": note_data.get(cols.question, "")[:100]
+                                + (
+                                    "..."
+                                    if len(note_data.get(cols.question, "")) > 100
+                                    else ""
+                                ),
+                            }
+                            if creation_batch.add(note_data, student, creation_detail):
                                 add_debug_msg(
-                                    f"✅ [MISSING STUDENTS] note created: {student_note_id}"
+                                    f"🆕 [MISSING STUDENTS] note queued for creation: {student_note_id}"
                                 )
                             else:
                                 stats.add_error(f"Error creating [MISSING STUDENTS] note: {student_note_id}")
@@ -1086,8 +1471,8 @@ def create_or_update_notes(
                                 )
 
                         # Process REVERSE note for [MISSING STUDENTS] if applicable
-                        reverse_content = note_data.get(cols.reverse, "").strip()
-                        if reverse_content:
+                        if info.has_reverse:
+                            reverse_content = note_data.get(cols.reverse, "").strip()
                             # WARNING for reverse-only notes
                             pergunta_content = note_data.get(cols.question, "").strip()
                             if not pergunta_content:
@@ -1103,12 +1488,15 @@ def create_or_update_notes(
                                 success, was_updated, changes = (
                                     update_existing_note_for_student(
                                         col,
-                                        existing_notes[reverse_student_note_id],
+                                        existing_notes.snapshot(reverse_student_note_id),
                                         note_data,
                                         student,
                                         deck_url,
                                         debug_messages,
-                                        is_reverse=True
+                                        is_reverse=True,
+                                        update_batch=update_batch,
+                                        subdeck_cache=subdeck_cache,
+                                        note_types=note_types,
                                     )
                                 )
                                 if success:
@@ -1129,19 +1517,17 @@ def create_or_update_notes(
                                     stats.add_error(f"Error updating [MISSING STUDENTS] reverse note: {reverse_student_note_id}")
                                     add_debug_msg(f"❌ Error updating [MISSING STUDENTS] reverse note: {reverse_student_note_id}")
                             else:
-                                # Create new reverse note
-                                if create_new_note_for_student(
-                                    col, note_data, student, deck_id, deck_url, debug_messages, is_reverse=True
+                                # Queue new reverse note
+                                creation_detail = {
+                                    "student_note_id": reverse_student_note_id,
+                                    "student": student,
+                                    "note_id": note_id,
+                                    "pergunta": note_data.get(cols.reverse, "")[:100] + "...",
+                                }
+                                if creation_batch.add(
+                                    note_data, student, creation_detail, is_reverse=True
                                 ):
-                                    stats.created += 1
-                                    creation_detail = {
-                                        "student_note_id": reverse_student_note_id,
-                                        "student": student,
-                                        "note_id": note_id,
-                                        "pergunta": note_data.get(cols.reverse, "")[:100] + "...",
-                                    }
-                                    stats.creation_details.append(creation_detail)
-                                    add_debug_msg(f"✅ [MISSING STUDENTS] Reverse note created: {reverse_student_note_id}")
+                                    add_debug_msg(f"🆕 [MISSING STUDENTS] Reverse note queued for creation: {reverse_student_note_id}")
                                 else:
                                     stats.add_error(f"Error creating [MISSING STUDENTS] reverse note: {reverse_student_note_id}")
                                     add_debug_msg(f"❌ Error creating [MISSING STUDENTS] reverse note: {reverse_student_note_id}")
@@ -1162,7 +1548,7 @@ def create_or_update_notes(
                 continue
 
             # Process notes with specific students
-            students_in_note = [s.strip() for s in alunos_str.split(",") if s.strip()]
+            students_in_note = info.students
 
             # Process each enabled student
             for student in students_in_note:
@@ -1178,11 +1564,14 @@ def create_or_update_notes(
                         success, was_updated, changes = (
                             update_existing_note_for_student(
                                 col,
-                                existing_notes[student_note_id],
+                                existing_notes.snapshot(student_note_id),
                                 note_data,
                                 student,
                                 deck_url,
                                 debug_messages,
+                                update_batch=update_batch,
+                                subdeck_cache=subdeck_cache,
+                                note_types=note_types,
                             )
                         )
                         if success:
@@ -1206,32 +1595,27 @@ def create_or_update_notes(
                                 f"❌ Error updating note: {student_note_id}"
                             )
                     else:
-                        # Create new note
-                        if create_new_note_for_student(
-                            col, note_data, student, deck_id, deck_url, debug_messages
-                        ):
-                            stats.created += 1
-                            # Capture creation details
-                            creation_detail = {
-                                "student_note_id": student_note_id,
-                                "student": student,
-                                "note_id": note_data.get(cols.identifier, "").strip(),
-                                "pergunta": note_data.get(cols.question, "")[:100]
-                                + (
-                                    "..."
-                                    if len(note_data.get(cols.question, "")) > 100
-                                    else ""
-                                ),
-                            }
-                            stats.creation_details.append(creation_detail)
-                            add_debug_msg(f"✅ Note created: {student_note_id}")
+                        # Queue new note (created in bulk after the loop)
+                        creation_detail = {
+                            "student_note_id": student_note_id,
+                            "student": student,
+                            "note_id": note_data.get(cols.identifier, "").strip(),
+                            "pergunta": note_data.get(cols.question, "")[:100]
+                            + (
+                                "..."
+                                if len(note_data.get(cols.question, "")) > 100
+                                else ""
+                            ),
+                        }
+                        if creation_batch.add(note_data, student, creation_detail):
+                            add_debug_msg(f"🆕 Note queued for creation: {student_note_id}")
                         else:
                             stats.add_error(f"Error creating note: {student_note_id}")
                             add_debug_msg(f"❌ Error creating note: {student_note_id}")
 
                     # Process REVERSE note if applicable
-                    reverse_content = note_data.get(cols.reverse, "").strip()
-                    if reverse_content:
+                    if info.has_reverse:
+                        reverse_content = note_data.get(cols.reverse, "").strip()
                         # WARNING for reverse-only notes
                         pergunta_content = note_data.get(cols.question, "").strip()
                         if not pergunta_content:
@@ -1248,12 +1632,15 @@ def create_or_update_notes(
                                 success, was_updated, changes = (
                                     update_existing_note_for_student(
                                         col,
-                                        existing_notes[reverse_student_note_id],
+                                        existing_notes.snapshot(reverse_student_note_id),
                                         note_data,
                                         student,
                                         deck_url,
                                         debug_messages,
-                                        is_reverse=True
+                                        is_reverse=True,
+                                        update_batch=update_batch,
+                                        subdeck_cache=subdeck_cache,
+                                        note_types=note_types,
                                     )
                                 )
                                 if success:
@@ -1274,19 +1661,17 @@ def create_or_update_notes(
                                     stats.add_error(f"Error updating reverse note: {reverse_student_note_id}")
                                     add_debug_msg(f"❌ Error updating reverse note: {reverse_student_note_id}")
                             else:
-                                # Create new reverse note
-                                if create_new_note_for_student(
-                                    col, note_data, student, deck_id, deck_url, debug_messages, is_reverse=True
+                                # Queue new reverse note
+                                creation_detail = {
+                                    "student_note_id": reverse_student_note_id,
+                                    "student": student,
+                                    "note_id": note_id,
+                                    "pergunta": note_data.get(cols.reverse, "")[:100] + "...",
+                                }
+                                if creation_batch.add(
+                                    note_data, student, creation_detail, is_reverse=True
                                 ):
-                                    stats.created += 1
-                                    creation_detail = {
-                                        "student_note_id": reverse_student_note_id,
-                                        "student": student,
-                                        "note_id": note_id,
-                                        "pergunta": note_data.get(cols.reverse, "")[:100] + "...",
-                                    }
-                                    stats.creation_details.append(creation_detail)
-                                    add_debug_msg(f"✅ Reverse note created: {reverse_student_note_id}")
+                                    add_debug_msg(f"🆕 Reverse note queued for creation: {reverse_student_note_id}")
                                 else:
                                     stats.add_error(f"Error creating reverse note: {reverse_student_note_id}")
                                     add_debug_msg(f"❌ Error creating reverse note: {reverse_student_note_id}")
@@ -1303,53 +1688,44 @@ def create_or_update_notes(
                     add_debug_msg(f"❌ Stack trace: {error_details}")
                     stats.add_error(f"Exception processing {student_note_id}: {str(e)}")
 
+        # 5.1. Add all queued new notes in a single operation
+        created_details, creation_failures = creation_batch.flush()
+        stats.created += len(created_details)
+        stats.creation_details.extend(created_details)
+        for student_note_id, error in creation_failures:
+            stats.add_error(f"Error creating note {student_note_id}: {error}")
+            add_debug_msg(f"❌ Error creating note {student_note_id}: {error}")
+
+        # 5.2. Write queued note updates and card moves in bulk
+        for student_note_id, error in update_batch.flush():
+            # Updates were counted when queued
+            stats.updated -= 1
+            stats.update_details = [
+                detail
+                for detail in stats.update_details
+                if detail["student_note_id"] != student_note_id
+            ]
+            stats.add_error(f"Error updating note {student_note_id}: {error}")
+            add_debug_msg(f"❌ Error updating note {student_note_id}: {error}")
+
         # 6. Separate obsolete notes from disabled students' notes and sync-disabled notes
         all_existing_note_ids = set(existing_notes.keys())
         
         # 6.1. Identify truly obsolete notes (no longer in spreadsheet)
-        notes_really_obsolete = set()
-        notes_from_disabled_students = set()
-        notes_with_sync_disabled = set()  # NEW: Notes with SYNC=false should be preserved
-        
-        for student_note_id in all_existing_note_ids - expected_student_note_ids:
-            # Extract note information
-            if "_" not in student_note_id:
-                notes_really_obsolete.add(student_note_id)
-                continue
-                
-            student_name, note_id = extract_student_from_student_note_id(student_note_id)
-            
-            # Check if note still exists in remote spreadsheet and get its sync status
-            note_exists_in_remote = False
-            note_has_sync_disabled = False
-            for note_data in remoteDeck.notes:
-                remote_note_id = note_data.get(cols.identifier, "").strip()
-                if remote_note_id == note_id:
-                    note_exists_in_remote = True
-                    # Check if SYNC is explicitly disabled for this note
-                    sync_value = str(note_data.get(cols.is_sync, "")).strip().lower()
-                    if sync_value not in ["true", "1", "yes", "sim"]:
-                        note_has_sync_disabled = True
-                    break
-            
-            if not note_exists_in_remote:
-                # Note truly no longer exists in spreadsheet
-                notes_really_obsolete.add(student_note_id)
-                add_debug_msg(f"📝 Obsolete note (removed from spreadsheet): {student_note_id}")
-            elif note_has_sync_disabled:
-                # Note exists but SYNC=false - ALWAYS preserve (user intentionally disabled sync)
-                notes_with_sync_disabled.add(student_note_id)
-                add_debug_msg(f"⏸️ Note with SYNC disabled (preserving): {student_note_id}")
-            else:
-                # Note exists in spreadsheet with SYNC=true, but student was disabled
-                notes_from_disabled_students.add(student_note_id)
-                add_debug_msg(f"👤 Note from disabled student: {student_note_id} (student: {student_name})")
-        
+        (
+            notes_really_obsolete,
+            notes_from_disabled_students,
+            notes_with_sync_disabled,
+        ) = classify_orphaned_notes(
+            all_existing_note_ids - expected_student_note_ids, remoteDeck
+        )
+
         # 6.2. Remove truly obsolete notes (always removes)
         add_debug_msg(f"🗑️ Removing {len(notes_really_obsolete)} obsolete notes (no longer in spreadsheet)")
         for student_note_id in notes_really_obsolete:
             try:
                 note_to_delete = existing_notes[student_note_id]
+                student_name, note_id = extract_student_from_student_note_id(student_note_id)
                 if delete_note_by_id(col, note_to_delete):
                     stats.deleted += 1
                     # Extract question text for better logging
@@ -1383,6 +1759,7 @@ def create_or_update_notes(
                 for student_note_id in notes_from_disabled_students:
                     try:
                         note_to_delete = existing_notes[student_note_id]
+                        student_name, note_id = extract_student_from_student_note_id(student_note_id)
                         if delete_note_by_id(col, note_to_delete):
                             stats.deleted += 1
                             # Extract question text for better logging
@@ -1441,6 +1818,21 @@ def create_or_update_notes(
             f"🎯 Synchronization complete: +{stats.created} ~{stats.updated} ={stats.unchanged} -{stats.deleted} !{stats.errors}"
         )
 
+        # 9. Remember the fingerprint of a clean sync for the fast path
+        if deck_url:
+            if fingerprint and stats.errors == 0:
+                save_deck_sync_fingerprint(
+                    deck_url,
+                    {
+                        "fingerprint": fingerprint,
+                        "note_count": count_deck_notes(col, deck_id),
+                        "unchanged": stats.created + stats.updated + stats.unchanged,
+                        "skipped": stats.skipped,
+                    },
+                )
+            else:
+                save_deck_sync_fingerprint(deck_url, None)
+
         return stats
 
     except Exception as e:
@@ -1490,35 +1882,143 @@ def extract_student_from_student_note_id(student_note_id):
     return student, note_id
 
 
+class NoteSnapshot:
+    """
+    Read-only view of an existing note built from its row in the notes table.
+
+    Supports what note_fields_need_update and the note type check read from a
+    Note (field access, tags, mid, id), so notes that did not change are
+    compared without loading an Anki Note.
+    """
+
+    __slots__ = ("id", "mid", "tags", "_fields")
+
+    def __init__(self, note_id, mid, fields, tags):
+        """
+        Args:
+            note_id (int): Anki note ID
+            mid (int): Note type ID
+            fields (dict): Mapping {field name: raw field value}
+            tags (list): Note tags
+        """
+        self.id = note_id
+        self.mid = mid
+        self.tags = tags
+        self._fields = fields
+
+    def __contains__(self, field_name):
+        return field_name in self._fields
+
+    def __getitem__(self, field_name):
+        return self._fields[field_name]
+
+    def keys(self):
+        return list(self._fields)
+
+
+class ExistingNotes(Mapping):
+    """
+    Read-only mapping {student_note_id: Note} of the notes already in a deck.
+
+    Only note IDs and their raw rows are kept up front; each Anki Note is
+    loaded on first access, so notes that are never updated or deleted are
+    never materialized. snapshot() gives a lightweight view for comparisons.
+    """
+
+    def __init__(self, col, note_ids_by_student_id=None, raw_notes=None, field_names=None):
+        """
+        Args:
+            col: Anki collection
+            note_ids_by_student_id (dict): Mapping {student_note_id: Anki note ID}
+            raw_notes (dict, optional): Mapping {Anki note ID: (mid, flds, tags)}
+                from the notes table
+            field_names (dict, optional): Mapping {mid: [field names]}
+        """
+        self._col = col
+        self._note_ids = note_ids_by_student_id or {}
+        self._raw_notes = raw_notes or {}
+        self._field_names = field_names or {}
+        self._notes = {}
+
+    def __getitem__(self, student_note_id):
+        note = self._notes.get(student_note_id)
+        if note is None:
+            note = self._col.get_note(self._note_ids[student_note_id])
+            self._notes[student_note_id] = note
+        return note
+
+    def __contains__(self, student_note_id):
+        return student_note_id in self._note_ids
+
+    def __iter__(self):
+        return iter(self._note_ids)
+
+    def __len__(self):
+        return len(self._note_ids)
+
+    def get_note_id(self, student_note_id):
+        """Returns the Anki note ID without loading the note."""
+        return self._note_ids[student_note_id]
+
+    def snapshot(self, student_note_id):
+        """
+        Returns a view of the note for comparison without loading it.
+
+        Args:
+            student_note_id (str): Note key ("{student}_{id}")
+
+        Returns:
+            NoteSnapshot or Note: The snapshot, or the loaded Note if the note
+                was already loaded or its raw row is unknown
+        """
+        note = self._notes.get(student_note_id)
+        if note is not None:
+            return note
+        nid = self._note_ids[student_note_id]
+        raw = self._raw_notes.get(nid)
+        field_names = self._field_names.get(raw[0]) if raw else None
+        if not field_names:
+            return self[student_note_id]
+        mid, flds, tags = raw
+        return NoteSnapshot(nid, mid, dict(zip(field_names, flds.split("\x1f"))), tags.split())
+
+
+def _ids_to_sql(ids):
+    return "(" + ",".join(str(int(i)) for i in ids) + ")"
+
+
 def get_existing_notes_by_student_id(col, deck_id):
     """
     Obtains mapping of existing notes in the deck by student_note_id.
 
     REFACTORED LOGIC:
-    - Search for all notes in the deck and subdecks
-    - For each note, extract the note ID from the ID field
-    - Derives the student from the name of the subdeck where the note is located
+    - Search for all notes in the deck and subdecks (one find_notes call)
+    - Read the ID field of all notes with a single query on the notes table
+    - For old-format IDs, derive the student from the name of the subdeck
+      where the note's first card is located
     - Creates the student_note_id as "{student}_{note_id}"
-    - Returns mapping {student_note_id: note_object}
+    - Returns a lazy mapping {student_note_id: note_object}
 
     Args:
         col: Anki collection
         deck_id (int): Deck ID
 
     Returns:
-        dict: Mapping {student_note_id: note_object} where student_note_id = "student_note_id"
+        ExistingNotes: Mapping {student_note_id: note_object} where student_note_id = "student_note_id"
     """
-    existing_notes = {}
+    note_ids_by_student_id = {}
+    raw_notes = {}
+    field_names = {}
 
     try:
         # Get the main deck
         deck = col.decks.get(deck_id)
         if not deck:
-            return existing_notes
+            return ExistingNotes(col, note_ids_by_student_id)
 
         deck_name = deck["name"]
 
-        # Search for cards in the main deck AND in all subdecks
+        # Search for notes in the main deck AND in all subdecks
         # Escape double quotes in deck name to avoid search errors
         escaped_deck_name = deck_name.replace('"', '\\"')
         search_query = f'deck:"{escaped_deck_name}" OR deck:"{escaped_deck_name}::*"'
@@ -1528,53 +2028,92 @@ def get_existing_notes_by_student_id(col, deck_id):
             add_debug_msg(f"[DECK_SEARCH] Error: Deck name is empty, using ID search", category="DECK_BUILD")
             search_query = f'deck:{deck_id}'
         
-        card_ids = col.find_cards(search_query)
+        note_ids = col.find_notes(search_query)
+        if not note_ids:
+            return ExistingNotes(col, note_ids_by_student_id)
+
+        # Position of the ID field per note type (None if the type has no ID field)
+        id_field_ords = {}
+        old_format_ids = {}
 
-        for card_id in card_ids:
+        for nid, mid, flds, tags in col.db.all(
+            f"select id, mid, flds, tags from notes where id in {_ids_to_sql(note_ids)}"
+        ):
             try:
-                card = col.get_card(card_id)
-                note = card.note()
-
-                # Get note ID from ID field
-                note_fields = note.keys()
-                if cols.identifier in note_fields:
-                    full_note_id = note[cols.identifier].strip()
-                    if full_note_id:
-                        # The ID field already contains the "{student}_{note_id}" format after refactoring
-                        # Check if it has the expected format
-                        if "_" in full_note_id:
-                            # Use note ID directly as student_note_id
-                            student_note_id = full_note_id
-                            existing_notes[student_note_id] = note
-                        else:
-                            # Old format - try to extract from subdeck as fallback
-                            card_deck = col.decks.get(card.did)
-                            if card_deck:
-                                subdeck_name = card_deck["name"]
-                                # Expected structure: Sheets2Anki::Remote::Student::Importance::...
-                                deck_parts = subdeck_name.split("::")
-                                if len(deck_parts) >= 3:
-                                    student = deck_parts[
-                                        2
-                                    ]  # Third element is the student
-                                    student_note_id = f"{student}_{full_note_id}"
-                                    existing_notes[student_note_id] = note
+                if mid not in id_field_ords:
+                    model = col.models.get(mid)
+                    field_names[mid] = [f["name"] for f in model["flds"]] if model else []
+                    id_field_ords[mid] = (
+                        field_names[mid].index(cols.identifier)
+                        if cols.identifier in field_names[mid]
+                        else None
+                    )
+
+                field_ord = id_field_ords[mid]
+                if field_ord is None:
+                    continue
+
+                fields = flds.split("\x1f")
+                if field_ord >= len(fields):
+                    continue
+
+                full_note_id = fields[field_ord].strip()
+                if not full_note_id:
+                    continue
+                raw_notes[nid] = (mid, flds, tags)
+
+                # The ID field already contains the "{student}_{note_id}" format after refactoring
+                if "_" in full_note_id:
+                    note_ids_by_student_id[full_note_id] = nid
+                else:
+                    old_format_ids[nid] = full_note_id
 
             except Exception as e:
-                add_debug_msg(f"Error processing card {card_id}: {e}", category="DECK_SEARCH")
+                add_debug_msg(f"Error processing note {nid}: {e}", category="DECK_SEARCH")
                 continue
 
+        if old_format_ids:
+            # Old format - try to extract student from subdeck as fallback
+            deck_names = {}
+            for nid, did in col.db.all(
+                f"select nid, did from cards where nid in {_ids_to_sql(old_format_ids)} order by nid, ord"
+            ):
+                full_note_id = old_format_ids.pop(nid, None)
+                if full_note_id is None:
+                    continue  # Only the first card of each note is used
+
+                if did not in deck_names:
+                    card_deck = col.decks.get(did)
+                    deck_names[did] = card_deck["name"] if card_deck else None
+
+                subdeck_name = deck_names[did]
+                if subdeck_name:
+                    # Expected structure: Sheets2Anki::Remote::Student::Importance::...
+                    deck_parts = subdeck_name.split("::")
+                    if len(deck_parts) >= 3:
+                        student = deck_parts[2]  # Third element is the student
+                        note_ids_by_student_id[f"{student}_{full_note_id}"] = nid
+
     except Exception as e:
         add_debug_msg(f"Error obtaining existing notes: {e}", category="DECK_SEARCH")
 
-    return existing_notes
+    return ExistingNotes(col, note_ids_by_student_id, raw_notes, field_names)
 
 
-def create_new_note_for_student(
-    col, note_data, student, deck_id, deck_url, debug_messages=None, is_reverse=False
+def prepare_new_note_for_student(
+    col,
+    note_data,
+    student,
+    deck_id,
+    deck_url,
+    debug_messages=None,
+    is_reverse=False,
+    remote_deck_name=None,
+    subdeck_cache=None,
+    note_types=None,
 ):
     """
-    Creates a new Anki note for a specific student.
+    Builds (without adding) a new Anki note for a specific student.
 
     Args:
         col: Anki collection
@@ -1583,9 +2122,15 @@ def create_new_note_for_student(
         deck_id (int): Base deck ID
         deck_url (str): Remote deck URL
         debug_messages (list, optional): Debug list
+        is_reverse (bool): Build the reverse note
+        remote_deck_name (str, optional): Remote deck name, if already known
+        subdeck_cache (SubdeckCache, optional): Subdecks resolved earlier in
+            the sync
+        note_types (NoteTypeResolver, optional): Note types resolved earlier
+            in the sync
 
     Returns:
-        bool: True if created successfully, False otherwise
+        tuple: (note, target_deck_id), or None if the note could not be built
     """
 
     def add_debug_msg(message, category="CREATE_NOTE_STUDENT"):
@@ -1595,48 +2140,53 @@ def create_new_note_for_student(
         add_debug_message(message, category)
 
     try:
-        note_id = note_data.get(cols.identifier, "").strip()
+        info = get_row_info(note_data)
+        note_id = info.note_id
         add_debug_msg(f"Creating new note for student {student}: {note_id}")
 
         # Determine note type (cloze or basic)
-        pergunta = note_data.get(cols.question, "")
-        resposta = note_data.get(cols.answer, "")
-        is_cloze = has_cloze_deletion(pergunta) or has_cloze_deletion(resposta)
-
-        # Get appropriate model for the specific student
-        from .config_manager import get_deck_remote_name
-        from .utils import get_note_type_name
-
-        remote_deck_name = get_deck_remote_name(deck_url)
-        note_type_name = get_note_type_name(
-            deck_url, remote_deck_name, student=student, is_cloze=is_cloze, is_reverse=is_reverse
-        )
+        is_cloze = info.is_cloze
 
-        add_debug_msg(f"Note type for {student}: {note_type_name}")
+        model = None
+        if note_types is not None:
+            model = note_types.get_model(student, is_cloze=is_cloze, is_reverse=is_reverse)
 
-        model = col.models.by_name(note_type_name)
         if not model:
-            add_debug_msg(
-                f"❌ ERROR: Model not found: '{note_type_name}' for student: {student}"
+            # Get appropriate model for the specific student
+            from .config_manager import get_deck_remote_name
+            from .utils import get_note_type_name
+
+            if remote_deck_name is None:
+                remote_deck_name = get_deck_remote_name(deck_url)
+            note_type_name = get_note_type_name(
+                deck_url, remote_deck_name, student=student, is_cloze=is_cloze, is_reverse=is_reverse
             )
-            add_debug_msg(f"❌ Attempting to create note type for note: {note_id}")
-            # Attempt to create model if it doesn't exist
-            from .templates_and_definitions import ensure_custom_models
 
-            models = ensure_custom_models(
-                col, deck_url, student=student, debug_messages=debug_messages
-            )
-            model = models.get("reverse" if is_reverse else ("cloze" if is_cloze else "standard"))
+            add_debug_msg(f"Note type for {student}: {note_type_name}")
+
+            model = col.models.by_name(note_type_name)
             if not model:
                 add_debug_msg(
-                    f"❌ CRITICAL ERROR: Could not create/find model: {note_type_name}"
+                    f"❌ ERROR: Model not found: '{note_type_name}' for student: {student}"
                 )
-                return False
-            add_debug_msg(f"✅ Model created successfully: {note_type_name}")
+                add_debug_msg(f"❌ Attempting to create note type for note: {note_id}")
+                # Attempt to create model if it doesn't exist
+                from .templates_and_definitions import ensure_custom_models
 
-        add_debug_msg(
-            f"✅ Model found: {note_type_name} (ID: {model['id'] if model else 'None'})"
-        )
+                models = ensure_custom_models(
+                    col, deck_url, student=student, debug_messages=debug_messages
+                )
+                model = models.get("reverse" if is_reverse else ("cloze" if is_cloze else "standard"))
+                if not model:
+                    add_debug_msg(
+                        f"❌ CRITICAL ERROR: Could not create/find model: {note_type_name}"
+                    )
+                    return None
+                add_debug_msg(f"✅ Model created successfully: {note_type_name}")
+
+            add_debug_msg(
+                f"✅ Model found: {note_type_name} (ID: {model['id'] if model else 'None'})"
+            )
 
         # Create note
         note = col.new_note(model)
@@ -1654,21 +2204,12 @@ def create_new_note_for_student(
             f"Determining target deck for note: {note_id}, student: {student}"
         )
         target_deck_id = determine_target_deck_for_student(
-            col, deck_id, note_data, student, deck_url, debug_messages
+            col, deck_id, note_data, student, deck_url, debug_messages,
+            subdeck_cache=subdeck_cache,
         )
         add_debug_msg(f"Target deck determined: {target_deck_id}")
 
-        # Add note to deck
-        add_debug_msg(
-            f"Adding note {note_id} of student {student} to deck {target_deck_id}"
-        )
-        col.add_note(note, target_deck_id)
-        add_debug_msg(
-            f"✅ Note {note_id} of student {student} successfully added to deck {target_deck_id}"
-        )
-
-        add_debug_msg(f"✅ Note successfully created for {student}: {note_id}")
-        return True
+        return note, target_deck_id
 
     except Exception as e:
         import traceback
@@ -1683,8 +2224,247 @@ def create_new_note_for_student(
             category="CREATE_NOTE"
         )
         add_debug_msg(f"[CREATE_NOTE_ERROR] Stack trace: {error_details}", category="CREATE_NOTE")
+        return None
+
+
+def create_new_note_for_student(
+    col, note_data, student, deck_id, deck_url, debug_messages=None, is_reverse=False
+):
+    """
+    Creates a new Anki note for a specific student.
+
+    Args:
+        col: Anki collection
+        note_data (dict): Spreadsheet note data
+        student (str): Student name
+        deck_id (int): Base deck ID
+        deck_url (str): Remote deck URL
+        debug_messages (list, optional): Debug list
+
+    Returns:
+        bool: True if created successfully, False otherwise
+    """
+    prepared = prepare_new_note_for_student(
+        col, note_data, student, deck_id, deck_url, debug_messages, is_reverse=is_reverse
+    )
+    if prepared is None:
         return False
 
+    note, target_deck_id = prepared
+    note_id = note_data.get(cols.identifier, "").strip()
+    try:
+        col.add_note(note, target_deck_id)
+        add_debug_msg(
+            f"✅ Note {note_id} of student {student} successfully added to deck {target_deck_id}",
+            category="CREATE_NOTE_STUDENT",
+        )
+        return True
+    except Exception as e:
+        add_debug_msg(
+            f"[CREATE_NOTE_ERROR] {note_id} for {student}: {e}", category="CREATE_NOTE"
+        )
+        return False
+
+
+class NoteTypeResolver:
+    """
+    Sync-scoped map from (student, kind) to note type, kind being
+    "standard", "cloze" or "reverse".
+
+    Each student's note types are resolved with a single ensure_custom_models
+    call; later lookups are dict hits. The cache is dropped only when a note
+    type is created or renamed (see mark_note_types_changed).
+    """
+
+    def __init__(self, col, deck_url, debug_messages=None):
+        """
+        Args:
+            col: Anki collection
+            deck_url (str): Remote deck URL
+            debug_messages (list, optional): Debug list
+        """
+        self.col = col
+        self.deck_url = deck_url
+        self.debug_messages = debug_messages
+        self._models = {}  # (student, kind) -> model
+        self._generation = get_note_types_generation()
+
+    @staticmethod
+    def get_kind(is_cloze=False, is_reverse=False):
+        """
+        Returns the kind of note type used for a note.
+
+        Args:
+            is_cloze (bool): Cloze note
+            is_reverse (bool): Reverse note
+
+        Returns:
+            str: "reverse", "cloze" or "standard"
+        """
+        if is_reverse:
+            return "reverse"
+        return "cloze" if is_cloze else "standard"
+
+    def invalidate(self):
+        """Forgets all resolved note types."""
+        self._models.clear()
+        self._generation = get_note_types_generation()
+
+    def ensure_student(self, student):
+        """
+        Resolves (creating them if needed) all note types of a student.
+
+        Args:
+            student (str): Student name
+        """
+        if self._generation != get_note_types_generation():
+            self.invalidate()
+        if (student, "standard") in self._models:
+            return
+
+        models = ensure_custom_models(
+            self.col, self.deck_url, student=student, debug_messages=self.debug_messages
+        )
+        # Models created by the call above are already in the result
+        self._generation = get_note_types_generation()
+        for kind, model in models.items():
+            self._models[(student, kind)] = model
+
+    def get_model(self, student, is_cloze=False, is_reverse=False):
+        """
+        Returns the note type of a student for a kind of note.
+
+        Args:
+            student (str): Student name
+            is_cloze (bool): Cloze note
+            is_reverse (bool): Reverse note
+
+        Returns:
+            dict: Anki note type, or None if it could not be resolved
+        """
+        self.ensure_student(student)
+        return self._models.get((student, self.get_kind(is_cloze, is_reverse)))
+
+
+class NoteCreationBatch:
+    """
+    Collects the new notes of a deck sync and adds them to the collection
+    with a single add_notes call (one undoable operation).
+
+    Note types and the remote deck name are resolved once per batch instead
+    of once per note. If the bulk insert fails, notes are added one by one
+    so that a single bad note does not abort the others.
+    """
+
+    def __init__(
+        self, col, deck_id, deck_url, debug_messages=None, subdeck_cache=None, note_types=None
+    ):
+        """
+        Args:
+            col: Anki collection
+            deck_id (int): Base deck ID
+            deck_url (str): Remote deck URL
+            debug_messages (list, optional): Debug list
+            subdeck_cache (SubdeckCache, optional): Sync-scoped subdeck IDs;
+                one is created for the batch if not given
+            note_types (NoteTypeResolver, optional): Sync-scoped note types;
+                one is created for the batch if not given
+        """
+        self.col = col
+        self.deck_id = deck_id
+        self.deck_url = deck_url
+        self.debug_messages = debug_messages
+        self._pending = []  # (student_note_id, note, target_deck_id, detail)
+        self._subdecks = subdeck_cache or SubdeckCache(col, deck_url)
+        self._note_types = note_types or NoteTypeResolver(col, deck_url, debug_messages)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, note_data, student, detail, is_reverse=False):
+        """
+        Builds a note and queues it for creation.
+
+        Args:
+            note_data (dict): Spreadsheet note data
+            student (str): Student name
+            detail (dict): Creation detail reported once the note is added;
+                must contain "student_note_id"
+            is_reverse (bool): Build the reverse note
+
+        Returns:
+            bool: True if the note was queued, False if it could not be built
+        """
+        prepared = prepare_new_note_for_student(
+            self.col,
+            note_data,
+            student,
+            self.deck_id,
+            self.deck_url,
+            self.debug_messages,
+            is_reverse=is_reverse,
+            remote_deck_name=self._subdecks.remote_deck_name,
+            subdeck_cache=self._subdecks,
+            note_types=self._note_types,
+        )
+        if prepared is None:
+            return False
+
+        note, target_deck_id = prepared
+        self._pending.append((detail["student_note_id"], note, target_deck_id, detail))
+        return True
+
+    def flush(self):
+        """
+        Adds all queued notes to the collection.
+
+        Returns:
+            tuple: (created_details, failures) where created_details is the list
+                of details of the notes added and failures a list of
+                (student_note_id, error message)
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return [], []
+
+        # Group by target deck and note type
+        groups = {}
+        for item in pending:
+            _, note, target_deck_id, _ = item
+            groups.setdefault((target_deck_id, getattr(note, "mid", None)), []).append(item)
+        pending = [item for items in groups.values() for item in items]
+        add_debug_msg(
+            f"🆕 Adding {len(pending)} new notes in {len(groups)} deck/note type group(s)",
+            category="CREATE_NOTE",
+        )
+
+        try:
+            from anki.collection import AddNoteRequest
+
+            self.col.add_notes(
+                [
+                    AddNoteRequest(note=note, deck_id=target_deck_id)
+                    for _, note, target_deck_id, _ in pending
+                ]
+            )
+            return [detail for _, _, _, detail in pending], []
+        except Exception as e:
+            add_debug_msg(
+                f"⚠️ Bulk note creation failed ({e}), adding notes individually",
+                category="CREATE_NOTE",
+            )
+
+        created_details = []
+        failures = []
+        for student_note_id, note, target_deck_id, detail in pending:
+            try:
+                self.col.add_note(note, target_deck_id)
+                created_details.append(detail)
+            except Exception as e:
+                failures.append((student_note_id, str(e)))
+
+        return created_details, failures
+
 
 def note_fields_need_update(existing_note, new_data, debug_messages=None, student=None, is_reverse=False):
     """
@@ -1696,7 +2476,7 @@ def note_fields_need_update(existing_note, new_data, debug_messages=None, studen
     - Does not compare the ID field as it is derived and should remain unchanged
 
     Args:
-        existing_note: Existing Anki note
+        existing_note: Existing Anki note or NoteSnapshot
         new_data (dict): New note data
         debug_messages (list, optional): Debug list
         student (str, optional): Student name to form unique ID for comparison
@@ -1804,7 +2584,16 @@ def note_fields_need_update(existing_note, new_data, debug_messages=None, studen
 
 
 def update_existing_note_for_student(
-    col, existing_note, new_data, student, deck_url, debug_messages=None, is_reverse=False
+    col,
+    existing_note,
+    new_data,
+    student,
+    deck_url,
+    debug_messages=None,
+    is_reverse=False,
+    update_batch=None,
+    subdeck_cache=None,
+    note_types=None,
 ):
     """
     Updates an existing note for a specific student.
@@ -1812,11 +2601,18 @@ def update_existing_note_for_student(
 
     Args:
         col: Anki collection
-        existing_note: Existing Anki note
+        existing_note: Existing Anki note, or a NoteSnapshot that is only
+            loaded when the note has to change
         new_data (dict): New note data
         student (str): Student name
         deck_url (str): Deck URL
         debug_messages (list, optional): Debug list
+        update_batch (NoteUpdateBatch, optional): If given, the note and its card
+            moves are queued and only written when the batch is flushed
+        subdeck_cache (SubdeckCache, optional): Subdecks resolved earlier in
+            the sync
+        note_types (NoteTypeResolver, optional): Note types resolved earlier
+            in the sync
 
     Returns:
         tuple: (success: bool, was_updated: bool, changes: list)
@@ -1834,27 +2630,29 @@ def update_existing_note_for_student(
             f"Checking if note {note_id} needs update for student {student}"
         )
 
-        # Determine expected note type
-        pergunta = new_data.get(cols.question, "")
-        resposta = new_data.get(cols.answer, "")
-        
-        # Cloze detection: check both fields
-        is_cloze = has_cloze_deletion(pergunta) or has_cloze_deletion(resposta)
+        # Determine expected note type (cloze detection checks both fields)
+        is_cloze = get_row_info(new_data).is_cloze
         
         # Get appropriate model for the current student/state
-        models = ensure_custom_models(col, deck_url, student=student, debug_messages=debug_messages)
-        target_model = models.get("reverse" if is_reverse else ("cloze" if is_cloze else "standard"))
+        if note_types is None:
+            note_types = NoteTypeResolver(col, deck_url, debug_messages)
+        target_model = note_types.get_model(student, is_cloze=is_cloze, is_reverse=is_reverse)
         
         # Check for real differences between existing note and new data
         # We MUST do this before type change to capture field differences
         needs_update, changes = note_fields_need_update(
             existing_note, new_data, debug_messages, student=student, is_reverse=is_reverse
         )
-        
+        type_changed = bool(target_model) and existing_note.mid != target_model["id"]
+
+        if (needs_update or type_changed) and isinstance(existing_note, NoteSnapshot):
+            # Only notes that actually change are loaded from the collection
+            existing_note = col.get_note(existing_note.id)
+
         # Check if note type needs to be changed (e.g. Basic -> Cloze)
         # This check is now outside the 'needs_update' return to ensure type is corrected 
         # even if content is already identical (e.g. failed previous sync or manual change)
-        if target_model and existing_note.mid != target_model["id"]:
+        if type_changed:
             old_type_name = existing_note.note_type()["name"]
             new_type_name = target_model["name"]
             
@@ -1914,20 +2712,33 @@ def update_existing_note_for_student(
 
         # Check if needs moving to different subdeck
         cards = existing_note.cards()
+        target_deck_id = None
         if cards:
             current_deck_id = cards[0].did
             target_deck_id = determine_target_deck_for_student(
-                col, current_deck_id, new_data, student, deck_url, debug_messages
+                col, current_deck_id, new_data, student, deck_url, debug_messages,
+                subdeck_cache=subdeck_cache,
+            )
+            if current_deck_id == target_deck_id:
+                target_deck_id = None
+
+        if update_batch is not None:
+            student_note_id = f"{student}_{note_id}" + ("_REV" if is_reverse else "")
+            update_batch.add(
+                student_note_id,
+                existing_note,
+                [card.id for card in cards] if target_deck_id else None,
+                target_deck_id,
             )
+            add_debug_msg(f"📝 Note update queued for {student}: {note_id}")
+            return True, True, changes
 
-            if current_deck_id != target_deck_id:
-                # Move cards to new deck
-                for card in cards:
-                    card.did = target_deck_id
-                    col.update_card(card)
+        if target_deck_id:
+            # Move cards to new deck
+            col.set_deck([card.id for card in cards], target_deck_id)
 
         # Save note changes
-        existing_note.flush()
+        col.update_note(existing_note)
 
         add_debug_msg(f"✅ Note successfully updated for {student}: {note_id}")
         return True, True, changes  # Success, was updated, with changes list
@@ -1937,6 +2748,94 @@ def update_existing_note_for_student(
         return False, False, []  # Error, no changes
 
 
+class NoteUpdateBatch:
+    """
+    Collects modified notes and card moves of a deck sync and writes them
+    with one update_notes call and one set_deck call per target deck.
+
+    If a bulk call fails, the affected notes are written one by one so that
+    failures can be reported per note.
+    """
+
+    def __init__(self, col):
+        """
+        Args:
+            col: Anki collection
+        """
+        self.col = col
+        self._notes = []  # (student_note_id, note)
+        self._moves = {}  # target_deck_id -> [(student_note_id, card_ids)]
+
+    def __len__(self):
+        return len(self._notes)
+
+    def add(self, student_note_id, note, card_ids=None, target_deck_id=None):
+        """
+        Queues a modified note and, optionally, a move of its cards.
+
+        Args:
+            student_note_id (str): Unique student note ID (for error reports)
+            note: Modified Anki note
+            card_ids (list, optional): IDs of the note's cards to move
+            target_deck_id (int, optional): Deck the cards should be moved to
+        """
+        self._notes.append((student_note_id, note))
+        if card_ids and target_deck_id:
+            self._moves.setdefault(target_deck_id, []).append((student_note_id, card_ids))
+
+    def flush(self):
+        """
+        Writes all queued note updates and card moves.
+
+        Returns:
+            list: (student_note_id, error message) for each note that could not
+                be fully written
+        """
+        notes, self._notes = self._notes, []
+        moves, self._moves = self._moves, {}
+        failures = {}
+
+        if notes:
+            add_debug_msg(
+                f"📝 Writing {len(notes)} updated notes and moving cards to {len(moves)} deck(s)",
+                category="UPDATE_NOTE",
+            )
+            try:
+                self.col.update_notes([note for _, note in notes])
+            except Exception as e:
+                add_debug_msg(
+                    f"⚠️ Bulk note update failed ({e}), updating notes individually",
+                    category="UPDATE_NOTE",
+                )
+                for student_note_id, note in notes:
+                    try:
+                        self.col.update_note(note)
+                    except Exception as note_error:
+                        failures[student_note_id] = str(note_error)
+
+        for target_deck_id, entries in moves.items():
+            try:
+                self.col.set_deck(
+                    [card_id for _, card_ids in entries for card_id in card_ids],
+                    target_deck_id,
+                )
+            except Exception as e:
+                add_debug_msg(
+                    f"⚠️ Bulk card move to deck {target_deck_id} failed ({e}), moving cards individually",
+                    category="UPDATE_NOTE",
+                )
+                for student_note_id, card_ids in entries:
+                    try:
+                        self.col.set_deck(card_ids, target_deck_id)
+                    except Exception as move_error:
+                        failures.setdefault(
+                            student_note_id,
+                            f"could not move cards to deck {target_deck_id}: {move_error}",
+                        )
+
+        return list(failures.items())
+
+
 def delete_note_by_id(col, note):
     """
     Removes a note from Anki.
@@ -2020,8 +2919,104 @@ def fill_note_fields_for_student(note, note_data, student, is_reverse=False):
             note[field_name] = field_mappings[field_name]
 
 
+class SubdeckCache:
+    """
+    Sync-scoped map from (student, hierarchy) to subdeck ID.
+
+    The collection's deck names are read once with all_names_and_ids() and
+    the remote deck name once per deck sync, so targeting a note at a subdeck
+    that was already seen is a dict lookup. Missing subdecks are created on
+    first use and remembered.
+    """
+
+    def __init__(self, col, deck_url, remote_deck_name=None):
+        """
+        Args:
+            col: Anki collection
+            deck_url (str): Remote deck URL
+            remote_deck_name (str, optional): Remote deck name, if already known
+        """
+        self.col = col
+        self.deck_url = deck_url
+        self._remote_deck_name = remote_deck_name
+        self._deck_ids_by_name = None  # lowercase deck name -> deck ID
+        self._deck_ids = {}  # (student, subdeck_path) -> deck ID
+
+    def __len__(self):
+        return len(self._deck_ids)
+
+    @property
+    def remote_deck_name(self):
+        if self._remote_deck_name is None:
+            from .config_manager import get_deck_remote_name
+
+            self._remote_deck_name = get_deck_remote_name(self.deck_url)
+        return self._remote_deck_name
+
+    def _load_deck_names(self):
+        self._deck_ids_by_name = {}
+        try:
+            for deck in self.col.decks.all_names_and_ids():
+                self._deck_ids_by_name[deck.name.lower()] = deck.id
+        except Exception as e:
+            add_debug_msg(f"Could not preload deck names: {e}", "DECK_TARGET_STUDENT")
+
+    def get_subdeck_name(self, note_data, student):
+        """
+        Builds the full subdeck name of a note for a student.
+
+        Args:
+            note_data (dict): Note data
+            student (str): Student name
+
+        Returns:
+            str: Sheets2Anki::{remote}::{student}::{hierarchy} subdeck name
+        """
+        return get_subdeck_name(
+            f"Sheets2Anki::{self.remote_deck_name}", note_data, student=student
+        )
+
+    def get_deck_id(self, note_data, student):
+        """
+        Returns the subdeck ID of a note for a student, creating the subdeck
+        if it does not exist yet.
+
+        Args:
+            note_data (dict): Note data
+            student (str): Student name
+
+        Returns:
+            int: Subdeck ID, or None if it could not be created
+        """
+        key = (student, get_hierarchy_names(note_data).subdeck_path)
+        deck_id = self._deck_ids.get(key)
+        if deck_id is not None:
+            return deck_id
+
+        if self._deck_ids_by_name is None:
+            self._load_deck_names()
+
+        subdeck_name = self.get_subdeck_name(note_data, student)
+        deck_id = self._deck_ids_by_name.get(subdeck_name.lower())
+        if deck_id is None:
+            deck_id = self.col.decks.id_for_name(subdeck_name)
+        if deck_id is None:
+            deck_id = self.col.decks.id(subdeck_name)
+            add_debug_msg(f"Created subdeck: {subdeck_name}", "DECK_TARGET_STUDENT")
+        if deck_id:
+            self._deck_ids_by_name[subdeck_name.lower()] = deck_id
+            self._deck_ids[key] = deck_id
+        return deck_id
+
+
 def determine_target_deck_for_student(
-    col, base_deck_id, note_data, student, deck_url, debug_messages=None
+    col,
+    base_deck_id,
+    note_data,
+    student,
+    deck_url,
+    debug_messages=None,
+    subdeck_cache=None,
 ):
     """
     Determines the target deck for a specific student.
@@ -2033,6 +3028,8 @@ def determine_target_deck_for_student(
         student (str): Student name
         deck_url (str): Deck URL
         debug_messages (list, optional): Debug list
+        subdeck_cache (SubdeckCache, optional): Subdecks resolved earlier in
+            the sync; skips the deck and meta.json lookups
 
     Returns:
         int: Target deck ID
@@ -2044,6 +3041,13 @@ def determine_target_deck_for_student(
 
         add_debug_message(message, category)
 
+    if subdeck_cache is not None:
+        try:
+            return subdeck_cache.get_deck_id(note_data, student) or base_deck_id
+        except Exception as e:
+            add_debug_msg(f"Error determining target deck for student {student}: {e}")
+            return base_deck_id
+
     try:
         # Get base deck
         base_deck = col.decks.get(base_deck_id)
@@ -5,13 +5,16 @@ This module provides a single and consistent interface for generating
 confirmation messages when student data needs to be removed.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .compat import MessageBox_Yes, MessageBox_Cancel, safe_exec_dialog
 from .styled_messages import StyledMessageBox
 from .templates_and_definitions import DEFAULT_STUDENT
 
 
-def generate_data_removal_confirmation_message(students_to_remove: List[str]) -> str:
+def generate_data_removal_confirmation_message(
+    students_to_remove: List[str],
+    plan_summary: Optional[Dict[str, int]] = None
+) -> str:
     """
     Generates the standard confirmation message for student data removal.
     
@@ -20,6 +23,8 @@ def generate_data_removal_confirmation_message(students_to_remove: List[str]) ->
     
     Args:
         students_to_remove: List of student/feature names to be removed
+        plan_summary: Counts from the cleanup dry run ({'notes', 'decks',
+            'note_types'}); when given, the message shows the exact amounts
         
     Returns:
         str: Formatted message for display
@@ -31,15 +36,26 @@ def generate_data_removal_confirmation_message(students_to_remove: List[str]) ->
     unique_students = sorted(list(set(students_to_remove)))
     students_list = "\n".join([f"• {student}" for student in unique_students])
     
+    if plan_summary is not None:
+        data_list = (
+            f"• {plan_summary.get('notes', 0)} notes and their cards\n"
+            f"• {plan_summary.get('decks', 0)} empty decks\n"
+            f"• {plan_summary.get('note_types', 0)} note types\n\n"
+        )
+    else:
+        data_list = (
+            f"• All student notes\n"
+            f"• All student cards\n"
+            f"• All student decks\n"
+            f"• All student note types\n\n"
+        )
+    
     message = (
         f"⚠️ WARNING: PERMANENT DATA REMOVAL ⚠️\n\n"
         f"The following students have been removed from the sync list:\n\n"
         f"{students_list}\n\n"
         f"🗑️ DATA THAT WILL BE PERMANENTLY DELETED:\n"
-        f"• All student notes\n"
-        f"• All student cards\n"
-        f"• All student decks\n"
-        f"• All student note types\n\n"
+        f"{data_list}"
         f"❌ THIS ACTION IS IRREVERSIBLE!\n\n"
         f"Do you want to continue with the data removal?"
     )
@@ -50,7 +66,8 @@ def generate_data_removal_confirmation_message(students_to_remove: List[str]) ->
 def show_data_removal_confirmation_dialog(
     students_to_remove: List[str], 
     window_title: str = "Confirm Permanent Data Removal",
-    parent=None
+    parent=None,
+    plan_summary: Optional[Dict[str, int]] = None
 ) -> int:
     """
     Shows the confirmation dialog for student data removal.
@@ -66,6 +83,7 @@ def show_data_removal_confirmation_dialog(
         students_to_remove: List of student/feature names to be removed
         window_title: Window title (optional)
         parent: Parent widget (optional)
+        plan_summary: Counts from the cleanup dry run (optional)
         
     Returns:
         int: Dialog result code (MessageBox_Yes or MessageBox_Cancel)
@@ -74,7 +92,9 @@ def show_data_removal_confirmation_dialog(
         return False
     
     # Generate message using centralized function
-    message = generate_data_removal_confirmation_message(students_to_remove)
+    message = generate_data_removal_confirmation_message(
+        students_to_remove, plan_summary
+    )
     
     # Create custom buttons (simplified to 2 options)
     buttons = [
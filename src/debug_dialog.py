@@ -22,6 +22,7 @@ from .compat import (
     Palette_Window,
 )
 from .utils import (
+    flush_debug_log,
     get_debug_log_path,
     is_debug_enabled,
     clear_debug_log,
@@ -341,6 +342,7 @@ class DebugModeDialog(QDialog):
     def _load_log_content(self):
         """Loads and displays the debug log content."""
         try:
+            flush_debug_log()
             log_path = get_debug_log_path()
             self.path_label.setText(f"📄 Log file: {log_path}")
             
@@ -747,32 +747,81 @@ class DeckNameManager:
     # =============================================================================
 
     @staticmethod
-    def extract_remote_name_from_url(url: str) -> str:
+    def extract_remote_name_from_url(url: str, tsv_response=None) -> str:
         """
         Extracts remote deck name using multiple strategies.
 
+        Titles are cached in meta.json, so in steady state the name costs no
+        request beyond the TSV download itself.
+
         Args:
             url: Google Sheets URL
+            tsv_response: TsvResponse already downloaded for this deck (optional);
+                its Content-Disposition header validates the cached title
 
         Returns:
             Extracted remote name or fallback
         """
+        name, title, content_disposition = DeckNameManager.lookup_remote_name(
+            url, tsv_response
+        )
+        if title:
+            from .config_manager import save_cached_spreadsheet_title
+
+            save_cached_spreadsheet_title(url, title, content_disposition)
+        return name
+
+    @staticmethod
+    def lookup_remote_name(
+        url: str, tsv_response=None
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Resolves the remote deck name without writing meta.json.
+
+        Safe to call from worker threads; the caller persists the returned
+        title with save_cached_spreadsheet_title on the main thread.
+
+        Args:
+            url: Google Sheets URL
+            tsv_response: TsvResponse already downloaded for this deck (optional)
+
+        Returns:
+            Tuple (remote name, title to cache or None, Content-Disposition header);
+            only titles scraped from the spreadsheet HTML are cached
+        """
         try:
+            from .config_manager import get_cached_spreadsheet_title
+
+            content_disposition = DeckNameManager._get_response_content_disposition(
+                tsv_response
+            )
+
+            # Strategy 0: Cached title
+            title = get_cached_spreadsheet_title(url, content_disposition)
+            if title:
+                return DeckNameManager.clean_name(title), None, content_disposition
+
             # Strategy 1: Spreadsheet title via HTML
             title = DeckNameManager._extract_spreadsheet_title(url)
             if title and title != "auto name fail":
-                return DeckNameManager.clean_name(title)
+                return DeckNameManager.clean_name(title), title, content_disposition
 
             # Strategy 2: Filename via Content-Disposition
-            filename = DeckNameManager._extract_filename_from_headers(url)
+            if content_disposition:
+                filename = DeckNameManager._parse_content_disposition_filename(
+                    content_disposition
+                )
+            else:
+                filename = DeckNameManager._extract_filename_from_headers(url)
             if filename and filename != "auto name fail":
-                return DeckNameManager.clean_name(filename)
+                # Not cached: the HTML title is retried on the next sync
+                return DeckNameManager.clean_name(filename), None, content_disposition
 
             # Strategy 3: Fallback to spreadsheet ID and GID
-            return DeckNameManager._generate_fallback_name(url)
+            return DeckNameManager._generate_fallback_name(url), None, content_disposition
 
         except Exception:
-            return "auto name fatal fail"
+            return "auto name fatal fail", None, None
 
     @staticmethod
     def generate_local_name(
@@ -1243,6 +1292,33 @@ class DeckNameManager:
         except Exception:
             return None
 
+    @staticmethod
+    def _get_response_content_disposition(tsv_response) -> Optional[str]:
+        """Gets the Content-Disposition header of an already downloaded TSV response."""
+        if tsv_response is None or not getattr(tsv_response, "headers", None):
+            return None
+
+        for name, value in tsv_response.headers.items():
+            if name.lower() == "content-disposition":
+                return value or None
+
+        return None
+
+    @staticmethod
+    def _parse_content_disposition_filename(content_disposition: str) -> Optional[str]:
+        """Extracts the filename (without .tsv) from a Content-Disposition header."""
+        match = re.search(
+            r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', content_disposition
+        )
+        if match:
+            filename = match.group(1).strip("\"'")
+            if filename:
+                if filename.lower().endswith(".tsv"):
+                    filename = filename[:-4]
+                return filename
+
+        return None
+
     @staticmethod
     def _extract_filename_from_headers(url: str) -> Optional[str]:
         """Extracts filename via headers."""
@@ -1255,15 +1331,9 @@ class DeckNameManager:
             with urllib.request.urlopen(request, timeout=10) as response:
                 content_disposition = response.headers.get("Content-Disposition", "")
                 if content_disposition:
-                    match = re.search(
-                        r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', content_disposition
+                    return DeckNameManager._parse_content_disposition_filename(
+                        content_disposition
                     )
-                    if match:
-                        filename = match.group(1).strip("\"'")
-                        if filename:
-                            if filename.lower().endswith(".tsv"):
-                                filename = filename[:-4]
-                            return filename
 
                 return None
 
@@ -5,6 +5,8 @@ This module implements an interface for globally configuring which students
 should be synchronized across all remote decks.
 """
 
+import threading
+
 from .compat import CustomContextMenu
 from .compat import DialogAccepted
 from .compat import Horizontal
@@ -20,17 +22,28 @@ from .compat import QInputDialog
 from .compat import QLabel
 from .compat import QListWidget
 from .compat import QMenu
+from .compat import QObject
 from .compat import QPushButton
 from .styled_messages import StyledMessageBox
 from .compat import QSplitter
 from .compat import QVBoxLayout
 from .compat import QWidget
 from .compat import safe_exec_dialog
+from .compat import pyqtSignal
 from .compat import safe_exec_menu
 from .templates_and_definitions import DEFAULT_STUDENT
+from .config_manager import discover_all_students_from_remote_decks
 from .config_manager import get_global_student_config
+from .config_manager import get_remote_decks
+from .config_manager import merge_discovered_students
 from .config_manager import save_global_student_config
-from .config_manager import update_available_students_from_discovery
+
+
+class StudentDiscoverySignals(QObject):
+    """Qt signals used by the discovery worker to report to the dialog."""
+
+    deck_discovered = pyqtSignal(str, object, object, int, int)  # deck name, students, error, done, total
+    finished = pyqtSignal(object, object)  # discovered students, error
 
 
 class GlobalStudentConfigDialog(QDialog):
@@ -51,6 +64,11 @@ class GlobalStudentConfigDialog(QDialog):
         # List of available students (loaded from configuration)
         self.available_students = set()
 
+        # Background student discovery (Auto-Discover button)
+        self._discovery_thread = None
+        self._discovery_signals = None
+        self._discovery_errors = []
+
         # Detect dark mode
         palette = self.palette()
         bg_color = palette.color(Palette_Window)
@@ -278,11 +296,11 @@ class GlobalStudentConfigDialog(QDialog):
             }}
         """
 
-        auto_discover_btn = QPushButton("🔍 Auto-Discover Students")
-        auto_discover_btn.setStyleSheet(btn_style)
-        auto_discover_btn.setToolTip("Discover students from all configured remote decks")
-        auto_discover_btn.clicked.connect(self._auto_discover_students)
-        action_layout.addWidget(auto_discover_btn)
+        self.auto_discover_btn = QPushButton("🔍 Auto-Discover Students")
+        self.auto_discover_btn.setStyleSheet(btn_style)
+        self.auto_discover_btn.setToolTip("Discover students from all configured remote decks")
+        self.auto_discover_btn.clicked.connect(self._auto_discover_students)
+        action_layout.addWidget(self.auto_discover_btn)
 
         add_manual_btn = QPushButton("➕ Add Student...")
         add_manual_btn.setStyleSheet(btn_style)
@@ -416,9 +434,83 @@ class GlobalStudentConfigDialog(QDialog):
         return panel
 
     def _auto_discover_students(self):
-        """Automatically discovers students from all remote decks."""
+        """
+        Automatically discovers students from all remote decks.
+
+        The decks are downloaded on a background thread, so Anki stays
+        responsive; students appear in the available list as each deck
+        finishes, and the configuration is saved once at the end. Results
+        that arrive after the dialog was closed are ignored (see done()).
+        """
+        if self._discovery_thread is not None and self._discovery_thread.is_alive():
+            return
+
         try:
-            discovered_students, new_count = update_available_students_from_discovery()
+            remote_decks = get_remote_decks()
+        except Exception as e:
+            StyledMessageBox.warning(
+                self, "Search Error", f"Error discovering students: {str(e)}"
+            )
+            return
+
+        signals = StudentDiscoverySignals()
+        signals.deck_discovered.connect(self._on_deck_discovered)
+        signals.finished.connect(self._on_discovery_finished)
+        self._discovery_signals = signals
+        self._discovery_errors = []
+
+        def report_deck(deck_name, students, error, done, total):
+            signals.deck_discovered.emit(
+                deck_name, students, str(error) if error else None, done, total
+            )
+
+        def run_discovery():
+            try:
+                students = discover_all_students_from_remote_decks(
+                    remote_decks, on_deck_discovered=report_deck
+                )
+                signals.finished.emit(students, None)
+            except Exception as e:
+                signals.finished.emit([], e)
+
+        self.auto_discover_btn.setEnabled(False)
+        self.auto_discover_btn.setText(f"🔍 Discovering... (0/{len(remote_decks)})")
+
+        self._discovery_thread = threading.Thread(
+            target=run_discovery, name="Sheets2AnkiStudentDiscovery", daemon=True
+        )
+        self._discovery_thread.start()
+
+    def _on_deck_discovered(self, deck_name, students, error, done, total):
+        """Shows the students of a deck as soon as it has been downloaded."""
+        if self._discovery_signals is None:
+            return  # Dialog already closed
+
+        self.auto_discover_btn.setText(f"🔍 Discovering... ({done}/{total})")
+
+        if error:
+            self._discovery_errors.append(f"{deck_name}: {error}")
+
+        for student in sorted(students):
+            if not self._student_name_exists(student):
+                self._add_to_available_sorted(student)
+                self.available_students.add(student)
+
+    def _on_discovery_finished(self, discovered, error):
+        """Saves the discovered students and reports the result."""
+        if self._discovery_signals is None:
+            return  # Dialog already closed
+
+        self.auto_discover_btn.setEnabled(True)
+        self.auto_discover_btn.setText("🔍 Auto-Discover Students")
+        self._discovery_thread = None
+        self._discovery_signals = None
+
+        try:
+            if error is not None:
+                raise error
+
+            discovered_students, new_count = merge_discovered_students(discovered)
             self._load_current_config()
 
             if new_count > 0:
@@ -426,6 +518,11 @@ class GlobalStudentConfigDialog(QDialog):
             else:
                 message = f"Search completed!\nNo new students found.\nTotal available students: {len(discovered_students)}"
 
+            if self._discovery_errors:
+                message += "\n\nDecks that could not be read:\n" + "\n".join(
+                    self._discovery_errors
+                )
+
             StyledMessageBox.information(
                 self, 
                 "Automatic Search", 
@@ -609,6 +706,18 @@ class GlobalStudentConfigDialog(QDialog):
         filter_enabled = True
         return selected_students, filter_enabled
 
+    def done(self, result):
+        """Detaches a running discovery so its results are ignored once closed."""
+        signals, self._discovery_signals = self._discovery_signals, None
+        if signals is not None:
+            try:
+                signals.deck_discovered.disconnect(self._on_deck_discovered)
+                signals.finished.disconnect(self._on_discovery_finished)
+            except (TypeError, RuntimeError):
+                pass
+        self._discovery_thread = None
+        super().done(result)
+
     def accept(self):
         """Saves configuration and closes dialog."""
         selected_students, filter_enabled = self.get_selected_config()
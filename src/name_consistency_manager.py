@@ -7,6 +7,7 @@ from aqt import mw
 from anki.decks import DeckId
 from anki.models import NotetypeId
 from .templates_and_definitions import DEFAULT_STUDENT
+from .templates_and_definitions import mark_note_types_changed
 
 class NameConsistencyManager:
     """
@@ -243,6 +244,7 @@ class NameConsistencyManager:
                         debug_callback(f"📝 Updating note type: '{model['name']}' → '{expected_name}'")
                         model['name'] = expected_name
                         mw.col.models.save(model)
+                        mark_note_types_changed()
                         updated_types.append({
                             'id': note_type_id,
                             'old_name': current_name,
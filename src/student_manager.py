@@ -13,10 +13,13 @@ Main features:
 """
 
 import re
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from .templates_and_definitions import DEFAULT_STUDENT
 from . import templates_and_definitions as cols
@@ -44,6 +47,13 @@ from .config_manager import save_meta
 from .utils import add_debug_message
 
 
+# Placeholders under which notes without a student are synced (current and legacy)
+MISSING_STUDENT_PLACEHOLDERS = (DEFAULT_STUDENT, "[MISSING STUDENTS]", "[MISSING S.]")
+
+# Suffixes of the note types created per deck and student
+STUDENT_NOTE_TYPE_KINDS = ("Basic", "Cloze", "Reverse")
+
+
 def add_debug_msg(message, category="STUDENT_MANAGER"):
     """Local helper for debug messages."""
     add_debug_message(message, category)
@@ -207,20 +217,99 @@ def extract_students_from_remote_data(remote_deck) -> Set[str]:
     if not hasattr(remote_deck, "notes") or not remote_deck.notes:
         return students
 
-    for note_data in remote_deck.notes:
-        students_field = note_data.get(cols.students, "").strip()
+    from .data_processor import get_row_info
 
-        if students_field:
-            # Separate multiple students by comma
-            students_list = [s.strip() for s in students_field.split(",") if s.strip()]
-            for student in students_list:
-                if student:
-                    # Add student name (case-sensitive)
-                    students.add(student)
+    for note_data in remote_deck.notes:
+        # Students are split once per row at parse time (case-sensitive)
+        students.update(get_row_info(note_data).students)
 
     return students
 
 
+@dataclass
+class StudentSyncContext:
+    """
+    Student configuration of one sync, read from a single meta.json snapshot.
+
+    Every sync stage asks this object for the students of a deck instead of
+    re-reading the global and per-deck configuration.
+    """
+
+    enabled_students: Set[str]
+    sync_missing_students: bool
+    deck_selections: Dict[str, Optional[List[str]]] = field(default_factory=dict)
+    _selected_by_url: Dict[str, Set[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_meta(cls, meta: Optional[Dict] = None) -> "StudentSyncContext":
+        """
+        Builds the context from meta.json.
+
+        Args:
+            meta (Optional[Dict]): meta.json contents; read when not given
+
+        Returns:
+            StudentSyncContext: Configuration snapshot
+        """
+        if meta is None:
+            meta = get_meta()
+
+        student_config = meta.get("students", {})
+        return cls(
+            enabled_students=set(student_config.get("enabled_students") or []),
+            sync_missing_students=bool(
+                student_config.get("sync_missing_students_notes", False)
+            ),
+            deck_selections={
+                spreadsheet_id: deck_config.get("student_selection")
+                for spreadsheet_id, deck_config in meta.get("decks", {}).items()
+                if isinstance(deck_config, dict)
+            },
+        )
+
+    @property
+    def effective_students(self) -> Set[str]:
+        """Globally enabled students, plus DEFAULT_STUDENT if the feature is on."""
+        students = set(self.enabled_students)
+        if self.sync_missing_students:
+            students.add(DEFAULT_STUDENT)
+        return students
+
+    def get_selected_students(self, deck_url: str) -> Set[str]:
+        """
+        Gets the selected students for a deck, resolved once per deck.
+
+        Args:
+            deck_url (str): URL of the remote deck
+
+        Returns:
+            Set[str]: Selected students (including DEFAULT_STUDENT if applicable)
+        """
+        selected = self._selected_by_url.get(deck_url)
+        if selected is None:
+            from .config_manager import get_deck_id
+
+            student_selection = self.deck_selections.get(get_deck_id(deck_url))
+
+            # If no specific selection for the deck, use global configuration
+            if student_selection is None:
+                selected = set(self.enabled_students)
+            elif isinstance(student_selection, (list, set)):
+                selected = set(student_selection)
+            else:
+                selected = set()
+
+            # Include [MISSING STUDENTS] if the feature is activated
+            if self.sync_missing_students:
+                selected.add(DEFAULT_STUDENT)
+
+            self._selected_by_url[deck_url] = selected
+
+        return set(selected)
+
+
 def get_selected_students_for_deck(deck_url: str) -> Set[str]:
     """
     Gets the selected students for a specific deck.
@@ -234,33 +323,7 @@ def get_selected_students_for_deck(deck_url: str) -> Set[str]:
     Returns:
         Set[str]: Set of selected students for this deck (including [MISSING S.] if applicable)
     """
-    from .config_manager import get_deck_id
-    from .config_manager import get_enabled_students
-    from .config_manager import is_sync_missing_students_notes
-
-    meta = get_meta()
-
-    # Navigate through structure: decks -> spreadsheet_id -> student_selection
-    spreadsheet_id = get_deck_id(deck_url)
-    deck_config = meta.get("decks", {}).get(spreadsheet_id, {})
-    student_selection = deck_config.get("student_selection")
-
-    # If no specific selection for the deck, use global configuration
-    if student_selection is None:
-        global_enabled = get_enabled_students()
-        selected_students = set(global_enabled) if global_enabled else set()
-    else:
-        # Convert to set if it's a list
-        if isinstance(student_selection, list):
-            selected_students = set(student_selection)
-        else:
-            selected_students = student_selection if isinstance(student_selection, set) else set()
-
-    # NEW: Include [MISSING STUDENTS] if the feature is activated
-    if is_sync_missing_students_notes():
-        selected_students.add(DEFAULT_STUDENT)
-
-    return selected_students
+    return StudentSyncContext.from_meta().get_selected_students(deck_url)
 
 
 def save_selected_students_for_deck(deck_url: str, selected_students: Set[str]):
@@ -599,72 +662,81 @@ def _fallback_url_conversion(url: str) -> str:
         return url
 
 
+def extract_students_from_tsv_chunks(chunks) -> Set[str]:
+    """
+    Collects the unique students of a TSV export, reading only the STUDENTS column.
+
+    Rows are split with csv.reader (quoted multi-line cells stay intact), but
+    no row dictionaries are built and the other cells are never touched.
+
+    Args:
+        chunks: Iterable of UTF-8 encoded bytes-like chunks
+
+    Returns:
+        Set[str]: Set of unique student names found
+    """
+    import csv
+
+    from .data_processor import iter_tsv_lines
+
+    reader = csv.reader(iter_tsv_lines(chunks), delimiter="\t")
+    headers = next((row for row in reader if row), None)
+    if not headers or cols.students not in headers:
+        return set()
+
+    students_index = headers.index(cols.students)
+    students_cells = set()
+    for row in reader:
+        if students_index < len(row) and row[students_index]:
+            students_cells.add(row[students_index])
+
+    # Rows often share the same STUDENTS cell, so each distinct cell is split once
+    students = set()
+    for students_str in students_cells:
+        for student in students_str.split(","):
+            student = student.strip()
+            if student:
+                students.add(student)
+
+    return students
+
+
 def discover_students_from_tsv_url(url: str) -> Set[str]:
     """
     Discovers unique students from a Google Sheets TSV URL.
 
+    The download goes through fetch_tsv_response, so an unchanged sheet is
+    served from the shared TSV cache. Safe to call from worker threads.
+
     Args:
         url (str): Google Sheets TSV URL
 
     Returns:
         Set[str]: Set of unique student names found
     """
+    import urllib.error
+    import urllib.request
+
     try:
-        
-        # First, validate and convert URL using centralized function
-        from .utils import validate_url
-        
+        # Validate and download with a single request using centralized function
+        from .utils import fetch_tsv_response
+
         try:
-            tsv_url = validate_url(url)
+            chunks = fetch_tsv_response(url).iter_chunks()
         except ValueError:
             # Fallback to previous method if validation fails
             tsv_url = _convert_to_tsv_export_url(url)
 
-        # Necessary imports
-        try:
-            import csv
-            import urllib.request
-            from io import StringIO
-        except ImportError:
-            return set()
-
-        # Download TSV data with appropriate headers
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Sheets2Anki) AnkiAddon"
-        }
-        request = urllib.request.Request(tsv_url, headers=headers)
-        
-        with urllib.request.urlopen(request, timeout=30) as response:
-            data = response.read().decode("utf-8")
-
-        # Parse CSV/TSV
-        csv_reader = csv.DictReader(StringIO(data), delimiter="\t")
-
-        students = set()
-        row_count = 0
-
-        # Check headers first
-        fieldnames = csv_reader.fieldnames
+            # Download TSV data with appropriate headers
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Sheets2Anki) AnkiAddon"
+            }
+            request = urllib.request.Request(tsv_url, headers=headers)
 
-        if not fieldnames or cols.students not in fieldnames:
-            return set()
+            with urllib.request.urlopen(request, timeout=30) as response:
+                chunks = [response.read()]
 
-        # Search for STUDENTS column
-        for row in csv_reader:
-            row_count += 1
-
-            # Check if STUDENTS column exists and has content
-            if cols.students in row and row[cols.students]:
-                # Extract students (may be comma separated)
-                students_str = row[cols.students].strip()
-                if students_str:
-                    # Split by comma and clean spaces
-                    for student in students_str.split(","):
-                        student = student.strip()
-                        if student:
-                            students.add(student)
-
-        return students
+        return extract_students_from_tsv_chunks(chunks)
 
     except urllib.error.HTTPError:
         return set()
@@ -676,21 +748,362 @@ def discover_students_from_tsv_url(url: str) -> Set[str]:
         return set()
 
 
+def _scan_student_notes(
+    col, students: Set[str]
+) -> Tuple[Dict[str, List[int]], Dict[int, int], Dict[int, str]]:
+    """
+    Reads the notes of all Sheets2Anki note types once and sorts them by student.
+
+    Args:
+        col: Anki collection
+        students (Set[str]): Student names
+
+    Returns:
+        Tuple: ({student: [note ids]}, {note type id: notes NOT belonging to
+            the students}, {note type id: name} of the Sheets2Anki note types)
+    """
+    note_ids_by_student: Dict[str, List[int]] = {}
+    remaining_by_mid: Dict[int, int] = {}
+
+    # Position of the ID field per Sheets2Anki note type
+    note_type_names = {}
+    id_field_ords = {}
+    for entry in col.models.all_names_and_ids():
+        if not entry.name.startswith(cols.DEFAULT_PARENT_DECK_NAME):
+            continue
+        note_type_names[entry.id] = entry.name
+        model = col.models.get(entry.id)
+        field_names = [f["name"] for f in model["flds"]] if model else []
+        if cols.identifier in field_names:
+            id_field_ords[entry.id] = field_names.index(cols.identifier)
+
+    if not students or not note_type_names:
+        return note_ids_by_student, remaining_by_mid, note_type_names
+
+    # Longest names first, so "Ann_Lee_" wins over "Ann_"
+    prefixes = sorted((f"{student}_" for student in students), key=len, reverse=True)
+    prefix_tuple = tuple(prefixes)
+    mids_sql = "(" + ",".join(str(int(mid)) for mid in note_type_names) + ")"
+
+    for nid, mid, flds in col.db.all(
+        f"select id, mid, flds from notes where mid in {mids_sql}"
+    ):
+        fields = flds.split("\x1f")
+        field_ord = id_field_ords.get(mid)
+        note_unique_id = ""
+        if field_ord is not None and field_ord < len(fields):
+            note_unique_id = fields[field_ord].strip()
+
+        if not note_unique_id.startswith(prefix_tuple):
+            remaining_by_mid[mid] = remaining_by_mid.get(mid, 0) + 1
+            continue
+
+        for prefix in prefixes:
+            if note_unique_id.startswith(prefix):
+                note_ids_by_student.setdefault(prefix[:-1], []).append(nid)
+                break
+
+    return note_ids_by_student, remaining_by_mid, note_type_names
+
+
+def find_student_note_ids(col, students: Set[str]) -> Dict[str, List[int]]:
+    """
+    Finds the notes of the given students by their unique ID field.
+
+    Only notes of Sheets2Anki note types are read, with one query on the notes
+    table; every student prefix ("{student}_") is matched in the same pass.
+
+    Args:
+        col: Anki collection
+        students (Set[str]): Student names
+
+    Returns:
+        Dict[str, List[int]]: {student: [note ids]}; a note whose ID matches
+            several students is attributed to the longest name
+    """
+    return _scan_student_notes(col, students)[0]
+
+
+@dataclass
+class CleanupPlan:
+    """Notes, decks and note types a student data cleanup will remove."""
+
+    students: Set[str]
+    note_ids_by_student: Dict[str, List[int]] = field(default_factory=dict)
+    decks: List[Tuple[int, str]] = field(default_factory=list)
+    note_types: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def note_ids(self) -> List[int]:
+        """All note IDs to remove, grouped by student in name order."""
+        return [
+            nid
+            for student in sorted(self.note_ids_by_student)
+            for nid in self.note_ids_by_student[student]
+        ]
+
+    def is_empty(self) -> bool:
+        """Checks if the plan removes nothing."""
+        return not (self.note_ids_by_student or self.decks or self.note_types)
+
+    def summary(self) -> Dict[str, int]:
+        """Counts shown in the removal confirmation dialog."""
+        return {
+            "notes": len(self.note_ids),
+            "decks": len(self.decks),
+            "note_types": len(self.note_types),
+        }
+
+
+def _get_student_from_note_type_name(note_type_name: str) -> Optional[str]:
+    """
+    Extracts the student of a "Sheets2Anki - {deck} - {student} - {kind}" name.
+
+    The deck name may contain " - ", so the name is parsed from the end.
+
+    Args:
+        note_type_name (str): Note type name
+
+    Returns:
+        Optional[str]: Student name, or None if the name is not a student note type
+    """
+    if not note_type_name.startswith(f"{cols.DEFAULT_PARENT_DECK_NAME} - "):
+        return None
+
+    parts = note_type_name.split(" - ")
+    if len(parts) < 4 or parts[-1].strip() not in STUDENT_NOTE_TYPE_KINDS:
+        return None
+
+    return parts[-2].strip()
+
+
+def _match_student_note_types(
+    note_type_ids_by_name: Dict[str, int],
+    students: Set[str],
+    deck_names: Optional[List[str]],
+) -> List[Tuple[int, str, str]]:
+    """
+    Resolves the note types of the given students from a name-to-ID index.
+
+    The expected "Sheets2Anki - {deck} - {student} - {kind}" names are looked
+    up directly; note types of other decks (renamed or removed decks) are
+    then found by parsing the remaining names once.
+
+    Args:
+        note_type_ids_by_name (Dict[str, int]): {note type name: note type id}
+        students (Set[str]): Student names
+        deck_names (Optional[List[str]]): Remote deck names
+
+    Returns:
+        List[Tuple[int, str, str]]: (note type id, name, match reason), by name
+    """
+    matches = {}
+    for deck_name in deck_names or []:
+        for student in students:
+            for kind in STUDENT_NOTE_TYPE_KINDS:
+                name = f"{cols.DEFAULT_PARENT_DECK_NAME} - {deck_name} - {student} - {kind}"
+                note_type_id = note_type_ids_by_name.get(name)
+                if note_type_id:
+                    matches[name] = (note_type_id, name, f"deck pattern for '{student}'")
+
+    for name, note_type_id in note_type_ids_by_name.items():
+        if name in matches or not note_type_id:
+            continue
+        student = _get_student_from_note_type_name(name)
+        if student in students:
+            matches[name] = (note_type_id, name, f"orphaned note type for student '{student}'")
+
+    return [matches[name] for name in sorted(matches)]
+
+
+def plan_student_note_types(
+    col, students: Set[str], deck_names: Optional[List[str]] = None
+) -> List[Tuple[int, str, str]]:
+    """
+    Finds the note types of any number of students with one note type listing.
+
+    Args:
+        col: Anki collection
+        students (Set[str]): Student names
+        deck_names (Optional[List[str]]): Remote deck names (preferred targets)
+
+    Returns:
+        List[Tuple[int, str, str]]: (note type id, name, match reason), by name
+    """
+    if not students:
+        return []
+
+    note_type_ids_by_name = {
+        entry.name: entry.id for entry in col.models.all_names_and_ids()
+    }
+    return _match_student_note_types(note_type_ids_by_name, set(students), deck_names)
+
+
+def _plan_empty_student_decks(
+    col, students: Set[str], deck_names: Optional[List[str]], removed_note_ids: Set[int]
+) -> List[Tuple[int, str]]:
+    """
+    Finds the student subdecks left without notes once the plan's notes are gone.
+
+    Args:
+        col: Anki collection
+        students (Set[str]): Student names
+        deck_names (Optional[List[str]]): Remote deck names whose student decks
+            are considered; None matches the students' decks under any deck
+        removed_note_ids (Set[int]): Notes the plan removes
+
+    Returns:
+        List[Tuple[int, str]]: (deck id, deck name) of the decks to remove
+    """
+    if deck_names is None:
+        markers = tuple(f"::{student}::" for student in students)
+        is_student_deck = lambda name: any(marker in name for marker in markers)
+    else:
+        prefixes = tuple(
+            f"{cols.DEFAULT_PARENT_DECK_NAME}::{deck_name}::{student}::"
+            for deck_name in deck_names
+            for student in students
+        )
+        is_student_deck = lambda name: name.startswith(prefixes)
+
+    candidates = {
+        deck.name: deck.id
+        for deck in col.decks.all_names_and_ids()
+        if is_student_deck(deck.name)
+    }
+    if not candidates:
+        return []
+
+    # A deck search also matches subdecks and cards moved to filtered decks,
+    # so a card that stays keeps its deck and every candidate parent alive
+    dids_sql = "(" + ",".join(str(int(did)) for did in candidates.values()) + ")"
+    names_by_id = {did: name for name, did in candidates.items()}
+    kept = set()
+    for did, odid, nid in col.db.all(
+        f"select did, odid, nid from cards where did in {dids_sql} or odid in {dids_sql}"
+    ):
+        if nid in removed_note_ids:
+            continue
+        for deck_id in (did, odid):
+            name = names_by_id.get(deck_id)
+            while name is not None and name not in kept:
+                kept.add(name)
+                name = name.rpartition("::")[0]
+                if name not in candidates:
+                    break
+
+    return [(did, name) for name, did in sorted(candidates.items()) if name not in kept]
+
+
+def plan_students_cleanup(
+    col, students: Set[str], deck_names: Optional[List[str]] = None
+) -> CleanupPlan:
+    """
+    Computes everything a cleanup of the given students would remove.
+
+    This is a dry run: the notes of all Sheets2Anki note types are read once
+    and nothing is modified. A note type is only planned for removal when
+    all of its notes are removed with it.
+
+    Args:
+        col: Anki collection
+        students (Set[str]): Students (or missing student placeholders) to clean
+        deck_names (Optional[List[str]]): Remote deck names whose student decks
+            are pruned; None prunes the students' decks under any deck
+
+    Returns:
+        CleanupPlan: Notes, decks and note types to remove
+    """
+    plan = CleanupPlan(students=set(students))
+    if not plan.students:
+        return plan
+
+    note_ids_by_student, remaining_by_mid, note_type_names = _scan_student_notes(
+        col, plan.students
+    )
+    plan.note_ids_by_student = note_ids_by_student
+    plan.decks = _plan_empty_student_decks(
+        col, plan.students, deck_names, set(plan.note_ids)
+    )
+    note_type_ids_by_name = {name: mid for mid, name in note_type_names.items()}
+    plan.note_types = [
+        (mid, name)
+        for mid, name, _ in _match_student_note_types(
+            note_type_ids_by_name, plan.students, deck_names
+        )
+        if not remaining_by_mid.get(mid)
+    ]
+
+    add_debug_msg(
+        f"🧾 CLEANUP PLAN: {sorted(plan.students)} -> {plan.summary()}"
+    )
+    return plan
+
+
+def execute_cleanup_plan(col, plan: CleanupPlan) -> Dict[str, int]:
+    """
+    Removes the notes, decks and note types of a cleanup plan.
+
+    Notes and decks are each removed with a single call.
+
+    Args:
+        col: Anki collection
+        plan (CleanupPlan): Plan from plan_students_cleanup
+
+    Returns:
+        Dict[str, int]: Removal statistics {
+            'notes_removed': int,
+            'decks_removed': int,
+            'note_types_removed': int
+        }
+    """
+    stats = {"notes_removed": 0, "decks_removed": 0, "note_types_removed": 0}
+
+    note_ids = plan.note_ids
+    if note_ids:
+        add_debug_msg(f"🗑️ CLEANUP: Removing {len(note_ids)} notes...")
+        col.remove_notes(note_ids)
+        stats["notes_removed"] = len(note_ids)
+
+    if plan.decks:
+        from anki.decks import DeckId
+
+        col.decks.remove([DeckId(did) for did, _ in plan.decks])
+        stats["decks_removed"] = len(plan.decks)
+        for _, deck_name in plan.decks:
+            add_debug_msg(f"   🗑️ Empty deck removed: '{deck_name}'")
+
+    if plan.note_types:
+        from anki.models import NotetypeId
+
+        for note_type_id, note_type_name in plan.note_types:
+            try:
+                col.models.remove(NotetypeId(note_type_id))
+                stats["note_types_removed"] += 1
+                add_debug_msg(f"   🗑️ Note type removed: '{note_type_name}'")
+            except Exception as e:
+                add_debug_msg(f"   ❌ Error removing note type '{note_type_name}': {e}")
+
+    return stats
+
+
 def cleanup_disabled_students_data(
-    disabled_students: Set[str], deck_names: List[str]
+    disabled_students: Set[str],
+    deck_names: List[str],
+    plan: Optional[CleanupPlan] = None,
 ) -> Dict[str, int]:
     """
     Removes all data for disabled students: notes, cards, note types and decks.
 
-    REFATURED LOGIC to work with unique IDs {student}_{id}:
-    - Searches for notes by unique ID using {student}_{id} format
-    - Removes notes based on the ID field of the notes, no longer by deck location
-    - Removes empty decks after note removal
-    - Removes unused note types
+    Notes are matched by their unique ID ({student}_{id}) rather than by deck
+    location; the notes, empty decks and unused note types are computed by
+    plan_students_cleanup in one read pass and removed in bulk.
 
     Args:
         disabled_students (Set[str]): Set of students that were disabled
         deck_names (List[str]): List of remote deck names to filter operations
+        plan (Optional[CleanupPlan]): Plan already shown to the user; computed
+            when not given
 
     Returns:
         Dict[str, int]: Removal statistics {
@@ -710,83 +1123,13 @@ def cleanup_disabled_students_data(
     col = mw.col
 
     try:
-        # 1. First, find and remove all notes of disabled students
-        notes_to_remove = []
-
-        for student in disabled_students:
-            add_debug_msg(f"🧹 CLEANUP: Processing student '{student}'...")
-
-            # Search for notes by unique ID in {student}_{id} or [MISSING STUDENTS]_{id} format
-            # Use ID field search containing student_note_id
-            student_pattern = f"{student}_*"
-
-            # Find all notes in Anki that have this student in the ID field
-            # Since we cannot direct search by custom field, let's iterate
-            all_note_ids = col.find_notes("*")  # All notes - use wildcard
-            student_note_ids = []
-
-            for note_id in all_note_ids:
-                try:
-                    note = col.get_note(note_id)
-                    # Check if note has ID field and if it matches the student
-                    if "ID" in note.keys():
-                        note_unique_id = note["ID"].strip()
-                        # Check if note ID starts with "{student}_"
-                        if note_unique_id.startswith(f"{student}_"):
-                            student_note_ids.append(note_id)
-                            add_debug_msg(
-                                f"   🚀 Found note for student '{student}': {note_unique_id}"
-                            )
-                except:
-                    continue
-
-            notes_to_remove.extend(student_note_ids)
+        if plan is None:
+            plan = plan_students_cleanup(col, disabled_students, deck_names)
+        for student in sorted(plan.students):
             add_debug_msg(
-                f"   📊 Total notes found for '{student}': {len(student_note_ids)}"
+                f"   📊 Total notes found for '{student}': {len(plan.note_ids_by_student.get(student, []))}"
             )
-
-        # 2. Remove all found notes
-        if notes_to_remove:
-            add_debug_msg(f"🗑️ CLEANUP: Removing {len(notes_to_remove)} notes...")
-            col.remove_notes(notes_to_remove)
-            stats["notes_removed"] = len(notes_to_remove)
-            add_debug_msg(f"✅ CLEANUP: {len(notes_to_remove)} notes removed")
-
-        # 3. Find and remove empty decks of disabled students
-        for student in disabled_students:
-            for deck_name in deck_names:
-                # Student deck pattern: "Sheets2Anki::{deck_name}::{student}::"
-                student_deck_pattern = f"Sheets2Anki::{deck_name}::{student}::"
-
-                # Find all decks that start with this pattern
-                all_decks = col.decks.all_names_and_ids()
-                matching_decks = [
-                    d for d in all_decks if d.name.startswith(student_deck_pattern)
-                ]
-
-                for deck in matching_decks:
-                    try:
-                        # Check if deck is empty
-                        remaining_notes = col.find_notes(f'deck:"{deck.name}"')
-                        if not remaining_notes:
-                            # Empty deck, can remove
-                            from anki.decks import DeckId
-
-                            deck_id = DeckId(deck.id)
-                            col.decks.remove([deck_id])
-                            stats["decks_removed"] += 1
-                            add_debug_msg(f"   🗑️ Empty deck removed: '{deck.name}'")
-                        else:
-                            add_debug_msg(
-                                f"   📁 Deck '{deck.name}' still has {len(remaining_notes)} notes, keeping"
-                            )
-                    except Exception as e:
-                        add_debug_msg(f"   ❌ Error processing deck '{deck.name}': {e}")
-                        continue
-
-            # Remove student note types
-            removed_note_types = _remove_student_note_types(student, deck_names)
-            stats["note_types_removed"] += removed_note_types
+        stats = execute_cleanup_plan(col, plan)
 
         # NEW: Update meta.json after cleanup to remove references of deleted note types
         _update_meta_after_cleanup(disabled_students, deck_names)
@@ -811,162 +1154,6 @@ def cleanup_disabled_students_data(
         return stats
 
 
-def _remove_student_note_types(student: str, deck_names: List[str]) -> int:
-    """
-    Removes specific note types of a student.
-    
-    CORRECTED VERSION WITH IMPROVED DEBUG:
-    - Checks all note types in Anki, not just those based on deck_names
-    - Removes orphaned note types that may exist due to old configurations
-    - Detects varied naming patterns
-    - Adds detailed debug logs
-    - Uses proper addon logging system
-
-    Args:
-        student (str): Student name
-        deck_names (List[str]): List of remote deck names (used as preferred filter)
-
-    Returns:
-        int: Number of removed note types
-    """
-    # Use proper logging when possible
-    try:
-        from .utils import add_debug_message
-        log_func = lambda msg: add_debug_message(msg, "CLEANUP_NOTE_TYPES")
-    except:
-        log_func = print
-    
-    if not mw or not hasattr(mw, "col") or not mw.col:
-        log_func(f"❌ Anki not available to remove note types for student '{student}'")
-        return 0
-
-    col = mw.col
-    removed_count = 0
-
-    try:
-        # Get all note types
-        note_types = col.models.all()
-        log_func(f"🔍 Checking {len(note_types)} note types for student '{student}'")
-
-        student_note_types_found = []
-        
-        for note_type in note_types:
-            note_type_name = note_type.get("name", "")
-            note_type_id = note_type.get("id")
-
-            if not note_type_id:
-                continue
-
-            should_remove = False
-            match_reason = ""
-
-            # METHOD 1: Check patterns based on provided deck_names
-            for deck_name in deck_names:
-                student_pattern_basic = f"Sheets2Anki - {deck_name} - {student} - Basic"
-                student_pattern_cloze = f"Sheets2Anki - {deck_name} - {student} - Cloze"
-                student_pattern_reverse = f"Sheets2Anki - {deck_name} - {student} - Reverse"
-
-                if (note_type_name == student_pattern_basic or 
-                    note_type_name == student_pattern_cloze or 
-                    note_type_name == student_pattern_reverse):
-                    should_remove = True
-                    match_reason = f"deck pattern for '{student}'"
-                    break
-
-            # METHOD 2: Check general pattern for orphaned note types (robust fallback)
-            if not should_remove and note_type_name.startswith("Sheets2Anki - "):
-                # General format: "Sheets2Anki - {any_deck} - {student} - {Basic|Cloze}"
-                # IMPORTANT: deck_name may contain " - ", so parse from the END
-                parts = note_type_name.split(" - ")
-                if len(parts) >= 4:
-                    # Last part is the type (Basic or Cloze)
-                    note_type_suffix = parts[-1].strip()
-                    # Second-to-last part is the student name
-                    note_student = parts[-2].strip()
-                    
-                    if (note_student == student and 
-                        note_type_suffix in ["Basic", "Cloze", "Reverse"]):
-                        should_remove = True
-                        match_reason = f"orphaned note type for student '{student}'"
-
-            if should_remove:
-                student_note_types_found.append((note_type_name, note_type_id, match_reason))
-
-        log_func(f"🎯 Found {len(student_note_types_found)} note types for student '{student}':")
-        for nt_name, nt_id, reason in student_note_types_found:
-            log_func(f"   • '{nt_name}' (ID: {nt_id}) - {reason}")
-
-        # Try to remove found note types
-        for note_type_name, note_type_id, match_reason in student_note_types_found:
-            try:
-                # Check if note type is in use with defensive approach
-                from anki.models import NotetypeId
-                use_count = 0
-                
-                try:
-                    # Method 1: Try with NotetypeId
-                    use_count = col.models.useCount(NotetypeId(note_type_id))
-                except (TypeError, AttributeError) as e:
-                    log_func(f"⚠️ NotetypeId method failed for {note_type_id}: {e}")
-                    try:
-                        # Method 2: Try with int directly (older versions)
-                        use_count = col.models.useCount(note_type_id)
-                    except Exception as e2:
-                        log_func(f"⚠️ int method also failed for {note_type_id}: {e2}")
-                        try:
-                            # Method 3: Search for notes using this note type manually
-                            note_ids = col.find_notes(f"mid:{note_type_id}")
-                            use_count = len(note_ids)
-                            log_func(f"ℹ️ Using manual search: {use_count} notes found for note type {note_type_id}")
-                        except Exception as e3:
-                            log_func(f"❌ All methods failed for {note_type_id}: {e3}")
-                            # If we cannot check, assume it's in use for safety
-                            use_count = 1
-                
-                if use_count > 0:
-                    log_func(f"⚠️ Note type '{note_type_name}' still has {use_count} notes, skipping removal")
-                    continue
-
-                # Note type is not in use, can remove
-                log_func(f"🗑️ REMOVING note type '{note_type_name}' (ID: {note_type_id})...")
-                
-                try:
-                    # Try removal with NotetypeId
-                    col.models.remove(NotetypeId(note_type_id))
-                except (TypeError, AttributeError) as e:
-                    log_func(f"⚠️ Removal with NotetypeId failed: {e}")
-                    try:
-                        # Fallback: try with int directly
-                        col.models.remove(note_type_id)
-                    except Exception as e2:
-                        log_func(f"❌ Removal failed completely: {e2}")
-                        continue
-                
-                removed_count += 1
-                log_func(f"✅ Note type '{note_type_name}' removed successfully")
-
-            except Exception as e:
-                log_func(f"❌ Error removing note type '{note_type_name}': {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-
-        if removed_count == 0 and len(student_note_types_found) > 0:
-            log_func(f"⚠️ ATTENTION: {len(student_note_types_found)} note types found but none were removed")
-        elif removed_count > 0:
-            log_func(f"✅ SUCCESS: {removed_count} note types removed for student '{student}'")
-        else:
-            log_func(f"ℹ️ No note type found for student '{student}'")
-
-        return removed_count
-
-    except Exception as e:
-        log_func(f"❌ Error removing note types for student '{student}': {e}")
-        import traceback
-        traceback.print_exc()
-        return 0
-
-
 def _update_meta_after_cleanup(
     disabled_students: Set[str], deck_names: List[str]
 ) -> None:
@@ -1165,7 +1352,7 @@ def get_disabled_students_for_cleanup(current_enabled: Set[str]) -> Set[str]:
     log_func(f"📚 Students in sync_history: {sorted(sync_history_students)}")
     
     # Filter out missing student placeholders (handled separately)
-    missing_placeholders = {DEFAULT_STUDENT, "[MISSING STUDENTS]", "[MISSING S.]"}
+    missing_placeholders = set(MISSING_STUDENT_PLACEHOLDERS)
     real_students_with_data = sync_history_students - missing_placeholders
     
     log_func(f"👤 Real students with data (from sync_history): {sorted(real_students_with_data)}")
@@ -1229,17 +1416,19 @@ def show_cleanup_confirmation_dialog(disabled_students: Set[str]) -> int:
     return result
 
 
-def cleanup_missing_students_data(deck_names: List[str]) -> Dict[str, int]:
+def cleanup_missing_students_data(
+    deck_names: List[str], plan: Optional[CleanupPlan] = None
+) -> Dict[str, int]:
     """
     Removes all "{DEFAULT_STUDENT}" note data when the feature is disabled.
-    
-    CORRECTED VERSION:
-    - Detects {DEFAULT_STUDENT} note types using multiple patterns
-    - Searches for orphaned note types even if deck_name doesn't match exactly
-    - Removes data more robustly
+
+    Covers the current and legacy placeholders; the notes, empty decks and
+    unused note types are computed by plan_students_cleanup in one read pass.
 
     Args:
         deck_names (List[str]): List of remote deck names to filter operations
+        plan (Optional[CleanupPlan]): Plan already shown to the user; computed
+            when not given
 
     Returns:
         Dict[str, int]: Removal statistics {
@@ -1258,187 +1447,19 @@ def cleanup_missing_students_data(deck_names: List[str]) -> Dict[str, int]:
     stats = {"notes_removed": 0, "decks_removed": 0, "note_types_removed": 0}
     col = mw.col
 
-    # Legacy missing placeholders
-    missing_placeholders = [
-        DEFAULT_STUDENT,
-        "[MISSING STUDENTS]",
-        "[MISSING S.]"
-    ]
-
     try:
-        # 1. Search and remove all notes with ID {placeholder}_{any_id}
-        all_note_ids = col.find_notes("*")
-        missing_note_ids = []
-
-        for note_id in all_note_ids:
-            try:
-                note = col.get_note(note_id)
-                if "ID" in note.keys():
-                    note_unique_id = note["ID"].strip()
-                    if any(note_unique_id.startswith(f"{p}_") for p in missing_placeholders):
-                        missing_note_ids.append(note_id)
-                        add_debug_msg(f"   📝 Found missing student note: {note_unique_id}")
-            except:
-                continue
-
-        # Remove all found missing notes
-        if missing_note_ids:
-            add_debug_msg(f"🗑️ CLEANUP: Removing {len(missing_note_ids)} missing student notes...")
-            col.remove_notes(missing_note_ids)
-            stats["notes_removed"] = len(missing_note_ids)
-
-        # 2. Remove missing student decks (using multiple patterns)
-        all_decks = col.decks.all_names_and_ids()
-        
-        # Patterns to search for:
-        # - "Sheets2Anki::{deck_name}::{placeholder}::"
-        # - Any deck containing "::{placeholder}::"
-        missing_decks_found = []
-        
-        for deck in all_decks:
-            deck_name = deck.name
-            
-            # Check if it's a missing student deck
-            is_missing_deck = False
-            for placeholder in missing_placeholders:
-                if f"::{placeholder}::" in deck_name:
-                    is_missing_deck = True
-                    break
-            
-            if is_missing_deck:
-                # Check if it corresponds to any provided decks (if provided)
-                if deck_names:
-                    deck_matches = False
-                    for remote_deck_name in deck_names:
-                        for placeholder in missing_placeholders:
-                            expected_pattern = f"Sheets2Anki::{remote_deck_name}::{placeholder}::"
-                            if deck_name.startswith(expected_pattern):
-                                deck_matches = True
-                                break
-                        if deck_matches:
-                            break
-                    
-                    if deck_matches:
-                        missing_decks_found.append(deck)
-                        add_debug_msg(f"   📁 Missing student deck found: {deck_name}")
-                else:
-                    # If no deck_names specified, remove any missing student deck
-                    missing_decks_found.append(deck)
-                    add_debug_msg(f"   📁 Generic missing student deck found: {deck_name}")
-
-        # Remove empty missing student decks
-        for deck in missing_decks_found:
-            try:
-                remaining_notes = col.find_notes(f'deck:"{deck.name}"')
-                if not remaining_notes:
-                    from anki.decks import DeckId
-                    col.decks.remove([DeckId(deck.id)])
-                    stats["decks_removed"] += 1
-                    add_debug_msg(f"   🗑️ Empty missing student deck removed: '{deck.name}'")
-                else:
-                    add_debug_msg(f"   📁 Missing student deck '{deck.name}' still has {len(remaining_notes)} notes, keeping")
-            except Exception as e:
-                add_debug_msg(f"   ❌ Error processing missing student deck '{deck.name}': {e}")
-
-        # 3. Remove missing student note types (using robust detection)
-        note_types = col.models.all()
-        
-        for note_type in note_types:
-            note_type_name = note_type.get("name", "")
-            note_type_id = note_type.get("id")
-            
-            if not note_type_id:
-                continue
-            
-            should_remove = False
-            
-            # METHOD 1: Check patterns based on provided deck_names
-            if deck_names:
-                for deck_name in deck_names:
-                    for placeholder in missing_placeholders:
-                        pattern_basic = f"Sheets2Anki - {deck_name} - {placeholder} - Basic"
-                        pattern_cloze = f"Sheets2Anki - {deck_name} - {placeholder} - Cloze"
-                        pattern_reverse = f"Sheets2Anki - {deck_name} - {placeholder} - Reverse"
-                        
-                        if (note_type_name == pattern_basic or 
-                            note_type_name == pattern_cloze or 
-                            note_type_name == pattern_reverse):
-                            should_remove = True
-                            add_debug_msg(f"   🎯 Missing student note type '{note_type_name}' matched deck pattern")
-                            break
-                    if should_remove:
-                        break
-            
-            # METHOD 2: Check general pattern for orphaned missing student note types
-            # IMPORTANT: deck_name may contain " - ", so parse from the END
-            if not should_remove and note_type_name.startswith("Sheets2Anki - "):
-                parts = note_type_name.split(" - ")
-                if len(parts) >= 4:
-                    # Last part is the type (Basic, Cloze or Reverse)
-                    note_type_suffix = parts[-1].strip()
-                    # Second-to-last part is the student name
-                    note_student = parts[-2].strip()
-                    
-                    if (note_student in missing_placeholders and 
-                        note_type_suffix in ["Basic", "Cloze", "Reverse"]):
-                        should_remove = True
-                        add_debug_msg(f"   🔍 Orphaned missing student note type '{note_type_name}' found", "CLEANUP_MISSING")
-            
-            if should_remove:
-                try:
-                    # Check if note type is in use with defensive approach
-                    from anki.models import NotetypeId
-                    use_count = 0
-                    
-                    try:
-                        # Method 1: Try with NotetypeId
-                        use_count = col.models.useCount(NotetypeId(note_type_id))
-                    except (TypeError, AttributeError) as e:
-                        add_debug_msg(f"   ⚠️ NotetypeId method failed for missing student {note_type_id}: {e}", "CLEANUP_MISSING")
-                        try:
-                            # Method 2: Try with int directly
-                            use_count = col.models.useCount(note_type_id)
-                        except Exception as e2:
-                            try:
-                                # Method 3: Search for notes manually
-                                note_ids = col.find_notes(f"mid:{note_type_id}")
-                                use_count = len(note_ids)
-                                add_debug_msg(f"ℹ️ Using manual search for missing student: {use_count} notes", "CLEANUP_MISSING")
-                            except Exception as e3:
-                                # If all fails, assume it's in use for safety
-                                use_count = 1
-                    
-                    if use_count > 0:
-                        add_debug_msg(f"⚠️ Missing student note type '{note_type_name}' still has {use_count} notes, skipping", "CLEANUP_MISSING")
-                        continue
-                    
-                    # Note type is not in use, can remove
-                    try:
-                        # Try removal with NotetypeId
-                        col.models.remove(NotetypeId(note_type_id))
-                    except (TypeError, AttributeError) as e:
-                        add_debug_msg(f"⚠️ Removal with NotetypeId failed for missing student: {e}", "CLEANUP_MISSING")
-                        try:
-                            # Fallback: try with int directly
-                            col.models.remove(note_type_id)
-                        except Exception as e2:
-                            add_debug_msg(f"❌ Removal failed completely for missing student: {e2}", "CLEANUP_MISSING")
-                            continue
-                    
-                    stats["note_types_removed"] += 1
-                    add_debug_msg(f"🗑️ Missing student note type '{note_type_name}' removed", "CLEANUP_MISSING")
-                    
-                except Exception as e:
-                    add_debug_msg(f"❌ Error removing missing student note type '{note_type_name}': {e}", "CLEANUP_MISSING")
+        if plan is None:
+            plan = plan_missing_students_cleanup(col, deck_names)
+        stats = execute_cleanup_plan(col, plan)
 
         # NEW: Update meta.json after cleanup
         _update_meta_after_missing_cleanup(deck_names)
         
         # NEW: Remove missing student placeholders from sync history after successful cleanup
         from .config_manager import remove_student_from_sync_history
-        for placeholder in missing_placeholders:
+        for placeholder in MISSING_STUDENT_PLACEHOLDERS:
             remove_student_from_sync_history(placeholder)
-        add_debug_msg(f"📝 CLEANUP: Missing student placeholders removed from sync history: {missing_placeholders}")
+        add_debug_msg(f"📝 CLEANUP: Missing student placeholders removed from sync history: {list(MISSING_STUDENT_PLACEHOLDERS)}")
 
         # Save changes
         col.save()
@@ -1451,7 +1472,24 @@ def cleanup_missing_students_data(deck_names: List[str]) -> Dict[str, int]:
         return stats
 
 
-def show_missing_cleanup_confirmation_dialog() -> int:
+def plan_missing_students_cleanup(col, deck_names: List[str]) -> CleanupPlan:
+    """
+    Computes the dry-run plan of a missing student data cleanup.
+
+    Args:
+        col: Anki collection
+        deck_names (List[str]): Remote deck names; when empty, the placeholder
+            decks under any deck are pruned
+
+    Returns:
+        CleanupPlan: Notes, decks and note types to remove
+    """
+    return plan_students_cleanup(
+        col, set(MISSING_STUDENT_PLACEHOLDERS), deck_names or None
+    )
+
+
+def show_missing_cleanup_confirmation_dialog(plan: Optional[CleanupPlan] = None) -> int:
     """
     Shows confirmation dialog for missing student data cleanup.
     REFATURED: Uses centralized module for message generation and confirmation.
@@ -1460,6 +1498,9 @@ def show_missing_cleanup_confirmation_dialog() -> int:
     - DELETE DATA: Removes data and continues sync (returns MessageBox_Yes)
     - CANCEL SYNC: Aborts the sync entirely (returns MessageBox_Cancel)
 
+    Args:
+        plan (Optional[CleanupPlan]): Dry-run plan whose counts are shown
+
     Returns:
         int: Dialog result code (MessageBox_Yes or MessageBox_Cancel)
     """
@@ -1469,7 +1510,8 @@ def show_missing_cleanup_confirmation_dialog() -> int:
     # Now returns int result
     result = show_data_removal_confirmation_dialog(
         students_to_remove=[DEFAULT_STUDENT],
-        window_title=f"⚠️ Removal Confirmation - {DEFAULT_STUDENT} Notes"
+        window_title=f"⚠️ Removal Confirmation - {DEFAULT_STUDENT} Notes",
+        plan_summary=plan.summary() if plan is not None else None
     )
     
     if result == MessageBox_Yes:
@@ -6,8 +6,12 @@ decks with remote sources, using the new configuration system.
 It also includes classes for statistics management and finalization.
 """
 
+import threading
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
@@ -19,6 +23,8 @@ from .compat import AlignLeft
 from .compat import AlignRight
 from .compat import AlignTop
 from .compat import QDialog
+from .compat import QEventLoop
+from .compat import QObject
 from .compat import Palette_Window
 from .compat import QGroupBox
 from .compat import QLabel
@@ -30,8 +36,12 @@ from .compat import QTextEdit
 from .compat import QVBoxLayout
 from .compat import Qt
 from .compat import mw
+from .compat import pyqtSignal
 from .compat import safe_exec_dialog
 from .styled_messages import StyledMessageBox
+from .config_manager import begin_meta_write_batch
+from .config_manager import end_meta_write_batch
+from .config_manager import flush_meta
 from .config_manager import get_meta
 from .config_manager import get_deck_local_name
 from .config_manager import get_remote_decks
@@ -41,6 +51,7 @@ from .config_manager import update_note_type_names_in_meta
 from .backup_system import SimplifiedBackupManager
 from .data_processor import create_or_update_notes
 from .data_processor import getRemoteDeck
+from .student_manager import StudentSyncContext
 from .student_manager import get_selected_students_for_deck
 from .templates_and_definitions import update_existing_note_type_templates
 from .templates_and_definitions import DEFAULT_STUDENT
@@ -56,7 +67,8 @@ from .utils import capture_deck_note_type_ids
 from .utils import clear_debug_messages
 from .utils import get_spreadsheet_id_from_url
 from .utils import remove_empty_subdecks
-from .utils import validate_url
+from .utils import fetch_tsv_response
+from .utils import resolve_tsv_url
 from .name_consistency_manager import NameConsistencyManager
 
 # ========================================================================================
@@ -75,6 +87,7 @@ class SyncStats:
     errors: int = 0
     unchanged: int = 0
     skipped: int = 0
+    deck_unchanged: bool = False  # Deck skipped by the unchanged-sheet fast path
 
     # Detailed metrics of the remote deck - REFACTORED
     # 1. Total table lines (regardless of content)
@@ -203,6 +216,20 @@ class DeckSyncResult:
             self.stats = SyncStats()
 
 
+@dataclass
+class DeckPrefetchResult:
+    """Downloaded and parsed data of a deck, produced by the prefetch stage."""
+
+    deck_key: str
+    remote_deck: Any = None
+    remote_name: Optional[str] = None
+    # Spreadsheet title to store in the title cache (persisted on the main thread)
+    spreadsheet_title: Optional[str] = None
+    content_disposition: Optional[str] = None
+    messages: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
 class SyncStatsManager:
     """Sync statistics manager."""
 
@@ -1558,9 +1585,30 @@ def syncDecks(selected_deck_names=None, selected_deck_urls=None, new_deck_mode=F
 
     # Start step counter (1 if backup was done, 0 otherwise)
     step = 1 if backup_enabled else 0
+    # meta.json changes are kept in memory and written once per deck
+    begin_meta_write_batch()
     try:
+        # Student configuration is resolved once for the whole sync
+        student_context = StudentSyncContext.from_meta()
+
+        # Download and parse all decks in parallel before touching the collection
+        prefetched_decks = _prefetch_remote_decks(
+            remote_decks, deck_keys, progress, status_msgs, student_context
+        )
+
         # Synchronize each deck
-        for deckKey in deck_keys:
+        for deck_index, deckKey in enumerate(deck_keys):
+            # Checkpoint: persist the previous deck's meta.json changes
+            flush_meta()
+
+            if progress.wasCanceled():
+                skipped_decks = total_decks - deck_index
+                add_debug_message(f"🛑 SYNC: Canceled by user, {skipped_decks} deck(s) skipped", "SYNC")
+                status_msgs.append(f"🛑 Synchronization canceled: {skipped_decks} deck(s) skipped")
+                sync_errors.append(f"Synchronization canceled by user ({skipped_decks} deck(s) skipped)")
+                _update_progress_text(progress, status_msgs)
+                break
+
             try:
                 step, deck_sync_increment, current_stats = _sync_single_deck(
                     remote_decks,
@@ -1569,6 +1617,8 @@ def syncDecks(selected_deck_names=None, selected_deck_urls=None, new_deck_mode=F
                     status_msgs,
                     step,
                     debug_messages=[],
+                    prefetched=prefetched_decks.get(deckKey),
+                    student_context=student_context,
                 )
 
                 # Create deck result
@@ -1709,6 +1759,8 @@ def syncDecks(selected_deck_names=None, selected_deck_urls=None, new_deck_mode=F
         on_close_action = open_summary_window
 
     finally:
+        end_meta_write_batch()
+
         # Show completion status with Close button (dialog stays open)
         if progress.isVisible():
             _show_sync_completion(
@@ -1799,8 +1851,12 @@ class LogProgressDialog(QDialog):
     Custom progress dialog with a scrollable log area.
     Mimics QProgressDialog interface used in this module.
     """
+
+    canceled = pyqtSignal()
+
     def __init__(self, title, message, min_val, max_val, parent=None):
         super().__init__(parent)
+        self._was_canceled = False
         self.setWindowTitle("📚 Deck Synchronization")
         
         layout = QVBoxLayout(self)
@@ -1858,7 +1914,7 @@ class LogProgressDialog(QDialog):
         
         # Cancel/Close button
         self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.clicked.connect(self.reject)
+        self.cancel_btn.clicked.connect(self.cancel)
         layout.addWidget(self.cancel_btn, 0, AlignRight)
         
         # Initial sizing
@@ -1948,6 +2004,19 @@ class LogProgressDialog(QDialog):
 
     def setCancelButtonText(self, text):
         self.cancel_btn.setText(text)
+
+    def cancel(self):
+        """Requests cancellation; the sync stops before the next deck."""
+        if self._was_canceled:
+            return
+        self._was_canceled = True
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setText("Canceling...")
+        self.canceled.emit()
+
+    def wasCanceled(self):
+        """Returns True if the user requested cancellation."""
+        return self._was_canceled
         
     def setTitle(self, text):
         """Updates the title label."""
@@ -2091,8 +2160,244 @@ def _update_progress_text(
     mw.app.processEvents()
 
 
+# Maximum number of decks downloaded at the same time by the prefetch stage
+PREFETCH_MAX_WORKERS = 6
+
+
+def _prefetch_deck(deck_key, remote_deck_url, enabled_students, process_images):
+    """
+    Downloads and parses a single deck. Runs on a worker thread.
+
+    Only network I/O and parsing happen here; the collection is never touched.
+
+    Args:
+        deck_key: Deck key in the remote decks dictionary
+        remote_deck_url: Remote deck URL
+        enabled_students: Students selected for this deck
+        process_images: Whether to trigger image processing before downloading
+
+    Returns:
+        DeckPrefetchResult: Parsed deck, remote name and status messages, or the error
+    """
+    from .deck_manager import DeckNameManager
+
+    result = DeckPrefetchResult(deck_key=deck_key)
+
+    try:
+        # Process images if enabled (before downloading TSV)
+        if process_images:
+            try:
+                from .image_processor import process_images_for_sync
+
+                success, image_msg = process_images_for_sync(remote_deck_url)
+                if success:
+                    result.messages.append(f"  ✅ {image_msg}")
+                else:
+                    result.messages.append(f"  ⚠️ Image processing: {image_msg}")
+            except Exception as img_error:
+                # Don't fail sync if image processing fails
+                add_debug_message(f"⚠️ Image processing error: {img_error}", "IMAGE_PROCESSOR")
+                result.messages.append("  ⚠️ Image processing failed (continuing sync)")
+
+        # Single request per deck: the same response is validated and parsed
+        tsv_url = resolve_tsv_url(remote_deck_url)
+        tsv_response = fetch_tsv_response(tsv_url)
+        if tsv_response.unchanged:
+            add_debug_message(
+                f"♻️ Sheet unchanged since last download (HTTP {tsv_response.status})",
+                "SYNC",
+            )
+        result.remote_deck = getRemoteDeck(
+            tsv_url, enabled_students=list(enabled_students), tsv_response=tsv_response
+        )
+
+        # meta.json is not written here; see _sync_single_deck
+        (
+            result.remote_name,
+            result.spreadsheet_title,
+            result.content_disposition,
+        ) = DeckNameManager.lookup_remote_name(remote_deck_url, tsv_response=tsv_response)
+
+    except Exception as e:
+        result.error = e
+
+    return result
+
+
+class SyncRunnerSignals(QObject):
+    """Qt signals used by SyncRunner to report to the main thread."""
+
+    deck_prefetched = pyqtSignal(object)  # DeckPrefetchResult
+    finished = pyqtSignal()
+
+
+class SyncRunner:
+    """
+    Runs the download and parse stage of a sync on a background thread.
+
+    The worker thread owns a bounded thread pool that executes _prefetch_deck
+    for every deck. Each finished deck is reported through Qt signals, which
+    Qt delivers on the main thread, so the progress dialog is updated without
+    blocking the UI. cancel() stops the stage between decks: downloads that
+    have not started are dropped and no new results are reported.
+    """
+
+    def __init__(self, jobs, max_workers=PREFETCH_MAX_WORKERS):
+        """
+        Args:
+            jobs: List of (deck_key, remote_deck_url, enabled_students, process_images)
+            max_workers: Maximum number of decks downloaded at the same time
+        """
+        self.jobs = list(jobs)
+        self.max_workers = max(1, min(max_workers, len(self.jobs) or 1))
+        self.results = {}
+        self.signals = SyncRunnerSignals()
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._thread = None
+
+        # Connected before the worker starts so the finished signal is never missed
+        self._loop = QEventLoop()
+        self.signals.finished.connect(self._loop.quit)
+
+    def start(self):
+        """Starts the worker thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="Sheets2AnkiSyncRunner", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self):
+        """Requests cancellation; decks not yet started are skipped."""
+        self._cancel_event.set()
+
+    def is_canceled(self):
+        """Returns True if cancellation was requested."""
+        return self._cancel_event.is_set()
+
+    def wait(self):
+        """
+        Blocks until the worker finishes while the Qt event loop keeps running.
+
+        Returns:
+            dict: {deck_key: DeckPrefetchResult} for every deck that finished
+        """
+        if not self._done_event.is_set():
+            self._loop.exec()
+        self._done_event.wait()
+        return self.results
+
+    def _run_job(self, job):
+        # Checked when a pool thread picks the job up, so canceled decks never start
+        if self.is_canceled():
+            return None
+        return _prefetch_deck(*job)
+
+    def _run(self):
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                executor.submit(self._run_job, job): job[0] for job in self.jobs
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future.cancelled() or future.result() is None:
+                        continue
+                    result = future.result()
+                    self.results[futures[future]] = result
+                    if not self.is_canceled():
+                        self.signals.deck_prefetched.emit(result)
+
+                if self.is_canceled():
+                    for future in pending:
+                        future.cancel()
+        except Exception as e:
+            add_debug_message(f"❌ Sync runner error: {e}", "SYNC")
+        finally:
+            executor.shutdown(wait=False)
+            self._done_event.set()
+            self.signals.finished.emit()
+
+
+def _prefetch_remote_decks(remote_decks, deck_keys, progress, status_msgs, student_context=None):
+    """
+    Downloads and parses all selected decks on a background SyncRunner.
+
+    Runs before the collection-mutation phase, which stays on the main thread.
+    The progress dialog is updated as each deck finishes downloading, and its
+    Cancel button stops the remaining downloads.
+
+    Args:
+        remote_decks: Remote decks dictionary
+        deck_keys: Keys of the decks to synchronize
+        progress: Progress dialog
+        status_msgs: List of status messages
+        student_context: StudentSyncContext of the current sync (optional)
+
+    Returns:
+        dict: {deck_key: DeckPrefetchResult}
+    """
+    from .config_manager import get_image_processor_auto_process
+    from .config_manager import get_image_processor_enabled
+
+    try:
+        process_images = get_image_processor_enabled() and get_image_processor_auto_process()
+    except Exception:
+        process_images = False
+
+    total = len(deck_keys)
+    status_msgs.append(f"📥 Downloading {total} deck(s)...")
+    _update_progress_text(progress, status_msgs)
+
+    # Read configuration on the main thread before handing work to the runner
+    get_students = (
+        student_context.get_selected_students
+        if student_context is not None
+        else get_selected_students_for_deck
+    )
+    jobs = []
+    for deck_key in deck_keys:
+        remote_deck_url = remote_decks[deck_key]["remote_deck_url"]
+        enabled_students = get_students(remote_deck_url)
+        add_debug_message(
+            f"🎓 Enabled students for {deck_key}: {list(enabled_students)}",
+            "STUDENTS",
+        )
+        jobs.append((deck_key, remote_deck_url, enabled_students, process_images))
+
+    runner = SyncRunner(jobs)
+    reported = []
+
+    def on_deck_prefetched(result):
+        reported.append(result.deck_key)
+        deck_name = remote_decks[result.deck_key].get("local_deck_name", result.deck_key)
+        if result.error is not None:
+            status_msgs.append(f"❌ {deck_name}: Download failed ({len(reported)}/{total})")
+        else:
+            status_msgs.append(f"📥 {deck_name}: Downloaded ({len(reported)}/{total})")
+        status_msgs.extend(result.messages)
+        _update_progress_text(progress, status_msgs)
+
+    runner.signals.deck_prefetched.connect(on_deck_prefetched)
+    if hasattr(progress, "canceled"):
+        progress.canceled.connect(runner.cancel)
+
+    runner.start()
+    return runner.wait()
+
+
 def _sync_single_deck(
-    remote_decks, deckKey, progress, status_msgs, step, debug_messages=None
+    remote_decks,
+    deckKey,
+    progress,
+    status_msgs,
+    step,
+    debug_messages=None,
+    prefetched=None,
+    student_context=None,
 ):
     """
     Synchronizes a single deck.
@@ -2103,6 +2408,10 @@ def _sync_single_deck(
         progress: Progress dialog
         status_msgs: List of status messages
         step: Current progress step
+        prefetched: DeckPrefetchResult from the prefetch stage; when given,
+            the deck is not downloaded again
+        student_context: StudentSyncContext of the current sync; read from
+            meta.json when not given
 
     Returns:
         tuple: (step, deck_sync_increment, current_stats)
@@ -2110,6 +2419,9 @@ def _sync_single_deck(
     from .deck_manager import DeckNameManager
     from .deck_manager import DeckRecreationManager
 
+    if student_context is None:
+        student_context = StudentSyncContext.from_meta()
+
 
     # Check if mw.col and mw.col.decks are available
     if not _is_anki_decks_ready():
@@ -2175,50 +2487,40 @@ def _sync_single_deck(
     # Update info in configuration with actual name used
     currentRemoteInfo["local_deck_name"] = deckName
 
-    # Validate URL before trying to sync and get TSV URL for download
-    tsv_url = validate_url(remote_deck_url)
-
-    # 1. Download
-    msg = f"📥 {deckName}: Downloading data..."
-    status_msgs.append(msg)
-    _update_progress_text(progress, status_msgs)
-
-    # Get list of enabled students for this deck
-    enabled_students = get_selected_students_for_deck(remote_deck_url)
-    add_debug_message(
-        f"🎓 Enabled students for this deck: {list(enabled_students)}",
-        "STUDENTS",
-    )
+    # 1. Download (already done by the prefetch stage when available)
+    if prefetched is None:
+        msg = f"📥 {deckName}: Downloading data..."
+        status_msgs.append(msg)
+        _update_progress_text(progress, status_msgs)
 
-    # Process images if enabled (before downloading TSV)
-    try:
         from .config_manager import get_image_processor_enabled, get_image_processor_auto_process
-        
-        if get_image_processor_enabled() and get_image_processor_auto_process():
-            msg = f"📸 {deckName}: Processing images..."
-            status_msgs.append(msg)
-            _update_progress_text(progress, status_msgs)
-            
-            from .image_processor import process_images_for_sync
-            
-            success, image_msg = process_images_for_sync(remote_deck_url)
-            
-            if success:
-                status_msgs.append(f"  ✅ {image_msg}")
-            else:
-                status_msgs.append(f"  ⚠️ Image processing: {image_msg}")
-            
-            _update_progress_text(progress, status_msgs)
-            mw.app.processEvents()
-    except Exception as img_error:
-        # Don't fail sync if image processing fails
-        add_debug_message(f"⚠️ Image processing error: {img_error}", "IMAGE_PROCESSOR")
-        status_msgs.append(f"  ⚠️ Image processing failed (continuing sync)")
+
+        try:
+            process_images = get_image_processor_enabled() and get_image_processor_auto_process()
+        except Exception:
+            process_images = False
+
+        prefetched = _prefetch_deck(
+            deckKey,
+            remote_deck_url,
+            student_context.get_selected_students(remote_deck_url),
+            process_images,
+        )
+        status_msgs.extend(prefetched.messages)
         _update_progress_text(progress, status_msgs)
 
+    if prefetched.error is not None:
+        raise prefetched.error
 
+    # Title found by the download worker is cached from the main thread
+    if prefetched.spreadsheet_title:
+        from .config_manager import save_cached_spreadsheet_title
 
-    remoteDeck = getRemoteDeck(tsv_url, enabled_students=list(enabled_students))
+        save_cached_spreadsheet_title(
+            remote_deck_url, prefetched.spreadsheet_title, prefetched.content_disposition
+        )
+
+    remoteDeck = prefetched.remote_deck
 
     # NEW: Debug to check loaded notes
     notes_count = (
@@ -2235,9 +2537,7 @@ def _sync_single_deck(
     mw.app.processEvents()
 
     # Update remote_deck_name with name extracted from URL
-    new_remote_name_from_url = DeckNameManager.extract_remote_name_from_url(
-        remote_deck_url
-    )
+    new_remote_name_from_url = prefetched.remote_name
     stored_remote_name = currentRemoteInfo.get("remote_deck_name")
     
     # Check if we could extract a valid name from URL
@@ -2581,6 +2881,7 @@ def _sync_single_deck(
             local_deck_id,
             deck_url=remote_deck_url,
             debug_messages=debug_messages,
+            student_context=student_context,
         )
         add_debug_message(f"🔧 create_or_update_notes RETURNED: {deck_stats}", "SYNC")
     except Exception as e:
@@ -2595,6 +2896,10 @@ def _sync_single_deck(
         f"✅ create_or_update_notes COMPLETED - returned: {deck_stats}", "SYNC"
     )
 
+    if deck_stats.deck_unchanged:
+        status_msgs.append(f"⏭️ {deckName}: Unchanged since last sync")
+        _update_progress_text(progress, status_msgs)
+
     # Show warnings in progress bar if any
     if deck_stats.warnings:
         for warning in deck_stats.warnings:
@@ -2690,7 +2995,7 @@ def _sync_single_deck(
         "SYNC",
     )
     try:
-        enabled_students = get_selected_students_for_deck(remote_deck_url)
+        enabled_students = student_context.get_selected_students(remote_deck_url)
         sync_result = sync_note_type_names_robustly(
             remote_deck_url, current_remote_name, enabled_students
         )
@@ -2730,7 +3035,7 @@ def _sync_single_deck(
         )
         # Try fallback with old method
         try:
-            enabled_students = get_selected_students_for_deck(remote_deck_url)
+            enabled_students = student_context.get_selected_students(remote_deck_url)
             update_note_type_names_in_meta(
                 remote_deck_url, current_remote_name, enabled_students
             )
@@ -2747,7 +3052,7 @@ def _sync_single_deck(
         from .config_manager import update_student_sync_history
         
         # Get students who were synchronized in this deck
-        students_synced = get_selected_students_for_deck(remote_deck_url)
+        students_synced = student_context.get_selected_students(remote_deck_url)
         
         if students_synced:
             # Update persistent history
@@ -3190,13 +3495,15 @@ def _handle_consolidated_confirmation_cleanup(remote_decks):
     """
     from .config_manager import get_global_student_config
     from .config_manager import get_students_with_sync_history
+    from .student_manager import MISSING_STUDENT_PLACEHOLDERS
     from .student_manager import cleanup_disabled_students_data
     from .student_manager import cleanup_missing_students_data
+    from .student_manager import plan_missing_students_cleanup
+    from .student_manager import plan_students_cleanup
     from .data_removal_confirmation import collect_students_for_removal, show_data_removal_confirmation_dialog
-    from .templates_and_definitions import DEFAULT_STUDENT
 
     # Missing student placeholders
-    missing_placeholders = {DEFAULT_STUDENT, "[MISSING STUDENTS]", "[MISSING S.]"}
+    missing_placeholders = set(MISSING_STUDENT_PLACEHOLDERS)
 
     # Get configuration
     config = get_global_student_config()
@@ -3240,11 +3547,27 @@ def _handle_consolidated_confirmation_cleanup(remote_decks):
     if not students_to_remove:
         return ({}, {})
     
-    # Use centralized dialog for confirmation
+    # Dry run: the dialog shows exactly what will be deleted
+    missing_plan = None
+    disabled_plan = None
+    plan_summary = None
+    if mw and mw.col:
+        if should_cleanup_missing:
+            missing_plan = plan_missing_students_cleanup(mw.col, deck_names)
+        if disabled_students_set:
+            disabled_plan = plan_students_cleanup(mw.col, disabled_students_set, deck_names)
+        plan_summary = {"notes": 0, "decks": 0, "note_types": 0}
+        for plan in (missing_plan, disabled_plan):
+            if plan is None:
+                continue
+            for key, count in plan.summary().items():
+                plan_summary[key] += count
+
     # Use centralized dialog for confirmation (returns int)
     result = show_data_removal_confirmation_dialog(
         students_to_remove=students_to_remove,
-        window_title="⚠️ Confirm Data Cleanup"
+        window_title="⚠️ Confirm Data Cleanup",
+        plan_summary=plan_summary
     )
 
     if result == MessageBox_Yes:
@@ -3253,9 +3576,9 @@ def _handle_consolidated_confirmation_cleanup(remote_decks):
 
         # Execute both cleanups
         if should_cleanup_missing:
-            cleanup_missing_students_data(deck_names)
+            cleanup_missing_students_data(deck_names, missing_plan)
         if disabled_students_set:
-            cleanup_disabled_students_data(disabled_students_set, deck_names)
+            cleanup_disabled_students_data(disabled_students_set, deck_names, disabled_plan)
 
         # Return results
         missing_result = {
@@ -3292,16 +3615,13 @@ def _handle_missing_students_cleanup(remote_decks):
     """
     from .config_manager import is_sync_missing_students_notes
     from .config_manager import get_students_with_sync_history
+    from .student_manager import MISSING_STUDENT_PLACEHOLDERS
     from .student_manager import cleanup_missing_students_data
+    from .student_manager import plan_missing_students_cleanup
     from .student_manager import show_missing_cleanup_confirmation_dialog
-    from .templates_and_definitions import DEFAULT_STUDENT
 
     # All missing student placeholders to check
-    missing_placeholders = {
-        DEFAULT_STUDENT,  # "[MISSING STUDENT]"
-        "[MISSING STUDENTS]",
-        "[MISSING S.]"
-    }
+    missing_placeholders = set(MISSING_STUDENT_PLACEHOLDERS)
 
     # If feature is enabled, do nothing
     if is_sync_missing_students_notes():
@@ -3332,16 +3652,17 @@ def _handle_missing_students_cleanup(remote_decks):
 
     add_debug_message("⚠️ CLEANUP: [MISSING S.] data found for cleanup", "CLEANUP")
 
-    # Show confirmation dialog
-    # Show confirmation dialog
-    # Now returns int result
-    result = show_missing_cleanup_confirmation_dialog()
+    # Dry run, so the dialog can show what will be deleted
+    plan = plan_missing_students_cleanup(mw.col, deck_names) if mw and mw.col else None
+
+    # Show confirmation dialog (returns int result)
+    result = show_missing_cleanup_confirmation_dialog(plan)
     
     if result == MessageBox_Yes:
         # User confirmed - execute cleanup
         add_debug_message(f"🧹 CLEANUP: Starting [MISSING S.] cleanup for decks: {deck_names}", "CLEANUP")
 
-        cleanup_missing_students_data(deck_names)
+        cleanup_missing_students_data(deck_names, plan)
 
         # Simple log of completed cleanup
         add_debug_message("✅ CLEANUP: [MISSING S.] cleanup completed", "CLEANUP")
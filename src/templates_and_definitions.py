@@ -12,6 +12,9 @@ Consolidated from:
 - column_definitions.py: Spreadsheet column definitions
 """
 
+import hashlib
+import json
+
 # =============================================================================
 # CONTROL FIELDS
 # =============================================================================
@@ -1783,6 +1786,11 @@ DEFAULT_STUDENT = "[MISSING_STUDENT]"
 # Root deck name - non-modifiable constant by user
 DEFAULT_PARENT_DECK_NAME = "Sheets2Anki"
 
+# Version of the Sheets2Anki note type layout (fields and card templates).
+# Increase it whenever NOTE_FIELDS or the card templates change, so decks
+# skipped by the unchanged-sheet fast path are fully reconciled again.
+TEMPLATE_VERSION = 1
+
 # Tag prefixes (all lowercase for consistency - Anki tags are case-insensitive)
 TAG_ROOT = "sheets2anki"
 TAG_TOPICS = "topics"
@@ -1914,10 +1922,226 @@ def get_all_column_info():
 # =============================================================================
 
 
-def create_card_template(is_cloze=False, timer_position=None, ai_assistance_enabled=None, is_reverse=False):
+# Compiled card templates, keyed by get_card_template_key()
+_card_template_cache = {}
+
+
+def get_card_template_settings():
+    """
+    Reads the settings that shape the card templates from meta.json.
+
+    Returns:
+        tuple: (timer_position, ai_assistance_enabled, ai_assistance_config)
+    """
+    try:
+        from .config_manager import get_timer_position
+        timer_position = get_timer_position()
+    except ImportError:
+        timer_position = "between_sections"  # Default fallback
+
+    try:
+        from .config_manager import get_ai_assistance_config
+        ai_assistance_config = get_ai_assistance_config()
+        ai_assistance_enabled = ai_assistance_config.get("enabled", False)
+    except ImportError:
+        ai_assistance_enabled = False  # Default fallback
+        ai_assistance_config = None
+
+    return timer_position, ai_assistance_enabled, ai_assistance_config
+
+
+def get_ai_config_hash(ai_assistance_enabled, ai_assistance_config=None):
+    """
+    Summarizes the AI Assistance settings that end up in the card templates.
+
+    Args:
+        ai_assistance_enabled (bool): Whether the AI Assistance button is included
+        ai_assistance_config (dict, optional): AI Assistance settings
+
+    Returns:
+        str: "off", "desktop" or a hash of the settings embedded for mobile
+    """
+    if not ai_assistance_enabled:
+        return "off"
+    if not ai_assistance_config or not ai_assistance_config.get("mobile_enabled", False):
+        return "desktop"
+    embedded = json.dumps(ai_assistance_config, sort_keys=True, default=str)
+    return hashlib.sha256(embedded.encode("utf-8")).hexdigest()[:16]
+
+
+def get_card_template_key(
+    is_cloze=False, is_reverse=False, timer_position=None,
+    ai_assistance_enabled=False, ai_assistance_config=None,
+):
+    """
+    Builds the key identifying one compiled card template.
+
+    Args:
+        is_cloze (bool): Cloze template
+        is_reverse (bool): Reverse template
+        timer_position (str): Timer position
+        ai_assistance_enabled (bool): Whether the AI Assistance button is included
+        ai_assistance_config (dict, optional): AI Assistance settings
+
+    Returns:
+        tuple: (is_cloze, is_reverse, timer_position, ai_config_hash)
+    """
+    return (
+        bool(is_cloze),
+        bool(is_reverse),
+        timer_position,
+        get_ai_config_hash(ai_assistance_enabled, ai_assistance_config),
+    )
+
+
+def clear_card_template_cache():
+    """Drops all compiled card templates."""
+    _card_template_cache.clear()
+    _template_signature_cache.clear()
+
+
+# Template signatures, keyed by (timer_position, ai_config_hash)
+_template_signature_cache = {}
+
+
+def get_template_signature(
+    timer_position=None, ai_assistance_enabled=None, ai_assistance_config=None
+):
+    """
+    Returns the signature of the current note type layout: TEMPLATE_VERSION,
+    NOTE_FIELDS and the compiled Basic, Cloze and Reverse templates.
+
+    A note type stamped with this signature needs no template update.
+
+    Args:
+        timer_position (str, optional): Timer position; read from config if None
+        ai_assistance_enabled (bool, optional): AI Assistance flag; read from
+            config if None
+        ai_assistance_config (dict, optional): AI Assistance settings
+
+    Returns:
+        str: Hex digest identifying the layout
+    """
+    if timer_position is None or ai_assistance_enabled is None:
+        config_timer_position, config_ai_enabled, config_ai_config = get_card_template_settings()
+        if timer_position is None:
+            timer_position = config_timer_position
+        if ai_assistance_enabled is None:
+            ai_assistance_enabled = config_ai_enabled
+            ai_assistance_config = config_ai_config
+
+    key = (timer_position, get_ai_config_hash(ai_assistance_enabled, ai_assistance_config))
+    signature = _template_signature_cache.get(key)
+    if signature is None:
+        digest = hashlib.sha256()
+        digest.update(f"{TEMPLATE_VERSION}\n".encode("utf-8"))
+        digest.update("\t".join(NOTE_FIELDS).encode("utf-8"))
+        for is_cloze, is_reverse in ((False, False), (True, False), (False, True)):
+            template = create_card_template(
+                is_cloze, timer_position, ai_assistance_enabled, is_reverse,
+                ai_assistance_config,
+            )
+            digest.update(template["qfmt"].encode("utf-8"))
+            digest.update(template["afmt"].encode("utf-8"))
+        signature = digest.hexdigest()
+        _template_signature_cache[key] = signature
+    return signature
+
+
+def get_collection_stamp_key(col):
+    """
+    Identifies the collection (Anki profile) template stamps belong to.
+
+    Args:
+        col: Anki collection
+
+    Returns:
+        str: Short hash of the collection path
+    """
+    path = getattr(col, "path", None) or ""
+    return hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:16]
+
+
+def get_note_type_mtimes(col, note_type_ids):
+    """
+    Reads the modification time of note types without loading them.
+
+    Args:
+        col: Anki collection
+        note_type_ids (list): IDs of the note types
+
+    Returns:
+        dict: {note_type_id (int): mtime in seconds}; empty if unavailable
+    """
+    if not note_type_ids:
+        return {}
+    ids_sql = "(" + ",".join(str(int(note_type_id)) for note_type_id in note_type_ids) + ")"
+    try:
+        return {
+            int(note_type_id): mtime
+            for note_type_id, mtime in col.db.all(
+                f"select id, mtime_secs from notetypes where id in {ids_sql}"
+            )
+        }
+    except Exception:
+        return {}
+
+
+def get_note_type_stamp(signature, mtime):
+    """
+    Builds the stamp of a note type: the template signature it was updated to
+    and its modification time afterwards.
+
+    A note type edited by the user or changed by a sync from another device
+    gets a new modification time, so its stamp no longer matches.
+
+    Args:
+        signature (str): Template signature
+        mtime (int): Note type modification time (None if unknown)
+
+    Returns:
+        str: Stamp stored in meta.json
+    """
+    return f"{signature}:{mtime}"
+
+
+def stamp_note_types(col, note_type_ids, signature=None):
+    """
+    Records that note types already use the current template layout.
+
+    Args:
+        col: Anki collection
+        note_type_ids (list): IDs of the note types
+        signature (str, optional): Template signature; current one if None
+    """
+    try:
+        from .config_manager import get_template_stamps
+        from .config_manager import save_template_stamps
+    except ImportError:
+        return
+
+    if signature is None:
+        signature = get_template_signature()
+    collection_key = get_collection_stamp_key(col)
+    mtimes = get_note_type_mtimes(col, note_type_ids)
+    stamps = get_template_stamps(collection_key)
+    for note_type_id in note_type_ids:
+        stamps[str(note_type_id)] = get_note_type_stamp(
+            signature, mtimes.get(int(note_type_id))
+        )
+    save_template_stamps(stamps, collection_key)
+
+
+def create_card_template(
+    is_cloze=False, timer_position=None, ai_assistance_enabled=None, is_reverse=False,
+    ai_assistance_config=None,
+):
     """
     Creates the HTML template for a card (standard or cloze).
 
+    Templates are compiled once per (is_cloze, is_reverse, timer_position,
+    AI config hash) and reused afterwards.
+
     Args:
         is_cloze (bool): Whether to create a cloze template
         timer_position (str): Timer position - "top_middle", "between_sections", or "hidden"
@@ -1925,30 +2149,37 @@ def create_card_template(is_cloze=False, timer_position=None, ai_assistance_enab
         ai_assistance_enabled (bool): Whether to include AI Assistance button on back card
                                If None, reads from config
         is_reverse (bool): Whether to create a reverse template (Reverse->Question)
+        ai_assistance_config (dict, optional): AI Assistance settings; only used
+            when ai_assistance_enabled is given
 
     Returns:
         dict: Dictionary with 'qfmt' and 'afmt' template strings
     """
-    
-    # Get timer position from config if not specified
-    if timer_position is None:
-        try:
-            from .config_manager import get_timer_position
-            timer_position = get_timer_position()
-        except ImportError:
-            timer_position = "between_sections"  # Default fallback
-    
-    # Get AI Assistance config from settings if not specified
-    ai_assistance_config = None
-    if ai_assistance_enabled is None:
-        try:
-            from .config_manager import get_ai_assistance_config
-            ai_assistance_config = get_ai_assistance_config()
-            ai_assistance_enabled = ai_assistance_config.get("enabled", False)
-        except ImportError:
-            ai_assistance_enabled = False  # Default fallback
-            ai_assistance_config = None
+    if timer_position is None or ai_assistance_enabled is None:
+        config_timer_position, config_ai_enabled, config_ai_config = get_card_template_settings()
+        if timer_position is None:
+            timer_position = config_timer_position
+        if ai_assistance_enabled is None:
+            ai_assistance_enabled = config_ai_enabled
+            ai_assistance_config = config_ai_config
+
+    key = get_card_template_key(
+        is_cloze, is_reverse, timer_position, ai_assistance_enabled, ai_assistance_config
+    )
+    template = _card_template_cache.get(key)
+    if template is None:
+        template = _build_card_template(
+            is_cloze, timer_position, ai_assistance_enabled, ai_assistance_config, is_reverse
+        )
+        _card_template_cache[key] = template
+
+    return dict(template)
 
+
+def _build_card_template(
+    is_cloze, timer_position, ai_assistance_enabled, ai_assistance_config, is_reverse
+):
+    """Assembles the qfmt/afmt strings of a card template (see create_card_template)."""
     # Common header fields
     header_fields = [
         (hierarchy_1, hierarchy_1),
@@ -2203,6 +2434,27 @@ def create_card_template(is_cloze=False, timer_position=None, ai_assistance_enab
     return {"qfmt": qfmt, "afmt": afmt}
 
 
+# Bumped whenever a Sheets2Anki note type is created or renamed, so that
+# note type lookups cached during a sync know when to resolve again.
+_note_types_generation = 0
+
+
+def mark_note_types_changed():
+    """Records that a note type was created or renamed."""
+    global _note_types_generation
+    _note_types_generation += 1
+
+
+def get_note_types_generation():
+    """
+    Returns the note type change counter.
+
+    Returns:
+        int: Value that changes whenever a note type is created or renamed
+    """
+    return _note_types_generation
+
+
 def create_model(col, model_name, is_cloze=False, url=None, debug_messages=None, is_reverse=False):
     """
     Creates a new Anki note model.
@@ -2238,6 +2490,15 @@ def create_model(col, model_name, is_cloze=False, url=None, debug_messages=None,
 
     col.models.add_template(model, template)
     col.models.save(model)
+    mark_note_types_changed()
+
+    # Templates were just built with the current settings
+    if model.get("id"):
+        try:
+            stamp_note_types(col, [model["id"]])
+        except Exception as e:
+            if debug_messages:
+                debug_messages.append(f"Error stamping note type {model['id']}: {e}")
 
     # Automatically register note type if URL was provided
     if url and model.get("id"):
@@ -2451,6 +2712,10 @@ def update_existing_note_type_templates(col, debug_messages=None):
     """
     Updates templates of all existing Sheets2Anki note types
     to include ALL fields defined in NOTE_FIELDS and ensure templates are up to date.
+
+    Each note type is stamped in meta.json, per collection, with the template
+    signature it was updated to and its modification time; note types whose
+    stamp still matches are skipped without being loaded or compared.
     
     Args:
         col: Anki collection object
@@ -2464,14 +2729,52 @@ def update_existing_note_type_templates(col, debug_messages=None):
     
     updated_count = 0
     
-    # Search all note types that start with "Sheets2Anki"
-    all_models = col.models.all()
-    sheets2anki_models = [
-        model for model in all_models 
-        if model.get("name", "").startswith("Sheets2Anki")
+    # Read the template settings once for all note types
+    timer_position, ai_assistance_enabled, ai_assistance_config = get_card_template_settings()
+    signature = get_template_signature(
+        timer_position, ai_assistance_enabled, ai_assistance_config
+    )
+
+    try:
+        from .config_manager import get_template_stamps
+        from .config_manager import save_template_stamps
+    except ImportError:
+        get_template_stamps = save_template_stamps = None
+    collection_key = get_collection_stamp_key(col)
+    stamps = get_template_stamps(collection_key) if get_template_stamps else {}
+
+    # Search all note types that start with "Sheets2Anki" (names and IDs only)
+    sheets2anki_ids = [
+        entry.id for entry in col.models.all_names_and_ids()
+        if entry.name.startswith("Sheets2Anki")
     ]
-    
-    debug_messages.append(f"[UPDATE_TEMPLATES] Found {len(sheets2anki_models)} Sheets2Anki note types")
+    mtimes = get_note_type_mtimes(col, sheets2anki_ids)
+    stale_ids = [
+        note_type_id for note_type_id in sheets2anki_ids
+        if stamps.get(str(note_type_id))
+        != get_note_type_stamp(signature, mtimes.get(note_type_id))
+    ]
+
+    debug_messages.append(
+        f"[UPDATE_TEMPLATES] Found {len(sheets2anki_ids)} Sheets2Anki note types, "
+        f"{len(stale_ids)} not stamped with the current templates"
+    )
+
+    current_ids = {str(note_type_id) for note_type_id in sheets2anki_ids}
+    pruned = any(note_type_id not in current_ids for note_type_id in stamps)
+    if not stale_ids:
+        if pruned and save_template_stamps:
+            save_template_stamps(
+                {k: v for k, v in stamps.items() if k in current_ids}, collection_key
+            )
+        debug_messages.append("[UPDATE_TEMPLATES] ⏭️ All note types are up to date")
+        return updated_count
+
+    from anki.models import NotetypeId
+
+    sheets2anki_models = [col.models.get(NotetypeId(note_type_id)) for note_type_id in stale_ids]
+    sheets2anki_models = [model for model in sheets2anki_models if model]
+    checked_ids = []
     
     for model in sheets2anki_models:
         try:
@@ -2509,8 +2812,14 @@ def update_existing_note_type_templates(col, debug_messages=None):
             # Detect if this is a reverse note type by checking the name
             is_reverse = model_name.endswith(" - Reverse")
             
-            # Generate template with correct parameters
-            new_card_template = create_card_template(is_cloze=is_cloze, is_reverse=is_reverse)
+            # Generate template with correct parameters (compiled once per kind)
+            new_card_template = create_card_template(
+                is_cloze=is_cloze,
+                timer_position=timer_position,
+                ai_assistance_enabled=ai_assistance_enabled,
+                is_reverse=is_reverse,
+                ai_assistance_config=ai_assistance_config,
+            )
             templates = model.get("tmpls", [])
             
             if templates:
@@ -2557,11 +2866,28 @@ def update_existing_note_type_templates(col, debug_messages=None):
                 debug_messages.append(f"[UPDATE_TEMPLATES] ✅ {model_name} updated successfully")
             else:
                 debug_messages.append(f"[UPDATE_TEMPLATES] ⏭️ {model_name} is already up to date")
-            
+
+            checked_ids.append(model["id"])
+
         except Exception as e:
             debug_messages.append(f"[UPDATE_TEMPLATES] ❌ Error processing {model.get('name', 'unknown')}: {e}")
             import traceback
             debug_messages.append(traceback.format_exc())
     
+    if save_template_stamps:
+        try:
+            # Saving a note type changes its modification time
+            if updated_count:
+                mtimes.update(get_note_type_mtimes(col, checked_ids))
+            for note_type_id in checked_ids:
+                stamps[str(note_type_id)] = get_note_type_stamp(
+                    signature, mtimes.get(note_type_id)
+                )
+            save_template_stamps(
+                {k: v for k, v in stamps.items() if k in current_ids}, collection_key
+            )
+        except Exception as e:
+            debug_messages.append(f"[UPDATE_TEMPLATES] ⚠️ Could not save template stamps: {e}")
+
     debug_messages.append(f"[UPDATE_TEMPLATES] 🎯 Total note types updated: {updated_count}")
     return updated_count
@@ -0,0 +1,300 @@
+"""
+On-disk cache of remote TSV exports for the Sheets2Anki addon.
+
+Each spreadsheet tab (spreadsheet ID + gid) keeps its last downloaded body
+in a raw .tsv file, next to a small .json file with the ETag, Last-Modified
+and a SHA-256 content hash. The fetch layer uses these values to send
+conditional requests and to detect sheets that did not change since the
+previous sync. Bodies are written and read in chunks, so a cached sheet is
+never held in memory as a whole.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+CACHE_DIR_NAME = "tsv_cache"
+CACHE_CHUNK_SIZE = 64 * 1024
+
+_SPREADSHEET_ID_PATTERN = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+_GID_PATTERN = re.compile(r"[?&#]gid=(\d+)")
+
+
+def get_cache_dir():
+    """
+    Returns the directory where cached TSV exports are stored.
+
+    Returns:
+        str: Absolute path of the cache directory
+    """
+    addon_path = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(addon_path, CACHE_DIR_NAME)
+
+
+def get_cache_key(url):
+    """
+    Builds the cache key (spreadsheet ID and gid) for a spreadsheet URL.
+
+    Args:
+        url (str): Google Sheets edit or TSV export URL
+
+    Returns:
+        tuple: (spreadsheet_id, gid); URLs without a spreadsheet ID are keyed
+            by a hash of the full URL
+    """
+    match = _SPREADSHEET_ID_PATTERN.search(url or "")
+    if match:
+        spreadsheet_id = match.group(1)
+    else:
+        spreadsheet_id = hashlib.sha1((url or "").encode("utf-8")).hexdigest()
+
+    gid_match = _GID_PATTERN.search(url or "")
+    gid = gid_match.group(1) if gid_match else "0"
+
+    return spreadsheet_id, gid
+
+
+def _get_entry_path(url):
+    spreadsheet_id, gid = get_cache_key(url)
+    return os.path.join(get_cache_dir(), f"{spreadsheet_id}_{gid}.json")
+
+
+def _get_body_path(url):
+    spreadsheet_id, gid = get_cache_key(url)
+    return os.path.join(get_cache_dir(), f"{spreadsheet_id}_{gid}.tsv")
+
+
+def compute_content_hash(body):
+    """
+    Calculates the content hash stored with each cache entry.
+
+    Args:
+        body (bytes): Raw response body
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+def compute_file_hash(path, chunk_size=CACHE_CHUNK_SIZE):
+    """
+    Calculates the content hash of a file without loading it whole.
+
+    Args:
+        path (str): File to hash
+        chunk_size (int): Read size in bytes
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_file_chunks(path, chunk_size=CACHE_CHUNK_SIZE):
+    """
+    Yields the contents of a cached body file in chunks.
+
+    Args:
+        path (str): Body file path
+        chunk_size (int): Maximum chunk size in bytes
+
+    Yields:
+        bytes: Consecutive chunks of the file
+    """
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            yield chunk
+
+
+def load_entry(url):
+    """
+    Loads the cached response metadata of a spreadsheet.
+
+    The body stays on disk; the content hash is verified by streaming the
+    body file.
+
+    Args:
+        url (str): Google Sheets edit or TSV export URL
+
+    Returns:
+        dict: Entry with body_path, etag, last_modified, content_hash and
+            saved_at, or None if there is no valid entry
+    """
+    try:
+        with open(_get_entry_path(url), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        body_path = _get_body_path(url)
+        if compute_file_hash(body_path) != entry.get("content_hash"):
+            return None
+        entry["body_path"] = body_path
+        return entry
+    except Exception:
+        return None
+
+
+class CacheBodyWriter:
+    """
+    Writes a response body into the cache chunk by chunk.
+
+    Chunks go to a temporary file in the cache directory while the content
+    hash is updated incrementally. commit() moves the file into place and
+    writes the metadata entry; discard() drops it.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.size = 0
+        self._digest = hashlib.sha256()
+        cache_dir = get_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+
+    @property
+    def content_hash(self):
+        """SHA-256 hex digest of the bytes written so far."""
+        return self._digest.hexdigest()
+
+    def write(self, chunk):
+        """
+        Appends a chunk to the body.
+
+        Args:
+            chunk (bytes): Next part of the response body
+        """
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+
+    def read_body(self):
+        """
+        Reads back the whole body written so far.
+
+        Only used when the entry could not be committed, so the response can
+        still be returned to the caller.
+
+        Returns:
+            bytes: Body contents
+        """
+        # commit() closes the file before moving it into place
+        if not self._file.closed:
+            self._file.flush()
+        with open(self.temp_path, "rb") as f:
+            return f.read()
+
+    def commit(self, etag=None, last_modified=None):
+        """
+        Stores the body and its metadata, replacing any previous entry.
+
+        Args:
+            etag (str, optional): ETag header of the response
+            last_modified (str, optional): Last-Modified header of the response
+
+        Returns:
+            str: Path of the cached body file, or None if it could not be
+                stored (the temporary file is kept until discard())
+        """
+        try:
+            self._file.close()
+            body_path = _get_body_path(self.url)
+            os.replace(self.temp_path, body_path)
+        except Exception:
+            return None
+
+        entry = {
+            "url": self.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": self.content_hash,
+            "saved_at": time.time(),
+        }
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=get_cache_dir(), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(temp_path, _get_entry_path(self.url))
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except Exception:
+            # The body is in place but unreferenced; the next load_entry()
+            # treats the spreadsheet as uncached.
+            pass
+        return body_path
+
+    def discard(self):
+        """Closes and removes the temporary body file, if still present."""
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+
+
+def get_conditional_headers(entry):
+    """
+    Builds If-None-Match / If-Modified-Since headers for a cached entry.
+
+    Args:
+        entry (dict): Entry returned by load_entry(), or None
+
+    Returns:
+        dict: Request headers (empty if there is nothing to validate against)
+    """
+    headers = {}
+    if not entry:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def remove_entry(url):
+    """
+    Removes the cached response of a spreadsheet, if any.
+
+    Args:
+        url (str): Google Sheets edit or TSV export URL
+    """
+    for path in (_get_entry_path(url), _get_body_path(url)):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def clear_cache():
+    """
+    Removes all cached responses.
+
+    Returns:
+        int: Number of entries removed
+    """
+    removed = 0
+    cache_dir = get_cache_dir()
+    if not os.path.isdir(cache_dir):
+        return removed
+    for filename in os.listdir(cache_dir):
+        if filename.endswith((".json", ".tsv", ".tmp")):
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+                if filename.endswith(".json"):
+                    removed += 1
+            except OSError:
+                pass
+    return removed
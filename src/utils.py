@@ -5,17 +5,23 @@ This module contains auxiliary functions used in
 different parts of the project.
 """
 
+import atexit
 import hashlib
 import re
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import List
+from typing import NamedTuple
 
 try:
     from .compat import mw
+    from . import templates_and_definitions as cols
     from .templates_and_definitions import DEFAULT_PARENT_DECK_NAME
 except ImportError:
     # For independent tests
     from compat import mw
+    import templates_and_definitions as cols
     from templates_and_definitions import DEFAULT_PARENT_DECK_NAME
 
 
@@ -330,6 +336,7 @@ def sync_note_type_names_with_config(col, deck_url, debug_messages=None):
                     # Update note type name in Anki
                     note_type["name"] = expected_name
                     col.models.save(note_type)
+                    cols.mark_note_types_changed()
 
                     # Force collection save to ensure immediate persistence
                     col.save()
@@ -802,6 +809,7 @@ def rename_note_type_in_anki(note_type_id, new_name):
 
         # Save changes
         mw.col.models.save(model)
+        cols.mark_note_types_changed()
 
         add_debug_message("✅ Note type successfully renamed!", "RENAME_NOTE_TYPE")
         return True
@@ -1974,35 +1982,111 @@ def get_or_create_root_options_group():
 # =============================================================================
 
 
+class BufferedLogWriter:
+    """
+    Appends lines to a log file from a background thread.
+
+    write() only queues the line; a daemon thread writes the queued lines
+    every FLUSH_INTERVAL_SECONDS (or as soon as MAX_PENDING_LINES are
+    waiting) with one open/write per batch. flush() writes synchronously.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 0.5
+    MAX_PENDING_LINES = 500
+
+    def __init__(self, path_getter):
+        """
+        Args:
+            path_getter (callable): Returns the log file path
+        """
+        self._path_getter = path_getter
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def write(self, line: str) -> None:
+        """Queues a line for the log file."""
+        with self._lock:
+            self._pending.append(line)
+            pending_count = len(self._pending)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="Sheets2AnkiLogWriter", daemon=True
+                )
+                self._thread.start()
+        if pending_count >= self.MAX_PENDING_LINES:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Writes all queued lines now."""
+        with self._write_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+            if not lines:
+                return
+            try:
+                with open(self._path_getter(), "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception as e:
+                # We don't use add_debug_message here to avoid potential infinite recursion
+                print(f"[DEBUG_FILE] Error saving log: {e}")
+
+    def discard(self) -> None:
+        """Drops queued lines that were not written yet."""
+        with self._write_lock:
+            with self._lock:
+                self._pending = []
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+
+
 class DebugManager:
     """Centralized debug manager for Sheets2Anki."""
 
     def __init__(self):
         self.messages: List[str] = []
         self.is_debug_enabled = False
-        self._update_debug_status()
+        self._status_loaded = False
+        self._log_writer = BufferedLogWriter(self.get_log_path)
+        atexit.register(self._log_writer.flush)
 
     def _update_debug_status(self):
         """Updates debug status based on configuration."""
         try:
+            from .config_manager import add_meta_listener
             from .config_manager import get_meta
 
-            meta = get_meta()
-            # Debug is in the config section of meta.json
-            self.is_debug_enabled = meta.get("config", {}).get("debug", False)
+            if not self._status_loaded:
+                # Keep the flag in sync with every meta.json load or save
+                add_meta_listener(self._on_meta_changed)
+                self._status_loaded = True
+            self._on_meta_changed(get_meta())
         except Exception:
             self.is_debug_enabled = False
 
+    def _on_meta_changed(self, meta):
+        # Debug is in the config section of meta.json
+        self.is_debug_enabled = bool(meta.get("config", {}).get("debug", False))
+
     def add_message(self, message: str, category: str = "DEBUG") -> None:
         """
         Adds a debug message.
 
+        The debug flag is cached and refreshed whenever meta.json is loaded or
+        saved, so a call with debugging disabled is a single attribute check.
+
         Args:
             message: Debug message
             category: Message category (SYNC, DECK, ERROR, etc.)
         """
-        # Ensure we have the latest debug status
-        self._update_debug_status()
+        if not self._status_loaded:
+            self._update_debug_status()
 
         if not self.is_debug_enabled:
             return
@@ -2019,26 +2103,16 @@ class DebugManager:
 
     def _save_to_file(self, message: str) -> None:
         """
-        Saves debug message to file.
+        Queues a debug message for the log file (written in the background).
 
         Args:
             message: Formatted message to save
         """
-        try:
-            import os
+        self._log_writer.write(message)
 
-            # Determine log file path
-            addon_path = os.path.dirname(os.path.dirname(__file__))
-            log_path = os.path.join(addon_path, "debug_sheets2anki.log")
-
-            # Save to file
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(message + "\n")
-                f.flush()  # Force immediate write
-
-        except Exception as e:
-            # We don't use add_debug_message here to avoid potential infinite recursion
-            print(f"[DEBUG_FILE] Error saving log: {e}")
+    def flush_log(self) -> None:
+        """Writes queued log messages to the log file."""
+        self._log_writer.flush()
 
     def get_messages(self) -> List[str]:
         """Returns all debug messages."""
@@ -2056,6 +2130,8 @@ class DebugManager:
         if not self.is_debug_enabled:
             return
 
+        self._log_writer.flush()
+
         try:
             import os
 
@@ -2154,6 +2230,11 @@ def get_debug_log_path() -> str:
     return debug_manager.get_log_path()
 
 
+def flush_debug_log() -> None:
+    """Writes queued debug messages to the log file."""
+    debug_manager.flush_log()
+
+
 def clear_debug_log():
     """
     Clears the debug log file and starts a new one.
@@ -2162,6 +2243,7 @@ def clear_debug_log():
         from datetime import datetime
 
         log_path = debug_manager.get_log_path()
+        debug_manager._log_writer.discard()
 
         with open(log_path, "w", encoding="utf-8") as f:
             f.write(
@@ -2227,25 +2309,96 @@ def convert_edit_url_to_tsv(url):
     )
 
 
-def validate_url(url):
+TSV_FETCH_CHUNK_SIZE = 64 * 1024
+
+
+class TsvResponse:
     """
-    Validates if the URL is a valid Google Sheets edit URL.
+    Result of a single HTTP request to a TSV export URL.
+
+    The same response is used to validate the URL (status, Content-Type) and
+    to feed the TSV parser, so each deck is downloaded only once per sync.
+
+    When the response cache is used, the body is not kept in memory: it is
+    read back from body_path, the cached body file. Otherwise body holds the
+    raw bytes.
+
+    When the response cache is used, from_cache is True if the server answered
+    304 Not Modified, and unchanged is True if the body has the same content
+    hash as the previous download.
+    """
+
+    def __init__(
+        self,
+        url,
+        status,
+        content_type,
+        headers,
+        body=None,
+        content_hash=None,
+        from_cache=False,
+        unchanged=False,
+        body_path=None,
+    ):
+        self.url = url
+        self.status = status
+        self.content_type = content_type
+        self.headers = headers
+        self._body = body
+        self.body_path = body_path
+        self.content_hash = content_hash
+        self.from_cache = from_cache
+        self.unchanged = unchanged
+
+    @property
+    def body(self):
+        """Raw response body; read from the cache file on each access."""
+        if self._body is None and self.body_path:
+            with open(self.body_path, "rb") as f:
+                return f.read()
+        return self._body or b""
+
+    @property
+    def text(self):
+        """Response body decoded as UTF-8."""
+        return self.body.decode("utf-8")
+
+    def iter_chunks(self, chunk_size=64 * 1024):
+        """
+        Yields the response body in chunks.
+
+        Cached bodies are read from disk chunk by chunk; in-memory bodies
+        are sliced without copying.
+
+        Args:
+            chunk_size (int): Maximum chunk size in bytes
+
+        Yields:
+            bytes or memoryview: Consecutive parts of the body
+        """
+        if self._body is None and self.body_path:
+            from . import tsv_cache
+
+            yield from tsv_cache.iter_file_chunks(self.body_path, chunk_size)
+            return
+        view = memoryview(self._body or b"")
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+
+
+def resolve_tsv_url(url):
+    """
+    Validates the URL format and returns the TSV export URL, without network access.
 
     Args:
-        url (str): The URL to be validated
+        url (str): Google Sheets edit URL or TSV export URL
 
     Returns:
-        str: URL in valid TSV format for download
+        str: URL in TSV format for download
 
     Raises:
-        ValueError: If the URL is invalid or inaccessible
-        URLError: If there are network connectivity issues
-        HTTPError: If the server returns a status error
+        ValueError: If the URL format is invalid
     """
-    import socket
-    import urllib.error
-    import urllib.request
-
     # Check if URL is not empty
     if not url or not isinstance(url, str):
         raise ValueError("URL must be a non-empty string")
@@ -2260,41 +2413,131 @@ def validate_url(url):
 
     # Convert to TSV format
     try:
-        tsv_url = convert_edit_url_to_tsv(url)
+        return convert_edit_url_to_tsv(url)
     except ValueError as e:
         raise ValueError(f"Invalid URL: {str(e)}")
 
-    # Test TSV URL accessibility with timeout and proper error handling
+
+def fetch_tsv_response(url, timeout=30, use_cache=True):
+    """
+    Downloads a spreadsheet TSV export with a single request and validates it.
+
+    With use_cache, the request is conditional (If-None-Match /
+    If-Modified-Since) on the last cached response of the same spreadsheet
+    tab; a 304 answer is served from the cache.
+
+    Args:
+        url (str): Google Sheets edit URL or TSV export URL
+        timeout (int): Timeout in seconds
+        use_cache (bool): Whether to use the on-disk response cache
+
+    Returns:
+        TsvResponse: Validated response; with use_cache its body is streamed
+            into the cache file instead of being kept in memory
+
+    Raises:
+        ValueError: If the URL is invalid, inaccessible or does not return TSV
+    """
+    import socket
+    import urllib.error
+    import urllib.request
+
+    from . import tsv_cache
+
+    tsv_url = resolve_tsv_url(url)
+    cached_entry = tsv_cache.load_entry(tsv_url) if use_cache else None
+
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Sheets2Anki) AnkiAddon"  # More specific user agent
         }
+        headers.update(tsv_cache.get_conditional_headers(cached_entry))
         request = urllib.request.Request(tsv_url, headers=headers)
 
         # USE LOCAL TIMEOUT instead of global it to avoid conflicts
-        response = urllib.request.urlopen(request, timeout=30)  # ✅ LOCAL TIMEOUT
+        with urllib.request.urlopen(request, timeout=timeout) as response:  # ✅ LOCAL TIMEOUT
+            if response.getcode() != 200:
+                raise ValueError(
+                    f"URL returned unexpected status code: {response.getcode()}"
+                )
 
-        if response.getcode() != 200:
-            raise ValueError(
-                f"URL returned unexpected status code: {response.getcode()}"
-            )
+            # Validate content type
+            content_type = response.headers.get("Content-Type", "").lower()
+            if not any(
+                valid_type in content_type
+                for valid_type in ["text/tab-separated-values", "text/plain", "text/csv"]
+            ):
+                raise ValueError(f"URL does not return TSV content (received {content_type})")
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            body = None
+            body_path = None
+
+            writer = None
+            if use_cache:
+                try:
+                    writer = tsv_cache.CacheBodyWriter(tsv_url)
+                except OSError as e:
+                    add_debug_message(f"TSV cache unavailable, reading in memory: {e}", "FETCH")
 
-        # Validate content type
-        content_type = response.headers.get("Content-Type", "").lower()
-        if not any(
-            valid_type in content_type
-            for valid_type in ["text/tab-separated-values", "text/plain", "text/csv"]
-        ):
-            raise ValueError(f"URL does not return TSV content (received {content_type})")
+            if writer is not None:
+                # Spool the body into the cache while hashing it, so the
+                # sheet is never held in memory as a whole.
+                try:
+                    for chunk in iter(lambda: response.read(TSV_FETCH_CHUNK_SIZE), b""):
+                        writer.write(chunk)
+                    content_hash = writer.content_hash
+                    unchanged = bool(
+                        cached_entry and cached_entry.get("content_hash") == content_hash
+                    )
+                    if (
+                        unchanged
+                        and cached_entry.get("etag") == etag
+                        and cached_entry.get("last_modified") == last_modified
+                    ):
+                        body_path = cached_entry["body_path"]
+                    else:
+                        body_path = writer.commit(etag=etag, last_modified=last_modified)
+                        if body_path is None:
+                            body = writer.read_body()
+                finally:
+                    writer.discard()
+            else:
+                body = response.read()
+                content_hash = tsv_cache.compute_content_hash(body)
+                unchanged = bool(
+                    cached_entry and cached_entry.get("content_hash") == content_hash
+                )
 
-        # Return valid TSV URL
-        return tsv_url
+            return TsvResponse(
+                url=tsv_url,
+                status=response.getcode(),
+                content_type=content_type,
+                headers=dict(response.headers.items()),
+                body=body,
+                content_hash=content_hash,
+                unchanged=unchanged,
+                body_path=body_path,
+            )
 
     except socket.timeout:
         raise ValueError(
-            "Connection timeout when accessing the URL (30s). Check your connection or try again."
+            f"Connection timeout when accessing the URL ({timeout}s). Check your connection or try again."
         )
     except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_entry:
+            add_debug_message(f"Sheet not modified, using cached export: {tsv_url}", "FETCH")
+            return TsvResponse(
+                url=tsv_url,
+                status=304,
+                content_type="text/tab-separated-values",
+                headers=dict(e.headers.items()) if e.headers else {},
+                body_path=cached_entry["body_path"],
+                content_hash=cached_entry["content_hash"],
+                from_cache=True,
+                unchanged=True,
+            )
         if e.code == 400:
             raise ValueError(
                 f"HTTP Error 400: The spreadsheet is not publicly accessible.\n\n"
@@ -2322,6 +2565,35 @@ def validate_url(url):
         raise ValueError(f"Unexpected error accessing URL: {str(e)}")
 
 
+def validate_url(url):
+    """
+    Validates if the URL is a valid Google Sheets edit URL.
+
+    Callers that also need the sheet contents should use fetch_tsv_response()
+    instead, so the spreadsheet is not downloaded twice.
+
+    Args:
+        url (str): The URL to be validated
+
+    Returns:
+        str: URL in valid TSV format for download
+
+    Raises:
+        ValueError: If the URL is invalid or inaccessible
+    """
+    tsv_url = resolve_tsv_url(url)
+
+    # If URL is already in TSV format, return it directly
+    if "/export?format=tsv" in url:
+        return tsv_url
+
+    # Test TSV URL accessibility
+    fetch_tsv_response(tsv_url, timeout=30)
+
+    # Return valid TSV URL
+    return tsv_url
+
+
 # ========================================================================================
 # CUSTOM EXCEPTIONS (consolidated from exceptions.py)
 # ========================================================================================
@@ -2356,6 +2628,125 @@ class ConfigurationError(Exception):
 # =============================================================================
 
 
+# =============================================================================
+# HIERARCHY NORMALIZATION (TAGS AND SUBDECK NAMES)
+# =============================================================================
+
+_TAG_INVALID_CHARS_PATTERN = re.compile(r"[^\w\-_\[\]]")
+_DECK_INVALID_CHARS_PATTERN = re.compile(r"[^\w\s\-_\[\]()]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def clean_tag_text(text):
+    """
+    Cleans text for use as Anki tag - always returns lowercase.
+
+    Args:
+        text (str): Raw cell value
+
+    Returns:
+        str: Cleaned tag component (may be empty)
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    # Remove extra spaces, replace spaces with underscores and problematic characters
+    cleaned = text.strip().replace(" ", "_").replace(":", "_").replace(";", "_")
+    # Remove special characters that may cause issues in Anki, but allow brackets
+    cleaned = _TAG_INVALID_CHARS_PATTERN.sub("", cleaned)
+    # Always return lowercase for consistency (Anki tags are case-insensitive)
+    return cleaned.lower()
+
+
+@lru_cache(maxsize=4096)
+def clean_deck_text(text):
+    """
+    Cleans text for use as Anki deck name (single value, NOT list).
+
+    Args:
+        text (str): Raw cell value
+
+    Returns:
+        str: Cleaned deck name component (may be empty)
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    # Remove problematic characters but keep spaces intact
+    # Deck names can't contain :: as it's the separator
+    cleaned = text.strip().replace("::", "_").replace(":", "_")
+    # Remove special characters that may cause issues, but allow brackets and basic punctuation
+    cleaned = _DECK_INVALID_CHARS_PATTERN.sub("", cleaned)
+    # Normalize multiple spaces to single space (keep spaces, don't replace with underscores)
+    cleaned = _WHITESPACE_PATTERN.sub(" ", cleaned)
+    return cleaned
+
+
+class HierarchyNames(NamedTuple):
+    """Tags and subdeck path derived from IMPORTANCE, TOPIC, SUBTOPIC and CONCEPT."""
+
+    topics_tag: str  # sheets2anki::topics::topic::subtopic::concept
+    concept_tag: str  # sheets2anki::concepts::concept
+    importance_tag: str  # sheets2anki::importance::importance
+    subdeck_path: str  # Importance::Topic::Subtopic::Concept
+
+
+@lru_cache(maxsize=1024)
+def normalize_hierarchy(importance, topic, subtopic, concept):
+    """
+    Builds the hierarchy tags and subdeck path for one set of hierarchy values.
+
+    Spreadsheets repeat a few dozen hierarchy paths across thousands of rows,
+    so results are memoized by the raw (stripped) values.
+
+    Args:
+        importance (str): IMPORTANCE value ("" for missing)
+        topic (str): TOPIC value ("" for missing)
+        subtopic (str): SUBTOPIC value ("" for missing)
+        concept (str): CONCEPT value ("" for missing)
+
+    Returns:
+        HierarchyNames: Tags and subdeck path
+    """
+    # Use default values if empty
+    raw_values = (
+        (importance or cols.DEFAULT_IMPORTANCE, cols.DEFAULT_IMPORTANCE),
+        (topic or cols.DEFAULT_TOPIC, cols.DEFAULT_TOPIC),
+        (subtopic or cols.DEFAULT_SUBTOPIC, cols.DEFAULT_SUBTOPIC),
+        (concept or cols.DEFAULT_CONCEPT, cols.DEFAULT_CONCEPT),
+    )
+
+    # If cleaning results in empty string (e.g., field had only invalid characters),
+    # use the default placeholder to ensure tags and subdecks are always generated
+    tag_parts = [clean_tag_text(value) or clean_tag_text(default) for value, default in raw_values]
+    deck_parts = [clean_deck_text(value) or clean_deck_text(default) for value, default in raw_values]
+
+    importance_tag, topic_tag, subtopic_tag, concept_tag = tag_parts
+    return HierarchyNames(
+        topics_tag=f"{cols.TAG_ROOT}::{cols.TAG_TOPICS}::{topic_tag}::{subtopic_tag}::{concept_tag}",
+        concept_tag=f"{cols.TAG_ROOT}::{cols.TAG_CONCEPTS}::{concept_tag}",
+        importance_tag=f"{cols.TAG_ROOT}::{cols.TAG_IMPORTANCE}::{importance_tag}",
+        subdeck_path="::".join(deck_parts),
+    )
+
+
+def get_hierarchy_names(fields):
+    """
+    Returns the memoized hierarchy tags and subdeck path of a note.
+
+    Args:
+        fields (dict): Note fields with IMPORTANCE, TOPIC, SUBTOPIC and CONCEPT
+
+    Returns:
+        HierarchyNames: Tags and subdeck path
+    """
+    return normalize_hierarchy(
+        fields.get(cols.hierarchy_1, "").strip(),
+        fields.get(cols.hierarchy_2, "").strip(),
+        fields.get(cols.hierarchy_3, "").strip(),
+        fields.get(cols.hierarchy_4, "").strip(),
+    )
+
+
 def get_subdeck_name(main_deck_name, fields, student=None):
     """
     Generates subdeck name based on main deck and IMPORTANCE, TOPIC, SUBTOPIC and CONCEPT fields.
@@ -2368,62 +2759,15 @@ def get_subdeck_name(main_deck_name, fields, student=None):
     Returns:
         str: Full subdeck name in the format "MainDeck::[Student::]Importance::Topic::Subtopic::Concept"
     """
-    import re
-    from . import templates_and_definitions as cols
-
-    def clean_deck_text(text):
-        """Cleans text for use as Anki deck name (single value, NOT list)."""
-        if not text or not isinstance(text, str):
-            return ""
-        # Remove problematic characters but keep spaces intact
-        # Deck names can't contain :: as it's the separator
-        cleaned = text.strip().replace("::", "_").replace(":", "_")
-        # Remove special characters that may cause issues, but allow brackets and basic punctuation
-        cleaned = re.sub(r"[^\w\s\-_\[\]()]", "", cleaned)
-        # Normalize multiple spaces to single space (keep spaces, don't replace with underscores)
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        return cleaned
-
-    # Get field values (single values, NOT lists)
-    importancia_raw = fields.get(cols.hierarchy_1, "").strip()
-    topico_raw = fields.get(cols.hierarchy_2, "").strip()
-    subtopico_raw = fields.get(cols.hierarchy_3, "").strip()
-    conceito_raw = fields.get(cols.hierarchy_4, "").strip()
-    
-    # Use default values if empty
-    if not importancia_raw:
-        importancia_raw = cols.DEFAULT_IMPORTANCE
-    if not topico_raw:
-        topico_raw = cols.DEFAULT_TOPIC
-    if not subtopico_raw:
-        subtopico_raw = cols.DEFAULT_SUBTOPIC
-    if not conceito_raw:
-        conceito_raw = cols.DEFAULT_CONCEPT
-    
-    # Clean for deck name use
-    importancia = clean_deck_text(importancia_raw)
-    topico = clean_deck_text(topico_raw)
-    subtopico = clean_deck_text(subtopico_raw)
-    conceito = clean_deck_text(conceito_raw)
-    
-    # If cleaning results in empty string (e.g., field had only invalid characters),
-    # use the default placeholder
-    if not importancia:
-        importancia = clean_deck_text(cols.DEFAULT_IMPORTANCE)
-    if not topico:
-        topico = clean_deck_text(cols.DEFAULT_TOPIC)
-    if not subtopico:
-        subtopico = clean_deck_text(cols.DEFAULT_SUBTOPIC)
-    if not conceito:
-        conceito = clean_deck_text(cols.DEFAULT_CONCEPT)
+    subdeck_path = get_hierarchy_names(fields).subdeck_path
 
     # Create full subdeck hierarchy
     if student:
         # With student: Deck::Student::Importance::Topic::Subtopic::Concept
-        return f"{main_deck_name}::{student}::{importancia}::{topico}::{subtopico}::{conceito}"
+        return f"{main_deck_name}::{student}::{subdeck_path}"
     else:
         # Without student: Deck::Importance::Topic::Subtopic::Concept (compatibility)
-        return f"{main_deck_name}::{importancia}::{topico}::{subtopico}::{conceito}"
+        return f"{main_deck_name}::{subdeck_path}"
 
 
 def ensure_subdeck_exists(deck_name):
@@ -495,5 +495,207 @@ class TestConfigIntegration:
         assert "Peter" in final_config["global_students"]
 
 
+
+# =============================================================================
+# META.JSON STORE TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def meta_store(tmp_path, monkeypatch):
+    """Points the meta.json store at a temporary file."""
+    from src import config_manager
+
+    meta_path = tmp_path / "meta.json"
+    meta_path.write_text(json.dumps({"decks": {}, "config": {"debug": False}}), encoding="utf-8")
+    monkeypatch.setattr(config_manager, "_get_meta_path", lambda: str(meta_path))
+    config_manager.invalidate_meta_cache()
+    yield meta_path
+    config_manager.invalidate_meta_cache()
+
+
+@pytest.mark.unit
+class TestMetaStore:
+    """meta.json is parsed once and written back in batches."""
+
+    def test_parsed_once_while_file_unchanged(self, meta_store):
+        """Repeated reads do not parse the file again."""
+        from src import config_manager
+
+        with patch.object(
+            config_manager, "_load_meta_from_disk", wraps=config_manager._load_meta_from_disk
+        ) as load:
+            for _ in range(100):
+                config_manager.get_meta()
+                config_manager.get_remote_decks()
+
+        assert load.call_count == 1
+
+    def test_reloaded_when_file_changes(self, meta_store):
+        """An external change of meta.json (e.g. a restored backup) is picked up."""
+        from src import config_manager
+
+        assert config_manager.get_meta()["config"]["debug"] is False
+
+        meta_store.write_text(
+            json.dumps({"decks": {}, "config": {"debug": True, "timer_position": "hidden"}}),
+            encoding="utf-8",
+        )
+
+        assert config_manager.get_meta()["config"]["debug"] is True
+
+    def test_writes_are_coalesced_in_batch(self, meta_store):
+        """Inside a batch, saves stay in memory until the flush."""
+        from src import config_manager
+
+        with patch.object(
+            config_manager, "_write_meta_to_disk", wraps=config_manager._write_meta_to_disk
+        ) as write:
+            with config_manager.meta_write_batch():
+                for i in range(20):
+                    meta = config_manager.get_meta()
+                    meta["config"]["counter"] = i
+                    config_manager.save_meta(meta)
+
+                assert write.call_count == 0
+                assert config_manager.get_meta()["config"]["counter"] == 19
+                assert "counter" not in json.loads(meta_store.read_text(encoding="utf-8"))["config"]
+
+        assert write.call_count == 1
+        assert json.loads(meta_store.read_text(encoding="utf-8"))["config"]["counter"] == 19
+
+    def test_unsaved_edits_do_not_leak_into_the_store(self, meta_store):
+        """get_meta returns a private copy; only save_meta changes the store."""
+        from src import config_manager
+
+        abandoned = config_manager.get_meta()
+        abandoned["config"]["debug"] = "abandoned"
+
+        meta = config_manager.get_meta()
+        meta["config"]["counter"] = 1
+        config_manager.save_meta(meta)
+        meta["config"]["counter"] = 2
+
+        stored = json.loads(meta_store.read_text(encoding="utf-8"))["config"]
+        assert stored.get("debug") != "abandoned"
+        assert stored["counter"] == 1
+        assert config_manager.get_meta()["config"]["counter"] == 1
+
+    def test_template_stamps_are_kept_per_collection(self, meta_store):
+        """Saving one collection's stamps keeps other collections and drops the flat format."""
+        from src import config_manager
+
+        meta = config_manager.get_meta()
+        meta["template_stamps"] = {"12": "legacy-signature", "other": {"7": "sig:5"}}
+        config_manager.save_meta(meta)
+
+        config_manager.save_template_stamps({"1": "sig:9"}, "profile")
+
+        assert config_manager.get_template_stamps("profile") == {"1": "sig:9"}
+        assert config_manager.get_template_stamps("other") == {"7": "sig:5"}
+        assert config_manager.get_template_stamps("12") == {}
+        assert set(config_manager.get_meta()["template_stamps"]) == {"profile", "other"}
+
+    def test_removed_decks_lose_their_sync_fingerprint(self, meta_store):
+        """Removing or disconnecting a deck drops its stored sync fingerprint."""
+        from src import config_manager
+
+        urls = [
+            f"https://docs.google.com/spreadsheets/d/sheet{i}/edit?usp=sharing"
+            for i in range(3)
+        ]
+        meta = config_manager.get_meta()
+        meta["decks"] = {config_manager.get_deck_id(url): {} for url in urls}
+        config_manager.save_meta(meta)
+        for url in urls:
+            config_manager.save_deck_sync_fingerprint(url, {"fingerprint": url})
+
+        config_manager.remove_remote_deck(urls[0])
+        config_manager.disconnect_deck(urls[1])
+
+        assert config_manager.get_deck_sync_fingerprint(urls[0]) is None
+        assert config_manager.get_deck_sync_fingerprint(urls[1]) is None
+        assert config_manager.get_deck_sync_fingerprint(urls[2]) == {"fingerprint": urls[2]}
+
+    def test_save_outside_batch_writes_atomically(self, meta_store):
+        """A plain save replaces the file without leaving temporary files."""
+        from src import config_manager
+
+        meta = config_manager.get_meta()
+        meta["config"]["debug"] = True
+        config_manager.save_meta(meta)
+
+        assert json.loads(meta_store.read_text(encoding="utf-8"))["config"]["debug"] is True
+        assert [p.name for p in meta_store.parent.iterdir()] == ["meta.json"]
+
+        # Our own write does not trigger a reload
+        with patch.object(config_manager, "_load_meta_from_disk") as load:
+            config_manager.get_meta()
+        load.assert_not_called()
+
+
+# =============================================================================
+# STUDENT DISCOVERY TESTS
+# =============================================================================
+
+
+def _discovery_decks(count):
+    return {
+        f"deck{i}": {
+            "remote_deck_name": f"Deck {i}",
+            "remote_deck_url": f"https://docs.google.com/spreadsheets/d/deck{i}/edit",
+        }
+        for i in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestStudentDiscovery:
+    """Students are discovered from all decks concurrently."""
+
+    def test_decks_are_downloaded_concurrently(self):
+        """Discovery takes about one deck latency, not the sum of all of them."""
+        import time
+
+        from src import config_manager
+
+        def slow_discover(url):
+            time.sleep(0.2)
+            return {url.split("/")[-2].replace("deck", "Student ")}
+
+        with patch("src.student_manager.discover_students_from_tsv_url", side_effect=slow_discover):
+            start = time.monotonic()
+            students = config_manager.discover_all_students_from_remote_decks(
+                _discovery_decks(6)
+            )
+            elapsed = time.monotonic() - start
+
+        assert students == [f"Student {i}" for i in range(6)]
+        # 6 decks x 0.2 s sequentially would take 1.2 s
+        assert elapsed < 0.8
+
+    def test_each_deck_is_reported(self):
+        """The callback receives every deck, including failed ones."""
+        from src import config_manager
+
+        def discover(url):
+            if "deck1" in url:
+                raise ValueError("HTTP Error 404")
+            return {"John", " Mary "}
+
+        reports = []
+        with patch("src.student_manager.discover_students_from_tsv_url", side_effect=discover):
+            students = config_manager.discover_all_students_from_remote_decks(
+                _discovery_decks(3),
+                on_deck_discovered=lambda *args: reports.append(args),
+            )
+
+        assert students == ["John", "Mary"]
+        assert sorted(report[0] for report in reports) == ["Deck 0", "Deck 1", "Deck 2"]
+        assert sorted(report[3] for report in reports) == [1, 2, 3]
+        assert all(report[4] == 3 for report in reports)
+        failed = [report for report in reports if report[0] == "Deck 1"][0]
+        assert isinstance(failed[2], ValueError)
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -432,11 +432,797 @@ class TestRemoteDeck:
             fetch_remote_deck_with_error(url)
 
 
+# =============================================================================
+# UNCHANGED DECK FAST PATH TESTS
+# =============================================================================
+
+DECK_URL = "https://docs.google.com/spreadsheets/d/abc123/edit"
+
+
+def _build_fast_path_deck(content_hash="hash-1"):
+    from src.data_processor import build_remote_deck_from_tsv
+
+    parsed = {
+        "headers": ["ID", "QUESTION", "ANSWER", "SYNC", "STUDENTS"],
+        "rows": [
+            ["Q001", "Capital of Brazil?", "Brasília", "true", "John"],
+            ["Q002", "2+2?", "4", "false", "John"],
+        ],
+    }
+    remote_deck = build_remote_deck_from_tsv(parsed, DECK_URL, ["John"])
+    remote_deck.content_hash = content_hash
+    return remote_deck
+
+
+@pytest.fixture
+def fast_path_config():
+    """Patches the configuration read by create_or_update_notes."""
+    stored = {}
+    meta = {"students": {"enabled_students": ["John"], "sync_missing_students_notes": False}}
+    with patch("src.student_manager.get_meta", return_value=meta), \
+         patch("src.config_manager.is_auto_remove_disabled_students", return_value=False), \
+         patch("src.config_manager.get_deck_remote_name", return_value="Deck"), \
+         patch("src.config_manager.get_deck_sync_fingerprint", side_effect=lambda url: stored.get(url)), \
+         patch("src.config_manager.save_deck_sync_fingerprint", side_effect=lambda url, data: stored.__setitem__(url, data)):
+        yield stored
+
+
+@pytest.mark.unit
+class TestUnchangedDeckFastPath:
+    """Tests for skipping reconciliation of unchanged decks."""
+
+    def test_fingerprint_covers_inputs(self, fast_path_config):
+        """Fingerprint changes with content, students and settings."""
+        from src.data_processor import compute_deck_sync_fingerprint
+
+        deck = _build_fast_path_deck()
+        base = compute_deck_sync_fingerprint(deck, {"John"}, False, DECK_URL)
+
+        assert base == compute_deck_sync_fingerprint(deck, {"John"}, False, DECK_URL)
+        assert base != compute_deck_sync_fingerprint(deck, {"John", "Mary"}, False, DECK_URL)
+        assert base != compute_deck_sync_fingerprint(deck, {"John"}, True, DECK_URL)
+        assert base != compute_deck_sync_fingerprint(
+            _build_fast_path_deck("hash-2"), {"John"}, False, DECK_URL
+        )
+        assert compute_deck_sync_fingerprint(
+            _build_fast_path_deck(None), {"John"}, False, DECK_URL
+        ) is None
+
+    def test_unchanged_deck_skips_reconciliation(self, fast_path_config):
+        """Second sync of an identical sheet does not touch existing notes."""
+        from src import data_processor
+
+        col = MagicMock()
+        col.decks.get.return_value = {"name": "Sheets2Anki::Deck"}
+        col.find_notes.return_value = [1]
+
+        with patch.object(data_processor, "ensure_custom_models"), \
+             patch.object(data_processor, "get_existing_notes_by_student_id", return_value={}) as existing_mock, \
+             patch.object(data_processor, "prepare_new_note_for_student", return_value=(Mock(), 1)):
+            first = data_processor.create_or_update_notes(
+                col, _build_fast_path_deck(), 1, deck_url=DECK_URL
+            )
+            second = data_processor.create_or_update_notes(
+                col, _build_fast_path_deck(), 1, deck_url=DECK_URL
+            )
+
+        assert first.created == 1
+        assert not first.deck_unchanged
+        assert second.deck_unchanged
+        assert second.unchanged == 1
+        assert second.skipped == first.skipped
+        assert existing_mock.call_count == 1
+
+    def test_local_note_count_change_forces_full_sync(self, fast_path_config):
+        """A note removed locally disables the fast path."""
+        from src import data_processor
+
+        col = MagicMock()
+        col.decks.get.return_value = {"name": "Sheets2Anki::Deck"}
+        col.find_notes.return_value = [1]
+
+        with patch.object(data_processor, "ensure_custom_models"), \
+             patch.object(data_processor, "get_existing_notes_by_student_id", return_value={}) as existing_mock, \
+             patch.object(data_processor, "prepare_new_note_for_student", return_value=(Mock(), 1)):
+            data_processor.create_or_update_notes(
+                col, _build_fast_path_deck(), 1, deck_url=DECK_URL
+            )
+            col.find_notes.return_value = []
+            second = data_processor.create_or_update_notes(
+                col, _build_fast_path_deck(), 1, deck_url=DECK_URL
+            )
+
+        assert not second.deck_unchanged
+        assert existing_mock.call_count == 2
+
+
+def _build_classification_deck(row_count):
+    from src.data_processor import build_remote_deck_from_tsv
+
+    parsed = {
+        "headers": ["ID", "QUESTION", "ANSWER", "SYNC", "STUDENTS"],
+        "rows": [
+            [f"Q{i:05d}", f"Question {i}", f"Answer {i}", "false" if i % 2 else "true", "John"]
+            for i in range(row_count)
+        ],
+    }
+    return build_remote_deck_from_tsv(parsed, DECK_URL, ["John"])
+
+
+@pytest.mark.unit
+class TestOrphanedNoteClassification:
+    """Tests for the index-based deletion classification."""
+
+    def test_classifies_obsolete_disabled_and_sync_disabled(self):
+        """Each orphaned note lands in exactly one bucket."""
+        from src.data_processor import classify_orphaned_notes
+
+        deck = _build_classification_deck(4)
+
+        obsolete, disabled, sync_disabled = classify_orphaned_notes(
+            {"Mary_Q00000", "Mary_Q00001", "Mary_Q99999", "orphan"}, deck
+        )
+
+        assert obsolete == {"Mary_Q99999", "orphan"}
+        assert disabled == {"Mary_Q00000"}
+        assert sync_disabled == {"Mary_Q00001"}
+
+    def test_first_row_wins_for_duplicate_ids(self):
+        """Duplicate IDs keep the SYNC value of their first row."""
+        from src.data_processor import build_remote_deck_from_tsv
+        from src.data_processor import classify_orphaned_notes
+
+        parsed = {
+            "headers": ["ID", "QUESTION", "ANSWER", "SYNC", "STUDENTS"],
+            "rows": [
+                ["Q001", "First", "A", "false", "John"],
+                ["Q001", "Second", "B", "true", "John"],
+            ],
+        }
+        deck = build_remote_deck_from_tsv(parsed, DECK_URL, ["John"])
+
+        _, disabled, sync_disabled = classify_orphaned_notes({"Mary_Q001"}, deck)
+
+        assert sync_disabled == {"Mary_Q001"}
+        assert disabled == set()
+
+    def test_classification_is_one_lookup_per_note(self):
+        """Each orphaned note costs one index lookup and no scan over the rows."""
+        from src.data_processor import classify_orphaned_notes
+
+        class CountingIndex(dict):
+            lookups = 0
+
+            def get(self, key, default=None):
+                CountingIndex.lookups += 1
+                return super().get(key, default)
+
+        class UnscannableRows(list):
+            def __iter__(self):
+                raise AssertionError("remote rows must not be scanned")
+
+        deck = _build_classification_deck(1000)
+        deck.sync_status_by_id = CountingIndex(deck.sync_status_by_id)
+        deck.notes = UnscannableRows(deck.notes)
+        orphaned = {f"Mary_Q{i:05d}" for i in range(1000)} | {
+            f"Mary_X{i:05d}" for i in range(1000)
+        }
+
+        with patch("src.data_processor.add_debug_msg"):
+            buckets = classify_orphaned_notes(orphaned, deck)
+
+        assert sum(len(bucket) for bucket in buckets) == len(orphaned)
+        assert CountingIndex.lookups == len(orphaned)
+
+
+def _build_existing_notes_col():
+    """Collection double holding 3 notes, one of them in the old ID format."""
+    col = MagicMock()
+    col.decks.get.side_effect = lambda did: {
+        1: {"name": "Sheets2Anki::Deck"},
+        2: {"name": "Sheets2Anki::Deck::Mary::High"},
+    }.get(did)
+    col.find_notes.return_value = [10, 11, 12]
+    col.models.get.return_value = {"flds": [{"name": "QUESTION"}, {"name": "ID"}]}
+
+    def db_all(sql):
+        if "from notes" in sql:
+            return [
+                (10, 100, "Question 1\x1fJohn_Q001", " geo capitals "),
+                (11, 100, "Question 1 (reverse)\x1fJohn_Q001_REV", ""),
+                (12, 100, "Question 2\x1fQ002", ""),
+            ]
+        return [(12, 2), (12, 1)]
+
+    col.db.all.side_effect = db_all
+    col.get_note.side_effect = lambda nid: f"note-{nid}"
+    return col
+
+
+@pytest.mark.unit
+class TestExistingNotesLoader:
+    """Tests for the bulk existing-note loader."""
+
+    def test_reads_ids_with_two_queries(self):
+        """One find_notes and one notes query, regardless of card count."""
+        from src.data_processor import get_existing_notes_by_student_id
+
+        col = _build_existing_notes_col()
+
+        existing = get_existing_notes_by_student_id(col, 1)
+
+        assert set(existing) == {"John_Q001", "John_Q001_REV", "Mary_Q002"}
+        col.find_notes.assert_called_once()
+        col.find_cards.assert_not_called()
+        col.get_card.assert_not_called()
+        assert col.db.all.call_count == 2
+        col.models.get.assert_called_once_with(100)
+
+    def test_notes_are_loaded_lazily(self):
+        """Note objects are only loaded for the IDs that are accessed."""
+        from src.data_processor import get_existing_notes_by_student_id
+
+        col = _build_existing_notes_col()
+
+        existing = get_existing_notes_by_student_id(col, 1)
+
+        assert "John_Q001" in existing
+        col.get_note.assert_not_called()
+        assert existing["John_Q001"] == "note-10"
+        assert existing["John_Q001"] == "note-10"
+        col.get_note.assert_called_once_with(10)
+        assert existing.get_note_id("Mary_Q002") == 12
+
+    def test_snapshot_reads_the_raw_row(self):
+        """Snapshots expose fields and tags without loading the note."""
+        from src.data_processor import get_existing_notes_by_student_id
+
+        col = _build_existing_notes_col()
+
+        snapshot = get_existing_notes_by_student_id(col, 1).snapshot("John_Q001")
+
+        assert snapshot.id == 10
+        assert snapshot.mid == 100
+        assert snapshot["QUESTION"] == "Question 1"
+        assert "ANSWER" not in snapshot
+        assert snapshot.tags == ["geo", "capitals"]
+        col.get_note.assert_not_called()
+
+    def test_unchanged_note_is_not_loaded(self):
+        """A note is only loaded when its raw fields differ from the sheet."""
+        from src import data_processor
+        from src.data_processor import NoteSnapshot
+
+        col = MagicMock()
+        model = {"id": 100, "name": "Sheets2Anki - Deck - John - Basic"}
+        note_types = Mock()
+        note_types.get_model.return_value = model
+        row = {"ID": "Q001", "QUESTION": "Question 1", "tags": ["geo"]}
+
+        def snapshot(question):
+            return NoteSnapshot(
+                10, 100, {"ID": "John_Q001", "QUESTION": question}, ["geo"]
+            )
+
+        with patch.object(data_processor, "get_row_info", return_value=Mock(is_cloze=False)):
+            unchanged = data_processor.update_existing_note_for_student(
+                col, snapshot("Question 1"), row, "John", DECK_URL, note_types=note_types
+            )
+            col.get_note.assert_not_called()
+
+            data_processor.update_existing_note_for_student(
+                col, snapshot("Old question"), row, "John", DECK_URL,
+                note_types=note_types, update_batch=Mock(),
+            )
+
+        assert unchanged == (True, False, [])
+        col.get_note.assert_called_once_with(10)
+
+    def test_missing_deck_returns_empty_mapping(self):
+        """An unknown deck yields no notes and no queries."""
+        from src.data_processor import get_existing_notes_by_student_id
+
+        col = _build_existing_notes_col()
+
+        assert len(get_existing_notes_by_student_id(col, 999)) == 0
+        col.find_notes.assert_not_called()
+
+
+class _AddNoteRequest:
+    """Stand-in for anki.collection.AddNoteRequest."""
+
+    def __init__(self, note, deck_id):
+        self.note = note
+        self.deck_id = deck_id
+
+
+@pytest.fixture
+def anki_collection_module():
+    """Provides anki.collection.AddNoteRequest without a real Anki install."""
+    module = Mock(AddNoteRequest=_AddNoteRequest)
+    with patch.dict(sys.modules, {"anki.collection": module}):
+        yield module
+
+
+def _queue_notes(batch, count):
+    from src import data_processor
+
+    notes = [Mock(mid=100) for _ in range(count)]
+    with patch.object(
+        data_processor,
+        "prepare_new_note_for_student",
+        side_effect=[(note, 7) for note in notes],
+    ), patch("src.config_manager.get_deck_remote_name", return_value="Deck"):
+        for i in range(count):
+            assert batch.add({"ID": f"Q{i}"}, "John", {"student_note_id": f"John_Q{i}"})
+    return notes
+
+
+@pytest.mark.unit
+class TestNoteCreationBatch:
+    """Tests for batched note creation."""
+
+    def test_notes_are_added_with_one_call(self, anki_collection_module):
+        """All queued notes go through a single add_notes call."""
+        from src.data_processor import NoteCreationBatch
+
+        col = MagicMock()
+        batch = NoteCreationBatch(col, 1, DECK_URL)
+        notes = _queue_notes(batch, 3)
+
+        created, failures = batch.flush()
+
+        col.add_notes.assert_called_once()
+        requests = col.add_notes.call_args[0][0]
+        assert [request.note for request in requests] == notes
+        assert all(request.deck_id == 7 for request in requests)
+        col.add_note.assert_not_called()
+        assert [detail["student_note_id"] for detail in created] == ["John_Q0", "John_Q1", "John_Q2"]
+        assert failures == []
+        assert len(batch) == 0
+
+    def test_failed_batch_reports_individual_failures(self, anki_collection_module):
+        """A bad note is reported without dropping the rest of the batch."""
+        from src.data_processor import NoteCreationBatch
+
+        col = MagicMock()
+        col.add_notes.side_effect = Exception("invalid note")
+        batch = NoteCreationBatch(col, 1, DECK_URL)
+        notes = _queue_notes(batch, 3)
+
+        def add_note(note, deck_id):
+            if note is notes[1]:
+                raise ValueError("empty first field")
+
+        col.add_note.side_effect = add_note
+
+        created, failures = batch.flush()
+
+        assert [detail["student_note_id"] for detail in created] == ["John_Q0", "John_Q2"]
+        assert failures == [("John_Q1", "empty first field")]
+
+    def test_note_types_resolved_once_per_batch(self):
+        """The note type lookup is cached across the notes of a batch."""
+        from src import data_processor
+
+        col = MagicMock()
+        models = {"standard": {"id": 100}, "cloze": {"id": 101}, "reverse": {"id": 102}}
+
+        with patch.object(data_processor, "ensure_custom_models", return_value=models) as ensure_mock, \
+             patch.object(data_processor, "fill_note_fields_for_student"), \
+             patch.object(data_processor, "determine_target_deck_for_student", return_value=7):
+            note_types = data_processor.NoteTypeResolver(col, DECK_URL)
+            for i in range(3):
+                assert data_processor.prepare_new_note_for_student(
+                    col, {"ID": f"Q{i}", "QUESTION": "Q", "ANSWER": "A"}, "John", 1, DECK_URL,
+                    remote_deck_name="Deck", note_types=note_types,
+                ) is not None
+
+        ensure_mock.assert_called_once()
+        col.models.by_name.assert_not_called()
+        col.new_note.assert_called_with(models["standard"])
+
+
+@pytest.mark.unit
+class TestNoteUpdateBatch:
+    """Tests for batched note updates and card moves."""
+
+    def test_updates_and_moves_use_bulk_calls(self):
+        """All updates share one update_notes call and one set_deck per deck."""
+        from src.data_processor import NoteUpdateBatch
+
+        col = MagicMock()
+        batch = NoteUpdateBatch(col)
+        notes = [Mock() for _ in range(3)]
+        batch.add("John_Q1", notes[0], [11, 12], 5)
+        batch.add("John_Q2", notes[1], [21], 5)
+        batch.add("Mary_Q1", notes[2])
+
+        failures = batch.flush()
+
+        assert failures == []
+        col.update_notes.assert_called_once_with(notes)
+        col.set_deck.assert_called_once_with([11, 12, 21], 5)
+        col.update_note.assert_not_called()
+        assert len(batch) == 0
+
+    def test_failed_bulk_update_reports_per_note(self):
+        """A failing note is reported while the others are still written."""
+        from src.data_processor import NoteUpdateBatch
+
+        col = MagicMock()
+        col.update_notes.side_effect = Exception("backend error")
+        bad_note = Mock()
+
+        def update_note(note):
+            if note is bad_note:
+                raise ValueError("note was deleted")
+
+        col.update_note.side_effect = update_note
+        batch = NoteUpdateBatch(col)
+        batch.add("John_Q1", Mock())
+        batch.add("John_Q2", bad_note)
+
+        failures = batch.flush()
+
+        assert failures == [("John_Q2", "note was deleted")]
+        assert col.update_note.call_count == 2
+
+    def test_failed_bulk_move_retries_per_note(self):
+        """A failing card move is reported while the other cards still move."""
+        from src.data_processor import NoteUpdateBatch
+
+        col = MagicMock()
+
+        def set_deck(card_ids, deck_id):
+            if len(card_ids) > 1 or card_ids == [21]:
+                raise ValueError("card was deleted")
+
+        col.set_deck.side_effect = set_deck
+        batch = NoteUpdateBatch(col)
+        batch.add("John_Q1", Mock(), [11], 5)
+        batch.add("John_Q2", Mock(), [21], 5)
+
+        failures = batch.flush()
+
+        assert failures == [("John_Q2", "could not move cards to deck 5: card was deleted")]
+        assert [c.args for c in col.set_deck.call_args_list] == [
+            ([11, 21], 5),
+            ([11], 5),
+            ([21], 5),
+        ]
+
+    def test_update_is_queued_instead_of_written(self):
+        """With a batch, update_existing_note_for_student does not write immediately."""
+        from src import data_processor
+
+        col = MagicMock()
+        note = MagicMock()
+        note.mid = 100
+        card = Mock(id=11, did=1)
+        note.cards.return_value = [card]
+        batch = data_processor.NoteUpdateBatch(col)
+
+        with patch.object(data_processor, "ensure_custom_models", return_value={"standard": {"id": 100}}), \
+             patch.object(data_processor, "note_fields_need_update", return_value=(True, ["QUESTION"])), \
+             patch.object(data_processor, "fill_note_fields_for_student"), \
+             patch.object(data_processor, "determine_target_deck_for_student", return_value=2):
+            result = data_processor.update_existing_note_for_student(
+                col, note, {"ID": "Q1", "QUESTION": "New"}, "John", DECK_URL, update_batch=batch
+            )
+
+        assert result == (True, True, ["QUESTION"])
+        note.flush.assert_not_called()
+        col.update_note.assert_not_called()
+        col.set_deck.assert_not_called()
+        assert note.cards.call_count == 1
+
+        batch.flush()
+
+        col.update_notes.assert_called_once_with([note])
+        col.set_deck.assert_called_once_with([11], 2)
+
+
+@pytest.mark.unit
+class TestStreamingTsvParser:
+    """Tests for the incremental TSV parser."""
+
+    def test_multiline_quoted_cells(self):
+        """Quoted cells containing line breaks stay in a single row."""
+        from src.data_processor import parse_tsv_data
+
+        tsv = 'ID\tQUESTION\tANSWER\nQ001\t"Line 1\nLine 2"\tA\nQ002\tSimple\tB\n'
+
+        parsed = parse_tsv_data(tsv)
+
+        assert parsed["rows"] == [["Q001", "Line 1\nLine 2", "A"], ["Q002", "Simple", "B"]]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """UTF-8 sequences cut by chunk boundaries are decoded correctly."""
+        from src.data_processor import parse_tsv_stream
+
+        body = "ID\tQUESTION\tANSWER\nQ001\tCapital do Brasil?\tBrasília 🇧🇷\n".encode("utf-8")
+        chunks = [body[i:i + 3] for i in range(0, len(body), 3)]
+
+        parsed = parse_tsv_stream(chunks)
+
+        assert parsed["headers"] == ["ID", "QUESTION", "ANSWER"]
+        assert list(parsed["rows"]) == [["Q001", "Capital do Brasil?", "Brasília 🇧🇷"]]
+
+    def test_trailing_blank_lines_are_ignored(self):
+        """Blank lines at the end are dropped, blank lines in between are kept."""
+        from src.data_processor import parse_tsv_data
+
+        parsed = parse_tsv_data("\nID\tANSWER\nQ001\tA\n\nQ002\tB\n\n\n")
+
+        assert parsed["rows"] == [["Q001", "A"], [], ["Q002", "B"]]
+
+    def test_missing_headers_raise(self):
+        """Mandatory headers are checked before any row is read."""
+        from src.data_processor import RemoteDeckError
+        from src.data_processor import parse_tsv_stream
+
+        with pytest.raises(RemoteDeckError, match="Mandatory headers missing"):
+            parse_tsv_stream([b"QUESTION\tANSWER\nQ\tA\n"])
+
+    def test_streaming_parse_memory_is_bounded(self):
+        """Rows are produced without materializing the whole decoded text."""
+        import tracemalloc
+
+        from src.data_processor import parse_tsv_stream
+        from src.utils import TsvResponse
+
+        row = "Q{:06d}\t" + "x" * 200 + "\t" + "y" * 200 + "\n"
+        body = ("ID\tQUESTION\tANSWER\n" + "".join(row.format(i) for i in range(12000))).encode("utf-8")
+
+        tracemalloc.start()
+        try:
+            response = TsvResponse(DECK_URL, 200, "text/tab-separated-values", {}, body)
+            parsed = parse_tsv_stream(response.iter_chunks())
+            row_count = sum(1 for _ in parsed["rows"])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert row_count == 12000
+        # A str copy of the payload alone would be >= 1x the body size
+        assert peak < len(body) * 0.25
+
+
+@pytest.mark.unit
+class TestRemoteRow:
+    """Tests for the compact row representation."""
+
+    def test_mapping_access(self):
+        """Rows behave like read-only dicts of header -> value."""
+        from src.data_processor import RemoteRow
+        from src.data_processor import build_column_index
+
+        columns = build_column_index(["ID", "QUESTION", "ANSWER"])
+        row = RemoteRow.from_cells(columns, 3, [" Q001 ", "What?"])
+
+        assert row["ID"] == "Q001"
+        assert row.get("ANSWER") == ""
+        assert row.get("MISSING", "default") == "default"
+        assert dict(row) == {"ID": "Q001", "QUESTION": "What?", "ANSWER": ""}
+        with pytest.raises(TypeError):
+            row["ID"] = "Q002"
+
+    def test_tags_are_writable(self):
+        """process_note_fields can still attach tags to a row."""
+        from src.data_processor import RemoteRow
+        from src.data_processor import build_column_index
+
+        row = RemoteRow.from_cells(build_column_index(["ID"]), 1, ["Q001"])
+
+        assert row.get("tags", []) == []
+        row["tags"] = ["Sheets2Anki"]
+
+        assert row["tags"] == ["Sheets2Anki"]
+        assert "tags" in row
+        assert len(row) == 2
+
+    def test_rows_use_less_memory_than_dicts(self):
+        """Measurement: compact rows need less than half the memory of dict rows."""
+        import tracemalloc
+
+        from src.data_processor import RemoteRow
+        from src.data_processor import build_column_index
+
+        headers = [f"COLUMN {i}" for i in range(25)]
+        cells = [[f"r{r}c{c}" for c in range(25)] for r in range(20000)]
+        columns = build_column_index(headers)
+
+        def measure(build):
+            tracemalloc.start()
+            try:
+                rows = [build(row) for row in cells]
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(rows) == len(cells)
+            return size
+
+        # Values are stripped in both cases; strings are shared, so only the
+        # per-row containers are measured
+        dict_size = measure(lambda row: {header: row[i] for i, header in enumerate(headers)})
+        compact_size = measure(lambda row: RemoteRow.from_cells(columns, 25, row))
+
+        ratio = compact_size / dict_size
+        assert ratio < 0.5, f"compact rows use {ratio:.0%} of the dict row memory"
+
+
+@pytest.mark.unit
+class TestRowClassification:
+    """Tests for the per-row classification record."""
+
+    def test_classify_row(self):
+        """All derived values are computed from the raw cells."""
+        from src.data_processor import classify_row
+
+        info = classify_row({
+            "ID": " Q001 ",
+            "SYNC": " TRUE ",
+            "STUDENTS": "John, Mary,,",
+            "REVERSE": "Reverse side",
+            "QUESTION": "{{c1::Brasília}} is the capital",
+            "ANSWER": "",
+        })
+
+        assert info.note_id == "Q001"
+        assert info.is_sync
+        assert info.students == ("John", "Mary")
+        assert info.has_reverse
+        assert info.is_cloze
+
+    def test_rows_are_classified_once(self, fast_path_config):
+        """Parsing and reconciliation share the record computed at parse time."""
+        from src import data_processor
+
+        with patch.object(
+            data_processor, "classify_row", wraps=data_processor.classify_row
+        ) as classify_mock:
+            deck = _build_fast_path_deck(None)
+            col = MagicMock()
+            col.decks.get.return_value = {"name": "Sheets2Anki::Deck"}
+            with patch.object(data_processor, "ensure_custom_models"), \
+                 patch.object(data_processor, "get_existing_notes_by_student_id", return_value={}), \
+                 patch.object(data_processor, "prepare_new_note_for_student", return_value=(Mock(), 1)):
+                data_processor.create_or_update_notes(col, deck, 1, deck_url=DECK_URL)
+
+        assert classify_mock.call_count == len(deck.notes) == 2
+
+
 # =============================================================================
 # INTEGRATION TESTS
 # =============================================================================
 
 
+@pytest.mark.unit
+class TestNoteTypeResolver:
+    """Tests for the sync-scoped note type resolver."""
+
+    MODELS = {"standard": {"id": 1}, "cloze": {"id": 2}, "reverse": {"id": 3}}
+
+    def test_one_resolution_per_student(self):
+        """ensure_custom_models runs once per student, not once per note."""
+        from src import data_processor
+
+        with patch.object(
+            data_processor, "ensure_custom_models", return_value=self.MODELS
+        ) as ensure_mock:
+            note_types = data_processor.NoteTypeResolver(MagicMock(), DECK_URL)
+            for _ in range(20):
+                assert note_types.get_model("John") == {"id": 1}
+                assert note_types.get_model("John", is_cloze=True) == {"id": 2}
+                assert note_types.get_model("John", is_cloze=True, is_reverse=True) == {"id": 3}
+            note_types.get_model("Mary")
+
+        assert ensure_mock.call_count == 2
+
+    def test_invalidated_when_note_types_change(self):
+        """Creating or renaming a note type drops the cached lookups."""
+        from src import data_processor
+        from src.templates_and_definitions import mark_note_types_changed
+
+        with patch.object(
+            data_processor, "ensure_custom_models", return_value=self.MODELS
+        ) as ensure_mock:
+            note_types = data_processor.NoteTypeResolver(MagicMock(), DECK_URL)
+            note_types.get_model("John")
+            note_types.get_model("John")
+            mark_note_types_changed()
+            note_types.get_model("John")
+
+        assert ensure_mock.call_count == 2
+
+    def test_update_uses_resolver(self):
+        """Updating notes does not re-resolve note types per note."""
+        from src import data_processor
+
+        existing_note = Mock(mid=1)
+        existing_note.cards.return_value = []
+
+        with patch.object(
+            data_processor, "ensure_custom_models", return_value=self.MODELS
+        ) as ensure_mock, \
+             patch.object(data_processor, "note_fields_need_update", return_value=(False, [])):
+            note_types = data_processor.NoteTypeResolver(MagicMock(), DECK_URL)
+            for i in range(5):
+                data_processor.update_existing_note_for_student(
+                    MagicMock(), existing_note, {"ID": f"Q{i}", "QUESTION": "Q", "ANSWER": "A"},
+                    "John", DECK_URL, note_types=note_types,
+                )
+
+        ensure_mock.assert_called_once()
+
+
+@pytest.mark.unit
+class TestSubdeckCache:
+    """Tests for the sync-scoped subdeck ID cache."""
+
+    ROW = {"IMPORTANCE": "High", "TOPIC": "Geo", "SUBTOPIC": "Capitals", "CONCEPT": "Brazil"}
+
+    def _col(self, existing):
+        col = MagicMock()
+        entries = []
+        for name, did in existing.items():
+            entry = Mock(id=did)
+            entry.name = name
+            entries.append(entry)
+        col.decks.all_names_and_ids.return_value = entries
+        col.decks.id_for_name.return_value = None
+        col.decks.id.side_effect = lambda name: 900
+        return col
+
+    def test_existing_subdecks_come_from_one_preload(self):
+        """Existing subdecks are resolved without per-note deck lookups."""
+        from src.data_processor import SubdeckCache
+
+        col = self._col({"Sheets2Anki::Deck::John::High::Geo::Capitals::Brazil": 42})
+        cache = SubdeckCache(col, DECK_URL, remote_deck_name="Deck")
+
+        for _ in range(50):
+            assert cache.get_deck_id(dict(self.ROW), "John") == 42
+
+        col.decks.all_names_and_ids.assert_called_once()
+        col.decks.id_for_name.assert_not_called()
+        col.decks.id.assert_not_called()
+
+    def test_missing_subdeck_created_once(self):
+        """A new hierarchy path creates its subdeck on first use only."""
+        from src.data_processor import SubdeckCache
+
+        col = self._col({})
+        cache = SubdeckCache(col, DECK_URL, remote_deck_name="Deck")
+
+        assert cache.get_deck_id(self.ROW, "John") == 900
+        assert cache.get_deck_id(self.ROW, "John") == 900
+
+        col.decks.id.assert_called_once_with(
+            "Sheets2Anki::Deck::John::High::Geo::Capitals::Brazil"
+        )
+        assert len(cache) == 1
+
+    def test_remote_name_read_once(self):
+        """meta.json is read once per cache, not once per note."""
+        from src.data_processor import SubdeckCache
+        from src.data_processor import determine_target_deck_for_student
+
+        col = self._col({})
+        cache = SubdeckCache(col, DECK_URL)
+
+        with patch("src.config_manager.get_deck_remote_name", return_value="Deck") as name_mock:
+            for student in ("John", "Mary", "John"):
+                assert determine_target_deck_for_student(
+                    col, 1, self.ROW, student, DECK_URL, subdeck_cache=cache
+                ) == 900
+
+        name_mock.assert_called_once_with(DECK_URL)
+        col.decks.get.assert_not_called()
+        assert len(cache) == 2
+
+
 @pytest.mark.integration
 class TestDataProcessorIntegration:
     """Integration tests for data processor."""
@@ -0,0 +1,379 @@
+"""
+Tests for the single-fetch TSV download pipeline.
+
+A local HTTP server stands in for the Google Sheets export endpoint and
+counts how many requests each deck costs.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+SAMPLE_TSV = (
+    "ID\tQUESTION\tANSWER\tSYNC\tSTUDENTS\n"
+    "Q001\tWhat is the capital of Brazil?\tBrasília\ttrue\tJohn\n"
+    "Q002\tWhat is 2+2?\t4\ttrue\tMary\n"
+)
+
+
+class _SheetHandler(BaseHTTPRequestHandler):
+    """Serves SAMPLE_TSV and records every request path."""
+
+    def do_GET(self):
+        self.server.request_paths.append(self.path)
+        self.server.request_headers.append(dict(self.headers.items()))
+
+        if "/edit" in self.path:
+            html = f"<html><title>{self.server.title} - Google Sheets</title></html>"
+            body = html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        etag = self.server.etag
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = self.server.body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", self.server.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header(
+            "Content-Disposition", f'attachment; filename="{self.server.title} - Sheet1.tsv"'
+        )
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def sheet_server():
+    """Local stand-in for the Google Sheets TSV export endpoint."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SheetHandler)
+    server.request_paths = []
+    server.request_headers = []
+    server.content_type = "text/tab-separated-values; charset=utf-8"
+    server.body = SAMPLE_TSV
+    server.etag = None
+    server.title = "Biology Deck"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture(autouse=True)
+def isolated_tsv_cache(tmp_path, monkeypatch):
+    """Keeps the on-disk TSV cache inside the test's temporary directory."""
+    from src import tsv_cache
+
+    monkeypatch.setattr(tsv_cache, "get_cache_dir", lambda: str(tmp_path / "tsv_cache"))
+
+
+@pytest.fixture
+def in_memory_meta():
+    """Replaces meta.json with an in-memory dict."""
+    from src import config_manager
+
+    meta = {"decks": {}}
+    with patch.object(config_manager, "get_meta", side_effect=lambda: meta), \
+         patch.object(config_manager, "save_meta", side_effect=meta.update):
+        yield meta
+
+
+def _edit_url(server, sheet_id):
+    host, port = server.server_address
+    return f"http://{host}:{port}/spreadsheets/d/{sheet_id}/edit?usp=sharing"
+
+
+def _export_url(server, sheet_id):
+    host, port = server.server_address
+    return f"http://{host}:{port}/spreadsheets/d/{sheet_id}/export?format=tsv"
+
+
+@pytest.mark.unit
+class TestSingleFetchPipeline:
+    """Each deck must be downloaded exactly once per sync."""
+
+    def test_fetch_and_parse_use_one_request(self, sheet_server):
+        """Validation and parsing share the same response."""
+        from src.data_processor import getRemoteDeck
+        from src.utils import fetch_tsv_response
+
+        url = _export_url(sheet_server, "deck1")
+        response = fetch_tsv_response(url)
+
+        assert response.status == 200
+        assert "text/tab-separated-values" in response.content_type
+
+        remote_deck = getRemoteDeck(response.url, tsv_response=response)
+
+        assert len(remote_deck.notes) == 2
+        assert len(sheet_server.request_paths) == 1
+
+    def test_one_request_per_deck(self, sheet_server):
+        """Several decks cost one request each."""
+        from src.data_processor import getRemoteDeck
+        from src.utils import fetch_tsv_response
+
+        for sheet_id in ("deck1", "deck2", "deck3"):
+            response = fetch_tsv_response(_export_url(sheet_server, sheet_id))
+            getRemoteDeck(response.url, tsv_response=response)
+
+        assert len(sheet_server.request_paths) == 3
+
+    def test_rejects_non_tsv_content(self, sheet_server):
+        """A response with the wrong Content-Type fails validation."""
+        from src.utils import fetch_tsv_response
+
+        sheet_server.content_type = "text/html"
+
+        with pytest.raises(ValueError) as exc_info:
+            fetch_tsv_response(_export_url(sheet_server, "deck1"))
+
+        assert "does not return TSV content" in str(exc_info.value)
+        assert len(sheet_server.request_paths) == 1
+
+
+@pytest.mark.unit
+class TestConditionalFetchCache:
+    """Conditional requests and unchanged-sheet detection."""
+
+    def test_sends_if_none_match_and_serves_304_from_cache(self, sheet_server):
+        """A 304 answer is served from the cached body."""
+        from src.utils import fetch_tsv_response
+
+        sheet_server.etag = '"v1"'
+        url = _export_url(sheet_server, "deck1")
+
+        first = fetch_tsv_response(url)
+        second = fetch_tsv_response(url)
+
+        assert not first.unchanged
+        assert "If-None-Match" not in sheet_server.request_headers[0]
+        assert sheet_server.request_headers[1]["If-None-Match"] == '"v1"'
+        assert second.status == 304
+        assert second.from_cache
+        assert second.unchanged
+        assert second.text == SAMPLE_TSV
+        assert second.content_hash == first.content_hash
+
+    def test_unchanged_body_detected_by_hash(self, sheet_server):
+        """Without validators, an identical body is flagged as unchanged."""
+        from src.utils import fetch_tsv_response
+
+        url = _export_url(sheet_server, "deck1")
+
+        assert not fetch_tsv_response(url).unchanged
+        assert fetch_tsv_response(url).unchanged
+
+        sheet_server.body = SAMPLE_TSV + "Q003\tNew question\tNew answer\ttrue\tJohn\n"
+        changed = fetch_tsv_response(url)
+
+        assert not changed.unchanged
+        assert fetch_tsv_response(url).unchanged
+
+    def test_cached_body_is_streamed_from_disk(self, sheet_server):
+        """Cached responses keep no body in memory and are read back in chunks."""
+        import json
+
+        from src import tsv_cache
+        from src.utils import fetch_tsv_response
+
+        url = _export_url(sheet_server, "deck1")
+        response = fetch_tsv_response(url)
+
+        assert response._body is None
+        assert response.body_path == tsv_cache.load_entry(url)["body_path"]
+        chunks = list(response.iter_chunks(16))
+        assert all(len(chunk) <= 16 for chunk in chunks)
+        assert b"".join(chunks).decode("utf-8") == SAMPLE_TSV
+
+        spreadsheet_id, gid = tsv_cache.get_cache_key(url)
+        entry_path = f"{tsv_cache.get_cache_dir()}/{spreadsheet_id}_{gid}.json"
+        with open(entry_path, encoding="utf-8") as f:
+            assert "body" not in json.load(f)
+
+    def test_remote_deck_reports_unchanged(self, sheet_server):
+        """getRemoteDeck short-circuits parsing for an unchanged sheet."""
+        from src import data_processor
+        from src.data_processor import getRemoteDeck
+        from src.utils import fetch_tsv_response
+
+        sheet_server.etag = '"v1"'
+        url = _export_url(sheet_server, "deck1")
+
+        first = getRemoteDeck(url, tsv_response=fetch_tsv_response(url))
+        with patch.object(data_processor, "parse_tsv_stream") as parse_mock:
+            second = getRemoteDeck(url, tsv_response=fetch_tsv_response(url))
+
+        parse_mock.assert_not_called()
+        assert not first.unchanged
+        assert second.unchanged
+        assert second.content_hash == first.content_hash
+        assert len(second.notes) == len(first.notes) == 2
+
+    def test_body_served_from_memory_when_cache_cannot_be_written(self, sheet_server):
+        """A failed cache commit still returns the downloaded body."""
+        import os
+
+        from src import tsv_cache
+        from src.utils import fetch_tsv_response
+
+        url = _export_url(sheet_server, "deck1")
+
+        with patch.object(tsv_cache.os, "replace", side_effect=OSError("locked")):
+            response = fetch_tsv_response(url)
+
+        assert response.body_path is None
+        assert response.text == SAMPLE_TSV
+        assert tsv_cache.load_entry(url) is None
+        # The temporary body file is cleaned up
+        assert not [
+            name for name in os.listdir(tsv_cache.get_cache_dir()) if name.endswith(".tmp")
+        ]
+
+    def test_parsed_cache_is_bounded(self, sheet_server):
+        """Only the most recently used sheets keep their parsed rows."""
+        from src import data_processor
+        from src.data_processor import getRemoteDeck
+        from src.utils import fetch_tsv_response
+
+        data_processor._parsed_tsv_cache.clear()
+        limit = data_processor.PARSED_TSV_CACHE_MAX_ENTRIES
+        urls = [_export_url(sheet_server, f"deck{i}") for i in range(limit + 2)]
+
+        for url in urls:
+            getRemoteDeck(url, tsv_response=fetch_tsv_response(url))
+
+        assert list(data_processor._parsed_tsv_cache) == urls[-limit:]
+
+        # An evicted sheet is parsed again from the cached body
+        with patch.object(
+            data_processor, "parse_tsv_stream", wraps=data_processor.parse_tsv_stream
+        ) as parse_mock:
+            deck = getRemoteDeck(urls[0], tsv_response=fetch_tsv_response(urls[0]))
+
+        parse_mock.assert_called_once()
+        assert deck.unchanged
+        assert len(deck.notes) == 2
+        assert len(data_processor._parsed_tsv_cache) == limit
+
+    def test_student_discovery_shares_the_fetch_cache(self, sheet_server):
+        """Discovery costs one request per deck and revalidates cached sheets."""
+        from src.student_manager import discover_students_from_tsv_url
+
+        sheet_server.etag = '"v1"'
+        url = _export_url(sheet_server, "deck1")
+
+        assert discover_students_from_tsv_url(url) == {"John", "Mary"}
+        assert discover_students_from_tsv_url(url) == {"John", "Mary"}
+
+        assert len(sheet_server.request_paths) == 2
+        assert sheet_server.request_headers[1]["If-None-Match"] == '"v1"'
+
+    def test_cache_key_uses_spreadsheet_id_and_gid(self):
+        """Cache entries are keyed by spreadsheet ID and tab gid."""
+        from src.tsv_cache import get_cache_key
+
+        assert get_cache_key(
+            "https://docs.google.com/spreadsheets/d/abc123/export?format=tsv"
+        ) == ("abc123", "0")
+        assert get_cache_key(
+            "https://docs.google.com/spreadsheets/d/abc123/export?format=tsv&gid=42"
+        ) == ("abc123", "42")
+
+
+@pytest.mark.unit
+class TestSpreadsheetTitleCache:
+    """Deck titles are cached and validated against the TSV response headers."""
+
+    def test_title_costs_no_extra_request_when_cached(self, sheet_server, in_memory_meta):
+        """Only the first lookup scrapes the spreadsheet HTML."""
+        from src.deck_manager import DeckNameManager
+        from src.utils import fetch_tsv_response
+
+        edit_url = _edit_url(sheet_server, "deck1")
+
+        first = DeckNameManager.extract_remote_name_from_url(
+            edit_url, tsv_response=fetch_tsv_response(_export_url(sheet_server, "deck1"))
+        )
+        requests_after_first = len(sheet_server.request_paths)
+        second = DeckNameManager.extract_remote_name_from_url(
+            edit_url, tsv_response=fetch_tsv_response(_export_url(sheet_server, "deck1"))
+        )
+
+        assert first == second == "Biology Deck"
+        assert requests_after_first == 2
+        # Second sync: only the TSV download itself
+        assert len(sheet_server.request_paths) == 3
+        assert "deck1" in in_memory_meta["title_cache"]
+
+    def test_renamed_spreadsheet_refreshes_title(self, sheet_server, in_memory_meta):
+        """A different Content-Disposition invalidates the cached title."""
+        from src.deck_manager import DeckNameManager
+        from src.utils import fetch_tsv_response
+
+        edit_url = _edit_url(sheet_server, "deck1")
+        export_url = _export_url(sheet_server, "deck1")
+
+        DeckNameManager.extract_remote_name_from_url(
+            edit_url, tsv_response=fetch_tsv_response(export_url)
+        )
+        sheet_server.title = "Chemistry Deck"
+        renamed = DeckNameManager.extract_remote_name_from_url(
+            edit_url, tsv_response=fetch_tsv_response(export_url)
+        )
+
+        assert renamed == "Chemistry Deck"
+
+    def test_failed_title_scrape_is_retried(self, sheet_server, in_memory_meta):
+        """A filename fallback is not cached, so the HTML title is fetched next time."""
+        from src.deck_manager import DeckNameManager
+        from src.utils import fetch_tsv_response
+
+        edit_url = _edit_url(sheet_server, "deck1")
+        export_url = _export_url(sheet_server, "deck1")
+
+        with patch.object(DeckNameManager, "_extract_spreadsheet_title", return_value=None):
+            fallback = DeckNameManager.extract_remote_name_from_url(
+                edit_url, tsv_response=fetch_tsv_response(export_url)
+            )
+        recovered = DeckNameManager.extract_remote_name_from_url(
+            edit_url, tsv_response=fetch_tsv_response(export_url)
+        )
+
+        assert fallback != "Biology Deck"
+        assert recovered == "Biology Deck"
+        assert in_memory_meta["title_cache"]["deck1"]["title"] == "Biology Deck"
+
+    def test_cache_expires_without_response_headers(self, in_memory_meta):
+        """Without a TSV response, the cached title is only trusted within the TTL."""
+        from src import config_manager
+
+        url = "https://docs.google.com/spreadsheets/d/abc123/edit?usp=sharing"
+        config_manager.save_cached_spreadsheet_title(url, "Biology Deck", "attachment")
+
+        assert config_manager.get_cached_spreadsheet_title(url) == "Biology Deck"
+
+        in_memory_meta["title_cache"]["abc123"]["cached_at"] -= (
+            config_manager.TITLE_CACHE_TTL_SECONDS + 1
+        )
+
+        assert config_manager.get_cached_spreadsheet_title(url) is None
+        assert config_manager.get_cached_spreadsheet_title(url, "attachment") == "Biology Deck"
@@ -626,5 +626,408 @@ class TestStudentManagerIntegration:
         assert "Ann" in final_students
 
 
+
+# =============================================================================
+# DISABLED STUDENT CLEANUP TESTS
+# =============================================================================
+
+
+def _cleanup_collection(notes, note_types=None):
+    """Collection mock with Sheets2Anki and user note types over the given notes."""
+    from types import SimpleNamespace
+
+    note_types = note_types or {
+        1: ("Sheets2Anki - Deck - Basic", ["ID", "QUESTION"]),
+        2: ("Sheets2Anki - Deck - Cloze", ["QUESTION", "ID"]),
+        3: ("Basic", ["Front", "Back"]),
+    }
+    col = Mock()
+    col.models.all_names_and_ids.return_value = [
+        SimpleNamespace(id=mid, name=name) for mid, (name, _) in note_types.items()
+    ]
+    col.models.get.side_effect = lambda mid: {
+        "flds": [{"name": field} for field in note_types[mid][1]]
+    }
+    col.db.all.return_value = notes
+    return col
+
+
+@pytest.mark.unit
+class TestFindStudentNoteIds:
+    """Notes of disabled students are found in one pass over Sheets2Anki notes."""
+
+    NOTES = [
+        (10, 1, "John_Q1\x1fWhat?"),
+        (11, 1, "Mary_Q1\x1fWhat?"),
+        (12, 2, "What?\x1fJohn_Q2"),
+        (13, 1, "John_Smith_Q1\x1fWhat?"),
+        (14, 3, "John_Q9\x1fPersonal note"),
+    ]
+
+    def test_all_students_resolved_with_one_query(self):
+        """One notes query serves every disabled student."""
+        from src.student_manager import find_student_note_ids
+
+        col = _cleanup_collection(self.NOTES)
+
+        result = find_student_note_ids(col, {"John", "Mary"})
+
+        assert result == {"John": [10, 12, 13], "Mary": [11]}
+        col.db.all.assert_called_once()
+        col.find_notes.assert_not_called()
+        col.get_note.assert_not_called()
+
+    def test_only_sheets2anki_note_types_are_read(self):
+        """Notes of the user's own note types are never matched."""
+        from src.student_manager import find_student_note_ids
+
+        col = _cleanup_collection(self.NOTES)
+
+        find_student_note_ids(col, {"John"})
+
+        query = col.db.all.call_args[0][0]
+        assert "mid in (1,2)" in query
+
+    def test_longest_student_name_wins(self):
+        """A note matching several disabled students belongs to the longest name."""
+        from src.student_manager import find_student_note_ids
+
+        col = _cleanup_collection(self.NOTES)
+
+        result = find_student_note_ids(col, {"John", "John_Smith"})
+
+        assert result == {"John": [10, 12], "John_Smith": [13]}
+
+    def test_cleanup_removes_found_notes(self):
+        """cleanup_disabled_students_data removes the notes in one call."""
+        from src import student_manager
+
+        col = _cleanup_collection(self.NOTES)
+        col.decks.all_names_and_ids.return_value = []
+        mw = Mock(col=col)
+
+        with patch.object(student_manager, "mw", mw), \
+             patch.object(student_manager, "_update_meta_after_cleanup"), \
+             patch("src.config_manager.remove_student_from_sync_history"):
+            stats = student_manager.cleanup_disabled_students_data({"John", "Mary"}, ["Deck"])
+
+        col.remove_notes.assert_called_once_with([10, 12, 13, 11])
+        assert stats["notes_removed"] == 4
+
+    def test_cleanup_executes_the_confirmed_plan(self):
+        """A plan shown to the user is executed as is, without a new scan."""
+        import sys
+
+        from src import student_manager
+        from src.student_manager import CleanupPlan
+
+        col = Mock()
+        plan = CleanupPlan(
+            students={"John"},
+            note_ids_by_student={"John": [10, 12]},
+            decks=[(100, "Sheets2Anki::Deck::John::Topic")],
+            note_types=[(3, "Sheets2Anki - Deck - John - Basic")],
+        )
+
+        with patch.object(student_manager, "mw", Mock(col=col)), \
+             patch.object(student_manager, "_update_meta_after_cleanup"), \
+             patch("src.config_manager.remove_student_from_sync_history"), \
+             patch.dict(sys.modules, {
+                 "anki.decks": Mock(DeckId=int),
+                 "anki.models": Mock(NotetypeId=int),
+             }):
+            stats = student_manager.cleanup_disabled_students_data({"John"}, ["Deck"], plan)
+
+        assert stats == {"notes_removed": 2, "decks_removed": 1, "note_types_removed": 1}
+        col.db.all.assert_not_called()
+        col.find_notes.assert_not_called()
+        col.remove_notes.assert_called_once_with([10, 12])
+        col.decks.remove.assert_called_once_with([100])
+        col.models.remove.assert_called_once_with(3)
+
+
+# =============================================================================
+# CLEANUP PLAN TESTS
+# =============================================================================
+
+
+def _plan_collection(notes, cards, decks):
+    """Collection mock answering the notes and cards queries of the planner."""
+    from types import SimpleNamespace
+
+    col = _cleanup_collection(
+        notes,
+        {
+            1: ("Sheets2Anki - Deck - [MISSING_STUDENT] - Basic", ["ID", "QUESTION"]),
+            2: ("Sheets2Anki - Deck - [MISSING S.] - Cloze", ["ID", "QUESTION"]),
+            3: ("Sheets2Anki - Deck - John - Basic", ["ID", "QUESTION"]),
+            4: ("Sheets2Anki - My - Deck - [MISSING_STUDENT] - Reverse", ["ID", "QUESTION"]),
+        },
+    )
+    col.db.all.side_effect = lambda sql: cards if "from cards" in sql else notes
+    col.decks.all_names_and_ids.return_value = [
+        SimpleNamespace(id=did, name=name) for did, name in decks
+    ]
+    return col
+
+
+@pytest.mark.unit
+class TestCleanupPlan:
+    """Missing student cleanup is planned in one read pass and removed in bulk."""
+
+    NOTES = [
+        (10, 1, "[MISSING_STUDENT]_Q1\x1fWhat?"),
+        (11, 2, "[MISSING S.]_Q2\x1fWhat?"),
+        (12, 3, "John_Q1\x1fWhat?"),
+        (13, 1, "[MISSING_STUDENT]_Q3\x1fWhat?"),
+    ]
+    DECKS = [
+        (100, "Sheets2Anki::Deck::[MISSING_STUDENT]::Topic"),
+        (101, "Sheets2Anki::Deck::[MISSING_STUDENT]::Topic::Sub"),
+        (102, "Sheets2Anki::Deck::[MISSING_STUDENT]::Other"),
+        (103, "Sheets2Anki::Deck::John::Topic"),
+        (104, "Sheets2Anki::Other::[MISSING_STUDENT]::Topic"),
+    ]
+
+    def test_plan_reads_collection_once(self):
+        """Notes, decks and note types come from one notes and one cards query."""
+        from src.student_manager import plan_missing_students_cleanup
+
+        cards = [(101, 0, 10), (102, 0, 13), (102, 0, 99)]
+        col = _plan_collection(self.NOTES, cards, self.DECKS)
+
+        plan = plan_missing_students_cleanup(col, ["Deck"])
+
+        assert plan.note_ids == [11, 10, 13]
+        # Deck 102 keeps a card of a note that is not removed
+        assert plan.decks == [
+            (100, "Sheets2Anki::Deck::[MISSING_STUDENT]::Topic"),
+            (101, "Sheets2Anki::Deck::[MISSING_STUDENT]::Topic::Sub"),
+        ]
+        assert [mid for mid, _ in plan.note_types] == [2, 1, 4]
+        assert col.db.all.call_count == 2
+        col.find_notes.assert_not_called()
+        col.get_note.assert_not_called()
+        col.remove_notes.assert_not_called()
+
+    def test_remaining_card_keeps_parent_decks(self):
+        """A parent deck is kept while any of its subdecks still has cards."""
+        from src.student_manager import plan_missing_students_cleanup
+
+        cards = [(101, 0, 99)]
+        col = _plan_collection(self.NOTES, cards, self.DECKS)
+
+        plan = plan_missing_students_cleanup(col, ["Deck"])
+
+        assert [did for did, _ in plan.decks] == [102]
+
+    def test_note_type_in_use_is_kept(self):
+        """A note type with notes of other students is not removed."""
+        from src.student_manager import plan_missing_students_cleanup
+
+        notes = self.NOTES + [(14, 1, "Mary_Q1\x1fWhat?")]
+        col = _plan_collection(notes, [], self.DECKS)
+
+        plan = plan_missing_students_cleanup(col, ["Deck"])
+
+        assert 1 not in [mid for mid, _ in plan.note_types]
+
+    def test_without_deck_names_any_placeholder_deck_matches(self):
+        """With no remote deck names, placeholder decks under every deck are pruned."""
+        from src.student_manager import plan_missing_students_cleanup
+
+        col = _plan_collection(self.NOTES, [], self.DECKS)
+
+        plan = plan_missing_students_cleanup(col, [])
+
+        assert sorted(did for did, _ in plan.decks) == [100, 101, 102, 104]
+
+    def test_cleanup_executes_plan_in_bulk(self):
+        """One remove_notes and one decks.remove call execute the plan."""
+        import sys
+
+        from src import student_manager
+
+        col = _plan_collection(self.NOTES, [], self.DECKS)
+        mw = Mock(col=col)
+
+        with patch.object(student_manager, "mw", mw), \
+             patch.object(student_manager, "_update_meta_after_missing_cleanup"), \
+             patch("src.config_manager.remove_student_from_sync_history"), \
+             patch.dict(sys.modules, {
+                 "anki.decks": Mock(DeckId=int),
+                 "anki.models": Mock(NotetypeId=int),
+             }):
+            stats = student_manager.cleanup_missing_students_data(["Deck"])
+
+        col.remove_notes.assert_called_once_with([11, 10, 13])
+        col.decks.remove.assert_called_once()
+        assert sorted(col.decks.remove.call_args[0][0]) == [100, 101, 102]
+        assert col.models.remove.call_count == 3
+        assert stats == {"notes_removed": 3, "decks_removed": 3, "note_types_removed": 3}
+
+    def test_summary_feeds_confirmation_message(self):
+        """The dialog message shows the dry-run counts."""
+        from src.data_removal_confirmation import generate_data_removal_confirmation_message
+        from src.student_manager import plan_missing_students_cleanup
+
+        col = _plan_collection(self.NOTES, [], self.DECKS)
+        summary = plan_missing_students_cleanup(col, ["Deck"]).summary()
+
+        message = generate_data_removal_confirmation_message(
+            ["[MISSING_STUDENT]"], summary
+        )
+
+        assert summary == {"notes": 3, "decks": 3, "note_types": 3}
+        assert "3 notes and their cards" in message
+
+
+# =============================================================================
+# NOTE TYPE REMOVAL PLANNER TESTS
+# =============================================================================
+
+
+def _note_type_collection(names, use_counts=None):
+    """Collection mock listing the given note type names (ID = position + 1)."""
+    from types import SimpleNamespace
+
+    col = Mock()
+    col.models.all_names_and_ids.return_value = [
+        SimpleNamespace(id=mid, name=name) for mid, name in enumerate(names, start=1)
+    ]
+    col.db.all.return_value = list((use_counts or {}).items())
+    return col
+
+
+@pytest.mark.unit
+class TestStudentNoteTypePlanner:
+    """Note types of all disabled students are resolved from one name index."""
+
+    NAMES = [
+        "Sheets2Anki - Deck - John - Basic",
+        "Sheets2Anki - Deck - John - Cloze",
+        "Sheets2Anki - Deck - Mary - Reverse",
+        "Sheets2Anki - Old - Deck - John - Basic",
+        "Sheets2Anki - Deck - Peter - Basic",
+        "Sheets2Anki - Deck - John - Custom",
+        "Basic",
+    ]
+
+    def test_all_students_resolved_in_one_listing(self):
+        """Deck targets and orphaned note types come from a single listing."""
+        from src.student_manager import plan_student_note_types
+
+        col = _note_type_collection(self.NAMES)
+
+        planned = plan_student_note_types(col, {"John", "Mary"}, ["Deck"])
+
+        assert [(mid, reason.split(" ")[0]) for mid, _, reason in planned] == [
+            (1, "deck"),
+            (2, "deck"),
+            (3, "deck"),
+            (4, "orphaned"),
+        ]
+        col.models.all_names_and_ids.assert_called_once()
+        col.models.all.assert_not_called()
+
+
+# =============================================================================
+# STUDENT SYNC CONTEXT TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestStudentSyncContext:
+    """Student selection is resolved from one configuration snapshot."""
+
+    META = {
+        "students": {
+            "enabled_students": ["John", "Mary"],
+            "sync_missing_students_notes": True,
+        },
+        "decks": {
+            "deck1": {"student_selection": ["Mary"]},
+            "deck2": {},
+        },
+    }
+
+    @staticmethod
+    def _url(sheet_id):
+        return f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit?usp=sharing"
+
+    def test_meta_is_read_once_for_all_decks(self):
+        """Building the context is the only meta.json read of a sync."""
+        from src import student_manager
+
+        with patch.object(student_manager, "get_meta", return_value=self.META) as get_meta:
+            context = student_manager.StudentSyncContext.from_meta()
+            first = context.get_selected_students(self._url("deck1"))
+            second = context.get_selected_students(self._url("deck2"))
+            context.get_selected_students(self._url("deck1"))
+
+        get_meta.assert_called_once()
+        assert first == {"Mary", "[MISSING_STUDENT]"}
+        assert second == {"John", "Mary", "[MISSING_STUDENT]"}
+        assert context.effective_students == {"John", "Mary", "[MISSING_STUDENT]"}
+
+    def test_returned_selection_is_a_copy(self):
+        """Callers cannot change the resolved selection of a deck."""
+        from src.student_manager import StudentSyncContext
+
+        context = StudentSyncContext.from_meta(self.META)
+        context.get_selected_students(self._url("deck1")).add("Peter")
+
+        assert "Peter" not in context.get_selected_students(self._url("deck1"))
+
+    def test_matches_get_selected_students_for_deck(self):
+        """The standalone helper resolves through the same context."""
+        from src import student_manager
+
+        with patch.object(student_manager, "get_meta", return_value=self.META):
+            selected = student_manager.get_selected_students_for_deck(self._url("deck1"))
+
+        assert selected == {"Mary", "[MISSING_STUDENT]"}
+
+
+# =============================================================================
+# STUDENT DISCOVERY TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestExtractStudentsFromTsv:
+    """Discovery parses only the STUDENTS column of the TSV export."""
+
+    TSV = (
+        "ID\tQUESTION\tANSWER\tSTUDENTS\n"
+        "Q001\t\"Multi\nline\tquestion\"\tA\tJohn, Mary\n"
+        "Q002\tWhat?\tB\tJoão,, Mary \n"
+        "Q003\tWhat?\tC\t\n"
+        "Q004\tShort row\n"
+    )
+
+    def test_students_are_collected(self):
+        """Comma-separated names are split and stripped; blank cells are skipped."""
+        from src.student_manager import extract_students_from_tsv_chunks
+
+        students = extract_students_from_tsv_chunks([self.TSV.encode("utf-8")])
+
+        assert students == {"John", "Mary", "João"}
+
+    def test_chunk_boundaries_do_not_matter(self):
+        """Multi-byte characters split across chunks are decoded correctly."""
+        from src.student_manager import extract_students_from_tsv_chunks
+
+        body = self.TSV.encode("utf-8")
+        chunks = [body[i:i + 3] for i in range(0, len(body), 3)]
+
+        assert extract_students_from_tsv_chunks(chunks) == {"John", "Mary", "João"}
+
+    def test_missing_students_column(self):
+        """A sheet without STUDENTS column has no students."""
+        from src.student_manager import extract_students_from_tsv_chunks
+
+        assert extract_students_from_tsv_chunks([b"ID\tQUESTION\nQ1\tWhat?\n"]) == set()
+
 if __name__ == "__main__":
     pytest.main([__file__])
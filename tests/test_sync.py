@@ -0,0 +1,237 @@
+"""
+Tests for the sync.py module.
+
+Tests functionalities for:
+- Parallel deck prefetch stage
+- Background sync runner (signals and cancellation)
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+# =============================================================================
+# PREFETCH STAGE TESTS
+# =============================================================================
+
+
+class _RecordingSignal:
+    """Minimal stand-in for a Qt signal: records emissions and calls slots directly."""
+
+    def __init__(self):
+        self.emitted = []
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        self.emitted.append(args)
+        for slot in self.slots:
+            slot(*args)
+
+
+class _RecordingSignals:
+    """Stand-in for SyncRunnerSignals (Qt is mocked in the test environment)."""
+
+    def __init__(self):
+        self.deck_prefetched = _RecordingSignal()
+        self.finished = _RecordingSignal()
+
+
+def _remote_decks(count):
+    return {
+        f"deck{i}": {
+            "remote_deck_url": f"https://docs.google.com/spreadsheets/d/deck{i}/edit",
+            "local_deck_name": f"Sheets2Anki::Deck {i}",
+        }
+        for i in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestPrefetchRemoteDecks:
+    """Tests for the bounded parallel download stage."""
+
+    def test_downloads_run_in_parallel_and_bounded(self):
+        """Decks are fetched concurrently, never above the worker limit."""
+        from src import sync
+
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0}
+
+        def slow_prefetch(deck_key, url, students, process_images):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            time.sleep(0.2)
+            with lock:
+                state["running"] -= 1
+            return sync.DeckPrefetchResult(deck_key=deck_key, remote_name=deck_key)
+
+        remote_decks = _remote_decks(12)
+        status_msgs = []
+
+        with patch.object(sync, "_prefetch_deck", side_effect=slow_prefetch), \
+             patch.object(sync, "SyncRunnerSignals", _RecordingSignals), \
+             patch.object(sync, "get_selected_students_for_deck", return_value={"John"}), \
+             patch("src.config_manager.get_image_processor_enabled", return_value=False):
+            start = time.monotonic()
+            results = sync._prefetch_remote_decks(
+                remote_decks, list(remote_decks), Mock(), status_msgs
+            )
+            elapsed = time.monotonic() - start
+
+        assert set(results) == set(remote_decks)
+        assert all(results[key].remote_name == key for key in remote_decks)
+        assert state["max_running"] == sync.PREFETCH_MAX_WORKERS
+        # 12 decks x 0.2 s sequentially would take 2.4 s
+        assert elapsed < 1.5
+        assert sum("Downloaded" in msg for msg in status_msgs) == 12
+
+    def test_errors_are_reported_per_deck(self):
+        """A failing download does not abort the other decks."""
+        from src import sync
+
+        def prefetch(deck_key, url, students, process_images):
+            if deck_key == "deck1":
+                return sync.DeckPrefetchResult(deck_key=deck_key, error=ValueError("HTTP Error 404"))
+            return sync.DeckPrefetchResult(deck_key=deck_key)
+
+        remote_decks = _remote_decks(3)
+        status_msgs = []
+
+        with patch.object(sync, "_prefetch_deck", side_effect=prefetch), \
+             patch.object(sync, "SyncRunnerSignals", _RecordingSignals), \
+             patch.object(sync, "get_selected_students_for_deck", return_value=set()), \
+             patch("src.config_manager.get_image_processor_enabled", return_value=False):
+            results = sync._prefetch_remote_decks(
+                remote_decks, list(remote_decks), Mock(), status_msgs
+            )
+
+        assert isinstance(results["deck1"].error, ValueError)
+        assert results["deck0"].error is None
+        assert any("Deck 1: Download failed" in msg for msg in status_msgs)
+
+    def test_student_context_resolves_selection(self):
+        """With a sync context, the configuration is not read again per deck."""
+        from src import sync
+        from src.student_manager import StudentSyncContext
+
+        remote_decks = _remote_decks(3)
+        context = StudentSyncContext(enabled_students={"John"}, sync_missing_students=False)
+        received = []
+
+        def prefetch(deck_key, url, students, process_images):
+            received.append(students)
+            return sync.DeckPrefetchResult(deck_key=deck_key)
+
+        with patch.object(sync, "_prefetch_deck", side_effect=prefetch), \
+             patch.object(sync, "SyncRunnerSignals", _RecordingSignals), \
+             patch.object(sync, "get_selected_students_for_deck") as selected_mock, \
+             patch("src.config_manager.get_image_processor_enabled", return_value=False):
+            sync._prefetch_remote_decks(
+                remote_decks, list(remote_decks), Mock(), [], context
+            )
+
+        selected_mock.assert_not_called()
+        assert received == [{"John"}] * 3
+
+    def test_prefetch_deck_captures_errors(self):
+        """Worker exceptions are returned instead of raised."""
+        from src import sync
+
+        with patch.object(sync, "fetch_tsv_response", side_effect=ValueError("DNS Error")):
+            result = sync._prefetch_deck(
+                "deck0",
+                "https://docs.google.com/spreadsheets/d/deck0/edit",
+                {"John"},
+                False,
+            )
+
+        assert isinstance(result.error, ValueError)
+        assert result.remote_deck is None
+
+    def test_prefetch_deck_does_not_write_meta(self):
+        """The spreadsheet title is returned for the main thread to cache."""
+        from src import sync
+        from src.deck_manager import DeckNameManager
+
+        response = Mock(unchanged=False, headers={})
+        with patch.object(sync, "fetch_tsv_response", return_value=response), \
+             patch.object(sync, "getRemoteDeck", return_value=Mock()), \
+             patch.object(DeckNameManager, "_extract_spreadsheet_title", return_value="Biology"), \
+             patch("src.config_manager.get_cached_spreadsheet_title", return_value=None), \
+             patch("src.config_manager.save_cached_spreadsheet_title") as save_title, \
+             patch("src.config_manager.save_meta") as save_meta:
+            result = sync._prefetch_deck(
+                "deck0",
+                "https://docs.google.com/spreadsheets/d/deck0/edit",
+                {"John"},
+                False,
+            )
+
+        assert result.error is None
+        assert result.remote_name == "Biology"
+        assert result.spreadsheet_title == "Biology"
+        save_title.assert_not_called()
+        save_meta.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSyncRunner:
+    """Tests for the background download/parse runner."""
+
+    def test_reports_each_deck_and_finishes(self):
+        """Every deck is reported once, followed by a single finished signal."""
+        from src import sync
+
+        def prefetch(deck_key, url, students, process_images):
+            return sync.DeckPrefetchResult(deck_key=deck_key)
+
+        jobs = [(f"deck{i}", f"url{i}", set(), False) for i in range(5)]
+        with patch.object(sync, "SyncRunnerSignals", _RecordingSignals):
+            runner = sync.SyncRunner(jobs, max_workers=2)
+
+        with patch.object(sync, "_prefetch_deck", side_effect=prefetch):
+            runner.start()
+            results = runner.wait()
+
+        assert set(results) == {job[0] for job in jobs}
+        reported = {args[0].deck_key for args in runner.signals.deck_prefetched.emitted}
+        assert reported == set(results)
+        assert len(runner.signals.finished.emitted) == 1
+
+    def test_cancel_skips_remaining_decks(self):
+        """Decks not yet started are dropped after cancellation."""
+        from src import sync
+
+        started = []
+        first_started = threading.Event()
+        release = threading.Event()
+
+        def prefetch(deck_key, url, students, process_images):
+            started.append(deck_key)
+            first_started.set()
+            release.wait(timeout=5)
+            return sync.DeckPrefetchResult(deck_key=deck_key)
+
+        jobs = [(f"deck{i}", f"url{i}", set(), False) for i in range(6)]
+        with patch.object(sync, "SyncRunnerSignals", _RecordingSignals):
+            runner = sync.SyncRunner(jobs, max_workers=1)
+
+        with patch.object(sync, "_prefetch_deck", side_effect=prefetch):
+            runner.start()
+            assert first_started.wait(timeout=5)
+            runner.cancel()
+            release.set()
+            results = runner.wait()
+
+        assert runner.is_canceled()
+        assert started == ["deck0"]
+        assert len(results) == 1
+        assert runner.signals.deck_prefetched.emitted == []
+        assert len(runner.signals.finished.emitted) == 1
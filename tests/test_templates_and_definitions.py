@@ -0,0 +1,255 @@
+"""
+Tests for the templates_and_definitions.py module.
+
+Tests functionalities for:
+- Compiled card template cache
+- Note type template stamps
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+# =============================================================================
+# CARD TEMPLATE CACHE TESTS
+# =============================================================================
+
+
+AI_CONFIG = {
+    "enabled": True,
+    "mobile_enabled": True,
+    "service": "gemini",
+    "model": "gemini-pro",
+    "api_key": "key-1",
+    "prompt": "Explain",
+    "prompt_ask": "Ask",
+    "prompt_checker": "Check",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_template_cache():
+    from src import templates_and_definitions
+
+    templates_and_definitions.clear_card_template_cache()
+    yield
+    templates_and_definitions.clear_card_template_cache()
+
+
+@pytest.fixture
+def template_stamps():
+    """Replaces the meta.json template stamps with an in-memory dict."""
+    stamps_by_collection = {}
+
+    def save(new_stamps, collection_key):
+        stamps_by_collection[collection_key] = dict(new_stamps)
+
+    with patch(
+        "src.config_manager.get_template_stamps",
+        side_effect=lambda collection_key: dict(stamps_by_collection.get(collection_key, {})),
+    ), \
+         patch("src.config_manager.save_template_stamps", side_effect=save), \
+         patch.dict(sys.modules, {"anki.models": Mock(NotetypeId=int)}):
+        yield stamps_by_collection
+
+
+def _model(model_id, name, is_cloze=False):
+    return {
+        "id": model_id,
+        "name": name,
+        "type": 1 if is_cloze else 0,
+        "mod": 1000,
+        "flds": [],
+        "tmpls": [{"qfmt": "", "afmt": ""}],
+    }
+
+
+def _collection(models, path="/profiles/User 1/collection.anki2"):
+    """Collection mock exposing the given note type dicts; saving bumps "mod"."""
+    col = MagicMock()
+    col.path = path
+    col.models.all_names_and_ids.side_effect = lambda: [
+        SimpleNamespace(id=model["id"], name=model["name"]) for model in models
+    ]
+    col.models.get.side_effect = lambda model_id: next(
+        (model for model in models if model["id"] == model_id), None
+    )
+
+    def save(model):
+        model["mod"] += 1
+
+    col.models.save.side_effect = save
+    col.db.all.side_effect = lambda sql: [
+        (model["id"], model["mod"]) for model in models if "from notetypes" in sql
+    ]
+    return col
+
+
+def _stamps(template_stamps, col):
+    """Stamps stored for the collection."""
+    from src.templates_and_definitions import get_collection_stamp_key
+
+    return template_stamps.get(get_collection_stamp_key(col), {})
+
+
+@pytest.mark.unit
+class TestCardTemplateCache:
+    """Card templates are compiled once per template key."""
+
+    def test_same_key_compiles_once(self):
+        """Repeated calls with the same settings reuse the compiled strings."""
+        from src import templates_and_definitions as tad
+
+        with patch.object(tad, "_build_card_template", wraps=tad._build_card_template) as build:
+            first = tad.create_card_template(True, "hidden", False)
+            second = tad.create_card_template(True, "hidden", False)
+            reverse = tad.create_card_template(False, "hidden", False, is_reverse=True)
+
+        assert first == second
+        assert reverse != first
+        assert build.call_count == 2
+
+    def test_returned_template_is_a_copy(self):
+        """Callers cannot corrupt the cached template."""
+        from src import templates_and_definitions as tad
+
+        template = tad.create_card_template(False, "top_middle", False)
+        template["qfmt"] = "changed"
+
+        assert tad.create_card_template(False, "top_middle", False)["qfmt"] != "changed"
+
+    def test_ai_config_changes_key(self):
+        """Settings embedded in the mobile AI script are part of the key."""
+        from src import templates_and_definitions as tad
+
+        desktop = tad.get_card_template_key(False, False, "hidden", True, None)
+        mobile = tad.get_card_template_key(False, False, "hidden", True, AI_CONFIG)
+        other_key = tad.get_card_template_key(
+            False, False, "hidden", True, dict(AI_CONFIG, api_key="key-2")
+        )
+
+        assert desktop[3] == "desktop"
+        assert mobile != other_key
+        assert tad.get_card_template_key(False, False, "hidden", False, AI_CONFIG)[3] == "off"
+
+    def test_update_templates_reads_settings_once(self, template_stamps):
+        """Updating many note types reads meta.json once and compiles each kind once."""
+        from src import templates_and_definitions as tad
+
+        col = _collection(
+            [_model(i, f"Sheets2Anki - Deck{i} - John - Basic") for i in range(10)]
+            + [_model(10 + i, f"Sheets2Anki - Deck{i} - John - Cloze", True) for i in range(10)]
+        )
+
+        with patch.object(
+            tad, "get_card_template_settings", return_value=("between_sections", False, None)
+        ) as settings, \
+             patch.object(tad, "_build_card_template", wraps=tad._build_card_template) as build:
+            updated = tad.update_existing_note_type_templates(col)
+
+        assert updated == 20
+        settings.assert_called_once()
+        # Basic, Cloze and Reverse for the signature; nothing more for the models
+        assert build.call_count == 3
+
+
+@pytest.mark.unit
+class TestTemplateStamps:
+    """Note types stamped with the current templates are not revisited."""
+
+    SETTINGS = ("hidden", False, None)
+
+    def _update(self, col):
+        from src import templates_and_definitions as tad
+
+        with patch.object(tad, "get_card_template_settings", return_value=self.SETTINGS):
+            return tad.update_existing_note_type_templates(col)
+
+    def test_unchanged_collection_is_skipped(self, template_stamps):
+        """The second pass loads no note type at all."""
+        col = _collection(
+            [_model(i, f"Sheets2Anki - Deck - Student{i} - Basic") for i in range(30)]
+            + [_model(100, "Basic")]
+        )
+
+        assert self._update(col) == 30
+        assert set(_stamps(template_stamps, col)) == {str(i) for i in range(30)}
+
+        col.models.get.reset_mock()
+        col.models.save.reset_mock()
+        assert self._update(col) == 0
+        col.models.get.assert_not_called()
+        col.models.save.assert_not_called()
+
+    def test_settings_change_invalidates_stamps(self, template_stamps):
+        """A different timer position makes every note type stale again."""
+        col = _collection([_model(1, "Sheets2Anki - Deck - John - Basic")])
+
+        assert self._update(col) == 1
+        self.SETTINGS = ("top_middle", False, None)
+        assert self._update(col) == 1
+
+    def test_only_unstamped_note_types_are_loaded(self, template_stamps):
+        """New note types are updated without touching stamped ones."""
+        models = [_model(1, "Sheets2Anki - Deck - John - Basic")]
+        col = _collection(models)
+        self._update(col)
+
+        models.append(_model(2, "Sheets2Anki - Deck - Mary - Basic"))
+        col.models.get.reset_mock()
+        assert self._update(col) == 1
+        assert [call.args[0] for call in col.models.get.call_args_list] == [2]
+
+    def test_removed_note_types_are_pruned(self, template_stamps):
+        """Stamps of deleted note types are dropped."""
+        models = [
+            _model(1, "Sheets2Anki - Deck - John - Basic"),
+            _model(2, "Sheets2Anki - Deck - Mary - Basic"),
+        ]
+        col = _collection(models)
+        self._update(col)
+
+        del models[1]
+        self._update(col)
+
+        assert set(_stamps(template_stamps, col)) == {"1"}
+
+    def test_edited_note_type_is_repaired(self, template_stamps):
+        """A note type modified outside the addon is checked again."""
+        models = [
+            _model(1, "Sheets2Anki - Deck - John - Basic"),
+            _model(2, "Sheets2Anki - Deck - Mary - Basic"),
+        ]
+        col = _collection(models)
+        self._update(col)
+
+        # User edit (or a sync from another device) on note type 2
+        models[1]["tmpls"][0]["qfmt"] = "edited"
+        models[1]["mod"] += 100
+        col.models.get.reset_mock()
+
+        assert self._update(col) == 1
+        assert [call.args[0] for call in col.models.get.call_args_list] == [2]
+        assert models[1]["tmpls"][0]["qfmt"] != "edited"
+        assert self._update(col) == 0
+
+    def test_profiles_keep_their_own_stamps(self, template_stamps):
+        """Switching profiles neither prunes nor invalidates the other profile's stamps."""
+        first = _collection([_model(1, "Sheets2Anki - Deck - John - Basic")])
+        second = _collection(
+            [_model(7, "Sheets2Anki - Deck - Mary - Basic")],
+            path="/profiles/User 2/collection.anki2",
+        )
+
+        assert self._update(first) == 1
+        assert self._update(second) == 1
+
+        first.models.get.reset_mock()
+        assert self._update(first) == 0
+        first.models.get.assert_not_called()
+        assert set(_stamps(template_stamps, first)) == {"1"}
+        assert set(_stamps(template_stamps, second)) == {"7"}
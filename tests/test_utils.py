@@ -724,5 +724,129 @@ class TestGetPublicationKeyHash:
         assert len(hash_result) == 8
 
 
+
+@pytest.mark.unit
+class TestHierarchyNormalization:
+    """Tests for the memoized tag and subdeck derivation."""
+
+    FIELDS = {
+        "IMPORTANCE": "High",
+        "TOPIC": "Geography: Capitals",
+        "SUBTOPIC": "South  America",
+        "CONCEPT": "Brasília (DF)",
+    }
+
+    def test_tags_and_subdeck_path(self):
+        """One call returns the hierarchy tags and the subdeck path."""
+        from src.utils import get_hierarchy_names
+
+        names = get_hierarchy_names(self.FIELDS)
+
+        assert names.topics_tag == "sheets2anki::topics::geography__capitals::south__america::brasília_df"
+        assert names.concept_tag == "sheets2anki::concepts::brasília_df"
+        assert names.importance_tag == "sheets2anki::importance::high"
+        assert names.subdeck_path == "High::Geography_ Capitals::South America::Brasília (DF)"
+
+    def test_defaults_for_missing_values(self):
+        """Empty or fully invalid values fall back to the placeholders."""
+        from src.utils import get_subdeck_name
+
+        assert get_subdeck_name("Sheets2Anki::Deck", {"TOPIC": "???"}, student="John") == (
+            "Sheets2Anki::Deck::John::[MISSING_IMPORTANCE]::[MISSING_TOPIC]"
+            "::[MISSING_SUBTOPIC]::[MISSING_CONCEPT]"
+        )
+
+    def test_results_are_memoized(self):
+        """Repeated hierarchy values are normalized only once."""
+        from src import utils
+
+        utils.normalize_hierarchy.cache_clear()
+
+        for _ in range(100):
+            utils.get_subdeck_name("Deck", self.FIELDS)
+            utils.get_hierarchy_names(dict(self.FIELDS))
+
+        info = utils.normalize_hierarchy.cache_info()
+        assert info.misses == 1
+        assert info.hits == 199
+
+
+@pytest.mark.unit
+class TestDebugManager:
+    """Tests for the cached debug flag and the buffered log writer."""
+
+    @pytest.fixture
+    def meta_listeners(self):
+        from src import config_manager
+
+        with patch.object(config_manager, "_meta_listeners", []) as listeners:
+            yield listeners
+
+    def test_disabled_logging_does_not_read_meta(self, meta_listeners):
+        """With debug off, meta.json is consulted once, not per message."""
+        from src.utils import DebugManager
+
+        with patch("src.config_manager.get_meta", return_value={"config": {"debug": False}}) as get_meta:
+            manager = DebugManager()
+            for i in range(1000):
+                manager.add_message(f"message {i}")
+
+        assert get_meta.call_count == 1
+        assert manager.get_messages() == []
+
+    def test_flag_follows_meta_changes(self, meta_listeners):
+        """Saving or reloading meta.json updates the cached flag."""
+        from src import config_manager
+        from src.utils import DebugManager
+
+        with patch("src.config_manager.get_meta", return_value={"config": {"debug": False}}):
+            manager = DebugManager()
+            manager.add_message("hidden")
+
+        with patch.object(manager, "_save_to_file"), patch("builtins.print"):
+            config_manager._notify_meta_listeners({"config": {"debug": True}})
+            manager.add_message("shown")
+
+        assert manager.is_debug_enabled
+        assert len(manager.get_messages()) == 1
+        assert "shown" in manager.get_messages()[0]
+
+    def test_log_lines_are_written_in_batches(self, tmp_path):
+        """Lines are queued and written together by flush()."""
+        from src.utils import BufferedLogWriter
+
+        log_path = tmp_path / "debug.log"
+        writer = BufferedLogWriter(lambda: str(log_path))
+        writer.FLUSH_INTERVAL_SECONDS = 60
+
+        for i in range(100):
+            writer.write(f"line {i}")
+
+        assert not log_path.exists()
+
+        writer.flush()
+
+        assert log_path.read_text(encoding="utf-8").splitlines() == [
+            f"line {i}" for i in range(100)
+        ]
+
+    def test_background_thread_flushes(self, tmp_path):
+        """Queued lines reach the file without an explicit flush."""
+        import time
+
+        from src.utils import BufferedLogWriter
+
+        log_path = tmp_path / "debug.log"
+        writer = BufferedLogWriter(lambda: str(log_path))
+        writer.FLUSH_INTERVAL_SECONDS = 0.05
+
+        writer.write("background")
+
+        deadline = time.monotonic() + 5
+        while not log_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert log_path.read_text(encoding="utf-8") == "background\n"
+
 if __name__ == "__main__":
     pytest.main([__file__])